@@ -1,7 +1,37 @@
+import hashlib
 import json
 import logging
-from flask import request
-from typing import Callable, Optional, Union
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dash import callback_context
+from dash.development.base_component import Component
+from flask import g, has_request_context, request
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Tuple,
+    Union,
+)
+
+from .catalog import TranslationCatalog, is_catalog, write_catalog
+from .message_format import MessageFormatter, get_plural_rule
+from .usage import UsageRecorder
+
+try:
+    from dash.exceptions import MissingCallbackContextException
+except ImportError:
+    MissingCallbackContextException = LookupError
 
 
 __all__ = ['Translator']
@@ -9,6 +39,50 @@ __all__ = ['Translator']
 
 logger = logging.getLogger('i18n')
 
+# 标记未编译的(主题, 源语种, 目标语种)组合
+_UNCOMPILED = object()
+
+# 浏览器端文案转换函数模板，已加载的文案包存放于window.dashI18nBundles
+_CLIENTSIDE_TRANSLATE_FUNCTION = """function (locale) {
+    var contents = %(contents)s;
+    var topic = %(topic)s;
+    var bundleUrls = %(bundle_urls)s;
+    if (!locale) {
+        var match = document.cookie.match(%(cookie_pattern)s);
+        locale = match ? decodeURIComponent(match[1]) : %(root_locale)s;
+    }
+    var translate = function (bundle) {
+        var table = (bundle || {})[topic] || {};
+        var results = contents.map(function (content) {
+            var text = Object.prototype.hasOwnProperty.call(table, content)
+                ? table[content]
+                : null;
+            if (text === null) {
+                return content;
+            }
+            return typeof text === 'string' ? text : text.other;
+        });
+        return %(single)s ? results[0] : results;
+    };
+    var bundles = (window.dashI18nBundles = window.dashI18nBundles || {});
+    if (bundles[locale] || !bundleUrls || !bundleUrls[locale]) {
+        return translate(bundles[locale]);
+    }
+    return fetch(bundleUrls[locale])
+        .then(function (response) {
+            return response.json();
+        })
+        .then(function (bundle) {
+            bundles[locale] = bundle;
+            return translate(bundle);
+        });
+}"""
+
+# 手动指定的当前语种，Translator实例id -> 语种，作用范围限定于当前上下文
+_locale_overrides: ContextVar[dict] = ContextVar(
+    'dash_i18n_locale_overrides', default={}
+)
+
 
 class Translator:
     """实现文案内容的快捷国际化相关操作"""
@@ -21,6 +95,14 @@ class Translator:
         cookie_name: str = 'dash-i18n',
         get_current_locale: Optional[Callable] = None,
         force_check_content_translator: bool = True,
+        cache_current_locale: bool = True,
+        auto_reload_interval: Union[int, float, None] = None,
+        lazy_load_topics: bool = False,
+        max_loaded_topics: Optional[int] = None,
+        fallback_locales: Optional[Dict[str, List[str]]] = None,
+        usage_sample_rate: Union[float, None] = None,
+        max_missing_translations: int = 1000,
+        max_usage_keys: int = 10000,
     ) -> None:
         """
         初始化 Translator 实例
@@ -32,10 +114,51 @@ class Translator:
             cookie_name (str)：存储当前语言环境类型的 cookie 名称 Defaults to 'dash-i18n'
             get_current_locale (Optional[Callable]): 自定义函数或方法，返回值表示当前语言环境类型
             force_check_content_translator (bool, optional): 是否针对文案翻译内容存在性进行检查
+            cache_current_locale (bool, optional): 是否在单次请求内缓存首次确定的当前语种 Defaults to True
+            auto_reload_interval (Union[int, float, None], optional): 自动检查本地化配置文件更新的最小时间间隔（秒），
+                设置后将在文案转换时按此间隔检查配置文件修改时间，并重建发生变化的主题，为None时不自动检查 Defaults to None
+            lazy_load_topics (bool, optional): 是否按需加载各主题，开启后初始化时仅记录各配置文件的主题、语种信息，
+                各主题的文案映射字典及查找表在首次使用时才构建 Defaults to False
+            max_loaded_topics (Optional[int], optional): 按需加载模式下最多同时保留的主题数量，超出时淘汰最久未使用的主题，
+                为None时不限制 Defaults to None
+            fallback_locales (Optional[Dict[str, List[str]]], optional): 各目标语种缺失翻译内容时依次尝试的后备语种，
+                如{'zh-tw': ['zh-cn', 'en-us']}，后备结果在构建查找表时预先确定，可在后备语种中列出根语种以回退至根语种文案 Defaults to None
+            usage_sample_rate (Union[float, None], optional): 文案使用情况统计的采样比例，如0.01表示各线程每100次文案转换记录1次，
+                统计结果可通过get_usage_stats()、export_usage_metrics()获取，为None时不统计 Defaults to None
+            max_missing_translations (int, optional): 未强制检查时missing_translations最多保留的缺失情况数量，
+                超出时淘汰最久未出现的缺失情况，并累加至missing_translations_overflow Defaults to 1000
+            max_usage_keys (int, optional): 文案使用情况统计中各存活线程、以及已结束线程的汇总结果分别最多记录的
+                (主题, 文案, 当前语种, 是否命中)组合数量，超出后新组合的调用次数计入get_usage_stats_overflow() Defaults to 10000
         Returns:
             None
         """
 
+        self._reload_lock = threading.RLock()
+        self.auto_reload_interval = auto_reload_interval
+        self._next_reload_check = time.monotonic() + (auto_reload_interval or 0)
+        self.lazy_load_topics = lazy_load_topics
+        self.max_loaded_topics = max_loaded_topics
+        self.fallback_locales = fallback_locales or {}
+        # 文案模板 -> 预先拆分的模板
+        self._formatters: Dict[str, MessageFormatter] = {}
+        # 语种 -> 复数类别选择函数
+        self._plural_rules: Dict[str, Callable[[Any], str]] = {}
+        # 未强制检查时缺失翻译内容的文案计数，(主题, 源语种, 目标语种, 文案) -> 次数，
+        # 按最近出现顺序排列，动态拼接的文案不会使其无限增长
+        self.max_missing_translations = max_missing_translations
+        self.missing_translations: Dict[Tuple[str, str, str, str], int] = (
+            OrderedDict()
+        )
+        # 因超出max_missing_translations而被淘汰的缺失情况数量
+        self.missing_translations_overflow = 0
+        self._missing_lock = threading.Lock()
+        # 文案使用情况计数器，未开启统计时为None
+        self._usage = (
+            None
+            if usage_sample_rate is None
+            else UsageRecorder(usage_sample_rate, max_usage_keys)
+        )
+
         # 重建国际化配置参数，并获取根语种
         root_locale_from_json = self.rebuild_transilations(
             translations=translations,
@@ -44,26 +167,100 @@ class Translator:
         self.root_locale = root_locale or root_locale_from_json
         self.cookie_name = cookie_name
         if get_current_locale is None:
-            self.get_current_locale = lambda: (
-                request.cookies.get(self.cookie_name) or self.root_locale
-            )
+            self.get_current_locale = self.__get_cookie_locale
         else:
             self.get_current_locale = get_current_locale
         self.forced_check_content_translator = force_check_content_translator
+        self.cache_current_locale = cache_current_locale
+
+    def __get_cookie_locale(self) -> str:
+        """
+        默认的当前语种获取方式，读取cookie_name对应的cookie，
+        后台回调中不存在请求上下文，改为读取Dash随任务传递的回调上下文cookies，均不可用时使用根语种
+
+        Returns:
+            str: 当前语种
+        """
+
+        if has_request_context():
+            locale = request.cookies.get(self.cookie_name)
+        else:
+            try:
+                locale = callback_context.cookies.get(self.cookie_name)
+            except (MissingCallbackContextException, AttributeError):
+                locale = None
+        return locale or self.root_locale
+
+    @contextmanager
+    def use_locale(self, locale: str) -> Iterator[None]:
+        """
+        在上下文范围内手动指定当前语种，优先级高于get_current_locale及请求内的语种缓存，
+        可用于后台回调等不存在请求上下文的场景
+
+        Args:
+            locale (str): 手动指定的当前语种
+        """
+
+        token = _locale_overrides.set(
+            {**_locale_overrides.get(), id(self): locale}
+        )
+        try:
+            yield
+        finally:
+            _locale_overrides.reset(token)
+
+    def resolve_current_locale(self) -> Union[str, None]:
+        """
+        确定当前语种，依次考虑手动指定的语种、当前请求内已缓存的语种，最后调用get_current_locale，
+        单次请求内get_current_locale仅会被调用一次
+
+        Returns:
+            Union[str, None]: 当前语种
+        """
+
+        overrides = _locale_overrides.get()
+        if overrides:
+            locale = overrides.get(id(self))
+            if locale is not None:
+                return locale
+
+        if not self.cache_current_locale:
+            return self.get_current_locale()
+
+        if not has_request_context():
+            return self.get_current_locale()
+
+        # flask.g随请求创建及销毁，先取出代理背后的对象，避免每次属性访问都经过代理，
+        # Translator实例id -> 语种
+        request_globals = g._get_current_object()
+        cached_locales = getattr(request_globals, '_dash_i18n_locales', None)
+        if cached_locales is None:
+            cached_locales = request_globals._dash_i18n_locales = {}
+
+        try:
+            return cached_locales[id(self)]
+        except KeyError:
+            locale = cached_locales[id(self)] = self.get_current_locale()
+            return locale
 
     def t(
         self,
         input_content: str,
         source_locale: Union[str, None] = None,
         locale_topic: str = '_default',
+        count: Union[int, float, None] = None,
+        **params: Any,
     ) -> str:
         """
-        文案内容国际化转换
+        文案内容国际化转换，可传入参数渲染文案中形如'{name}'的占位符，
+        目标文案为{复数类别: 文案}形式的复数文案时，按count及当前语种的CLDR复数规则选择对应文案
 
         Args:
             input_content (str): 转换前文案内容
             source_locale (Union[str, None], optional): 手动控制源语种 Defaults to None
             locale_topic (str, optional): 手动控制目标语种主题 Defaults to '_default'
+            count (Union[int, float, None], optional): 用于选择复数文案的数量，同时作为占位符{count}的参数 Defaults to None
+            **params (Any): 其他占位符参数
 
         Returns:
             str: 转换结果
@@ -72,52 +269,490 @@ class Translator:
         # 确定本次翻译提取的源语种
         source_locale = source_locale or self.root_locale
 
-        current_locale = self.get_current_locale()
+        current_locale = self.resolve_current_locale()
 
-        assert current_locale is not None, (
-            '未从cookie中检测到当前语种 %s' % current_locale
+        if self.auto_reload_interval is not None:
+            self.__check_reload()
+
+        # 合法的(主题, 源语种, 目标语种)组合均已预先编译，一次查找即可同时完成校验
+        compiled_translations = self.compiled_translations.get(
+            (locale_topic, source_locale, current_locale), _UNCOMPILED
         )
-        assert current_locale in self.available_locales, (
-            '检测到的当前语种不在配置信息中 %s' % current_locale
+        if compiled_translations is _UNCOMPILED:
+            compiled_translations = self.__handle_uncompiled(
+                input_content, source_locale, current_locale, locale_topic
+            )
+        elif self._topic_usage is not None:
+            self.__touch_topic(locale_topic)
+
+        # 源语种与目标语种相同时无需翻译
+        if compiled_translations is None:
+            match_content = input_content
+        else:
+            match_content = compiled_translations.get(input_content)
+            # 源语种与目标语种相同时查找表仅包含复数文案，其余文案无需翻译
+            if match_content is None and source_locale == current_locale:
+                match_content = input_content
+
+        if self._usage is not None:
+            self._usage.record(
+                locale_topic,
+                input_content,
+                current_locale,
+                match_content is not None,
+            )
+
+        if match_content is None:
+            match_content = self.__handle_missing(
+                input_content, source_locale, current_locale, locale_topic
+            )
+
+        if count is None and not params and type(match_content) is str:
+            return match_content
+        return self.render_message(
+            match_content, current_locale, count, **params
         )
-        assert locale_topic in self.available_topics, (
-            '检测到的目标语种主题不在配置信息中 %s' % locale_topic
+
+    def render_message(
+        self,
+        message: Union[str, dict],
+        locale: Union[str, None] = None,
+        count: Union[int, float, None] = None,
+        **params: Any,
+    ) -> str:
+        """
+        渲染文案模板，各模板仅在首次渲染时拆分，其后渲染仅需拼接预先拆分的片段
+
+        Args:
+            message (Union[str, dict]): 文案模板，或{复数类别: 文案模板}形式的复数文案，
+                复数文案中形如'=0'的键表示数量精确匹配，优先于复数类别
+            locale (Union[str, None], optional): 用于选择复数类别的语种 Defaults to None
+            count (Union[int, float, None], optional): 用于选择复数文案的数量，同时作为占位符{count}的参数 Defaults to None
+            **params (Any): 其他占位符参数
+
+        Returns:
+            str: 渲染结果
+        """
+
+        assert not isinstance(count, bool), 'count需为数值，不支持布尔值'
+
+        if type(message) is not str:
+            plural_forms = message
+            message = None
+            if count is not None:
+                message = plural_forms.get('=%s' % count)
+                if message is None:
+                    plural_rule = self._plural_rules.get(locale)
+                    if plural_rule is None:
+                        plural_rule = self._plural_rules[locale] = (
+                            get_plural_rule(locale)
+                        )
+                    message = plural_forms.get(plural_rule(count))
+            if message is None:
+                message = plural_forms.get('other')
+                assert message is not None, (
+                    '复数文案 %s 缺少other类别' % plural_forms
+                )
+
+        if count is not None:
+            params['count'] = count
+        if not params:
+            return message
+
+        formatter = self._formatters.get(message)
+        if formatter is None:
+            formatter = self._formatters[message] = MessageFormatter(message)
+        return formatter.render(params)
+
+    def t_many(
+        self,
+        input_contents: Iterable[str],
+        source_locale: Union[str, None] = None,
+        locale_topic: str = '_default',
+    ) -> List[str]:
+        """
+        批量文案内容国际化转换，整批文案仅确定并校验一次当前语种
+
+        Args:
+            input_contents (Iterable[str]): 转换前文案内容
+            source_locale (Union[str, None], optional): 手动控制源语种 Defaults to None
+            locale_topic (str, optional): 手动控制目标语种主题 Defaults to '_default'
+
+        Returns:
+            List[str]: 与输入顺序一致的转换结果
+        """
+
+        input_contents = list(input_contents)
+        source_locale = source_locale or self.root_locale
+        current_locale, compiled_translations = (
+            self.__get_compiled_translations(
+                input_contents[0] if input_contents else '',
+                source_locale,
+                locale_topic,
+            )
         )
 
-        # 尝试从已加载的配置信息中的对应主题提取目标文案语种
-        if source_locale != current_locale:
-            assert source_locale in self.translations[locale_topic], (
-                '%s 未从 %s 主题的配置信息中检测到源文案语种'
-                % (input_content, locale_topic)
+        usage = self._usage
+        if compiled_translations is None:
+            if usage is not None:
+                for input_content in input_contents:
+                    usage.record(
+                        locale_topic, input_content, current_locale, True
+                    )
+            return input_contents
+
+        results = []
+        for input_content in input_contents:
+            match_content = compiled_translations.get(input_content)
+            if match_content is None and source_locale == current_locale:
+                match_content = input_content
+            if usage is not None:
+                usage.record(
+                    locale_topic,
+                    input_content,
+                    current_locale,
+                    match_content is not None,
+                )
+            if match_content is None:
+                match_content = self.__handle_missing(
+                    input_content, source_locale, current_locale, locale_topic
+                )
+            elif type(match_content) is not str:
+                match_content = self.render_message(
+                    match_content, current_locale
+                )
+            results.append(match_content)
+        return results
+
+    def translate_component(
+        self,
+        component: Any,
+        props: Iterable[str] = ('title', 'placeholder', 'options[].label'),
+        source_locale: Union[str, None] = None,
+        locale_topic: str = '_default',
+    ) -> Any:
+        """
+        在一次遍历中对Dash组件树中的文本子元素及指定属性进行国际化转换，
+        仅转换配置信息中存在对应翻译内容的文案，其余内容保持不变，转换直接作用于传入的组件树
+
+        Args:
+            component (Any): Dash组件、组件列表或文本
+            props (Iterable[str], optional): 需要转换的属性，可通过'.'访问字典字段、'[]'遍历列表元素，
+                如'options[].label'表示转换options属性中各选项的label字段 Defaults to ('title', 'placeholder', 'options[].label')
+            source_locale (Union[str, None], optional): 手动控制源语种 Defaults to None
+            locale_topic (str, optional): 手动控制目标语种主题 Defaults to '_default'
+
+        Returns:
+            Any: 转换后的组件树
+        """
+
+        current_locale, compiled_translations = (
+            self.__get_compiled_translations(
+                '', source_locale or self.root_locale, locale_topic
             )
+        )
+        if compiled_translations is None:
+            return component
 
-            match_transitions = self.translations[locale_topic][
-                source_locale
-            ].get(input_content)
+        # 预先解析属性路径，如'options[].label' -> ('options', '[]', 'label')
+        prop_paths = {}
+        for prop in props:
+            prop_path = tuple(
+                segment
+                for part in prop.split('.')
+                for segment in (
+                    (part[:-2], '[]') if part.endswith('[]') else (part,)
+                )
+            )
+            prop_paths.setdefault(prop_path[0], []).append(prop_path[1:])
+
+        def translate_value(value: Any, path: tuple = ()) -> Any:
+            """按属性路径转换单个属性值"""
+
+            if not path:
+                if isinstance(value, str):
+                    text = compiled_translations.get(value, value)
+                    if type(text) is not str:
+                        text = self.render_message(text, current_locale)
+                    return text
+                return value
+            if path[0] == '[]':
+                if isinstance(value, list):
+                    return [translate_value(item, path[1:]) for item in value]
+                return value
+            if isinstance(value, dict) and path[0] in value:
+                return {
+                    **value,
+                    path[0]: translate_value(value[path[0]], path[1:]),
+                }
+            return value
 
-            if self.forced_check_content_translator:
-                assert match_transitions is not None, (
-                    '%s 未从配置信息中检测到目标文案语种' % input_content
+        def translate_children(children: Any, stack: list) -> Any:
+            """转换文本子元素，并收集待遍历的子组件"""
+
+            if isinstance(children, str):
+                return translate_value(children)
+            if isinstance(children, Component):
+                stack.append(children)
+            elif isinstance(children, (list, tuple)):
+                stack.extend(
+                    item for item in children if isinstance(item, Component)
                 )
-                assert match_transitions.get(current_locale) is not None, (
-                    '%s 未从配置信息中检测到目标文案语种的翻译内容'
+                if any(isinstance(item, str) for item in children):
+                    return [translate_value(item) for item in children]
+            return children
+
+        stack = []
+        component = translate_children(component, stack)
+        while stack:
+            current = stack.pop()
+            for prop_name in current._prop_names:
+                value = getattr(current, prop_name, None)
+                if value is None:
+                    continue
+
+                if prop_name == 'children':
+                    new_value = translate_children(value, stack)
+                else:
+                    new_value = value
+                    # 其他属性中同样可能嵌套组件
+                    if isinstance(value, Component):
+                        stack.append(value)
+                    elif isinstance(value, (list, tuple)):
+                        stack.extend(
+                            item
+                            for item in value
+                            if isinstance(item, Component)
+                        )
+                for prop_path in prop_paths.get(prop_name, ()):
+                    new_value = translate_value(new_value, prop_path)
+                if new_value is not value:
+                    setattr(current, prop_name, new_value)
+
+        return component
+
+    def __get_compiled_translations(
+        self,
+        input_content: str,
+        source_locale: str,
+        locale_topic: str,
+    ) -> Tuple[Union[str, None], Union[dict, None]]:
+        """
+        确定当前语种并获取对应的预编译查找表，源语种与目标语种相同时查找表为None
+
+        Args:
+            input_content (str): 转换前文案内容，仅用于校验错误信息
+            source_locale (str): 源语种
+            locale_topic (str): 目标语种主题
+
+        Returns:
+            Tuple[Union[str, None], Union[dict, None]]: (当前语种, 源文案 -> 目标文案查找表)
+        """
+
+        current_locale = self.resolve_current_locale()
+
+        if self.auto_reload_interval is not None:
+            self.__check_reload()
+
+        compiled_translations = self.compiled_translations.get(
+            (locale_topic, source_locale, current_locale), _UNCOMPILED
+        )
+        if compiled_translations is _UNCOMPILED:
+            return current_locale, self.__handle_uncompiled(
+                input_content, source_locale, current_locale, locale_topic
+            )
+        if self._topic_usage is not None:
+            self.__touch_topic(locale_topic)
+        return current_locale, compiled_translations
+
+    def __handle_uncompiled(
+        self,
+        input_content: str,
+        source_locale: Union[str, None],
+        current_locale: Union[str, None],
+        locale_topic: str,
+    ) -> Union[dict, None]:
+        """
+        处理未编译的(主题, 源语种, 目标语种)组合，按需加载模式下先尝试加载对应主题
+
+        Args:
+            input_content (str): 转换前文案内容，仅用于校验错误信息
+            source_locale (Union[str, None]): 源语种
+            current_locale (Union[str, None]): 当前语种
+            locale_topic (str): 目标语种主题
+
+        Returns:
+            Union[dict, None]: 源文案 -> 目标文案查找表，无需翻译时返回None
+        """
+
+        if self.__load_topic(locale_topic):
+            compiled_translations = self.compiled_translations.get(
+                (locale_topic, source_locale, current_locale), _UNCOMPILED
+            )
+            if compiled_translations is not _UNCOMPILED:
+                return compiled_translations
+
+        self.__check_locales(
+            input_content, source_locale, current_locale, locale_topic
+        )
+        return None
+
+    def __touch_topic(self, locale_topic: str) -> None:
+        """
+        将主题标记为最近使用
+        """
+
+        try:
+            self._topic_usage.move_to_end(locale_topic)
+        except KeyError:
+            pass
+
+    def __load_topic(self, locale_topic: str) -> bool:
+        """
+        按需加载模式下读取并构建尚未加载的主题，超出max_loaded_topics时淘汰最久未使用的主题，
+        新的查找表构建完成后整体替换
+
+        Args:
+            locale_topic (str): 目标语种主题
+
+        Returns:
+            bool: 主题是否已加载
+        """
+
+        if not self.lazy_load_topics:
+            return False
+
+        with self._reload_lock:
+            if locale_topic in self.translations:
+                return True
+
+            translation = self._topic_files.get(locale_topic)
+            if translation is None:
+                return False
+
+            with open(
+                translation,
+                'r',
+                encoding=self._translations_encoding,
+            ) as f:
+                raw_translation = json.load(f)
+
+            translations = {
+                **self.translations,
+                locale_topic: self.__build_topic_translations(raw_translation),
+            }
+            compiled_translations = {
+                **self.compiled_translations,
+                **self.__compile_topic_translations(
+                    locale_topic,
+                    translations[locale_topic],
+                    self.available_locales,
+                    self.fallback_locales,
+                ),
+            }
+
+            if self._topic_usage is not None:
+                self._topic_usage[locale_topic] = None
+                evicted_topics = set()
+                while len(self._topic_usage) > self.max_loaded_topics:
+                    evicted_topic, _ = self._topic_usage.popitem(last=False)
+                    evicted_topics.add(evicted_topic)
+                    translations.pop(evicted_topic, None)
+                if evicted_topics:
+                    # 源语种与目标语种相同的组合无需加载主题，予以保留
+                    compiled_translations = {
+                        key: value
+                        for key, value in compiled_translations.items()
+                        if key[0] not in evicted_topics or value is None
+                    }
+
+            self.translations = translations
+            self.compiled_translations = compiled_translations
+
+        return True
+
+    def __handle_missing(
+        self,
+        input_content: str,
+        source_locale: str,
+        current_locale: str,
+        locale_topic: str,
+    ) -> str:
+        """
+        处理查找表中缺失翻译内容的文案，未强制检查时每种缺失情况仅记录一次日志，其后仅累加计数
+
+        Args:
+            input_content (str): 转换前文案内容
+            source_locale (str): 源语种
+            current_locale (str): 当前语种
+            locale_topic (str): 目标语种主题
+
+        Returns:
+            str: 未强制检查时返回原文案内容
+        """
+
+        if self.forced_check_content_translator:
+            assert (
+                self.translations.get(locale_topic, {})
+                .get(source_locale, {})
+                .get(input_content)
+                is not None
+            ), '%s 未从配置信息中检测到目标文案语种' % input_content
+            raise AssertionError(
+                '%s 未从配置信息中检测到目标文案语种的翻译内容' % input_content
+            )
+
+        key = (locale_topic, source_locale, current_locale, input_content)
+        with self._missing_lock:
+            count = self.missing_translations.get(key)
+            if count is None:
+                logger.warning(
+                    '%s 未检测到目标文案语种的翻译内容，将使用默认文案内容'
                     % input_content
                 )
-                return match_transitions[current_locale]
-            else:
-                if (
-                    match_transitions is not None
-                    and match_transitions.get(current_locale) is not None
+                count = 0
+                while (
+                    len(self.missing_translations)
+                    >= self.max_missing_translations
                 ):
-                    return match_transitions[current_locale]
-                else:
-                    logger.warning(
-                        '%s 未检测到目标文案语种的翻译内容，将使用默认文案内容'
-                        % input_content
-                    )
-                    return input_content
+                    self.missing_translations.popitem(last=False)
+                    self.missing_translations_overflow += 1
+            else:
+                self.missing_translations.move_to_end(key)
+            self.missing_translations[key] = count + 1
         return input_content
 
+    def __check_locales(
+        self,
+        input_content: str,
+        source_locale: Union[str, None],
+        current_locale: Union[str, None],
+        locale_topic: str,
+    ) -> None:
+        """
+        针对未编译的(主题, 源语种, 目标语种)组合，给出具体的校验错误信息
+
+        Args:
+            input_content (str): 转换前文案内容
+            source_locale (Union[str, None]): 源语种
+            current_locale (Union[str, None]): 当前语种
+            locale_topic (str): 目标语种主题
+        """
+
+        assert current_locale is not None, (
+            '未从cookie中检测到当前语种 %s' % current_locale
+        )
+        assert current_locale in self.available_locales, (
+            '检测到的当前语种不在配置信息中 %s' % current_locale
+        )
+        assert locale_topic in self.available_topics, (
+            '检测到的目标语种主题不在配置信息中 %s' % locale_topic
+        )
+        assert source_locale in self.translations[locale_topic], (
+            '%s 未从 %s 主题的配置信息中检测到源文案语种'
+            % (input_content, locale_topic)
+        )
+
     def rebuild_transilations(
         self,
         translations: Union[str, list],
@@ -139,82 +774,708 @@ class Translator:
 
         assert len(translations) > 0, '无效的本地化配置文件路径'
 
-        raw_root_locales = []
-        raw_translations = {}
-        for translation in translations:
-            # 读取当前对应的目标本地国际化配置文件
-            with open(
-                translation,
-                'r',
-                encoding=translations_encoding,
-            ) as f:
-                raw_translation = json.load(f)
+        with self._reload_lock:
+            self._translations_encoding = translations_encoding
+
+            # 单个二进制文案目录
+            if len(translations) == 1 and is_catalog(translations[0]):
+                mtime = os.stat(translations[0]).st_mtime_ns
+                catalog = TranslationCatalog(translations[0])
+                self.__apply_catalog(translations[0], mtime, catalog)
+                return catalog.root_locale
+
+            # 配置文件路径 -> (修改时间, 解析结果)
+            translation_files = {
+                translation: self.__load_translation_file(translation)
+                for translation in translations
+            }
+            root_locale = self.__check_root_locales(translation_files)
+            self.__apply_translation_files(translation_files)
 
-            assert raw_translation.get('root_locale'), (
-                '配置文件： %s root_locale 无效' % translation
+        # 返回当前根语种
+        return root_locale
+
+    def reload_translations(self) -> List[str]:
+        """
+        检查各本地化配置文件的修改时间，仅重新读取发生变化的配置文件并重建其对应主题的查找表，
+        新的查找表全部构建完成后才整体替换，重建过程中的文案转换不受影响
+
+        Returns:
+            List[str]: 重建的主题列表，配置文件均未发生变化时为空列表
+        """
+
+        with self._reload_lock:
+            if self._catalog_file is not None:
+                return self.__reload_catalog()
+
+            translation_files = dict(self._translation_files)
+            changed_topics = set()
+            for translation, (
+                mtime,
+                metadata,
+                _,
+            ) in self._translation_files.items():
+                try:
+                    current_mtime = os.stat(translation).st_mtime_ns
+                except OSError:
+                    logger.warning(
+                        '配置文件： %s 无法访问，将继续使用已加载的文案内容'
+                        % translation
+                    )
+                    continue
+
+                if current_mtime == mtime:
+                    continue
+
+                translation_files[translation] = self.__load_translation_file(
+                    translation
+                )
+                # 配置文件修改前后对应的主题均需重建
+                changed_topics.add(metadata['topic'])
+                changed_topics.add(translation_files[translation][1]['topic'])
+
+            if not changed_topics:
+                return []
+
+            assert self.__check_root_locales(
+                translation_files
+            ) == self.__check_root_locales(self._translation_files), (
+                '重新加载的配置文件中根语种发生变化'
             )
+            self.__apply_translation_files(translation_files, changed_topics)
 
-            raw_root_locales.append(raw_translation['root_locale'])
+        return sorted(changed_topics)
 
-            assert len(set(raw_root_locales)) == 1, (
-                '构建到配置文件 %s 时检测到多个根语种' % translation
+    def export_bundle(
+        self,
+        locale: str,
+        output_dir: str,
+        topics: Union[List[str], None] = None,
+        source_locale: Union[str, None] = None,
+        bundle_format: Literal['json', 'js'] = 'json',
+    ) -> str:
+        """
+        将指定语种的文案映射导出为压缩的浏览器端文案包，文件名中包含内容哈希值，内容不变时文件名不变，
+        可由浏览器及CDN长期缓存，配合clientside_translate_function()在浏览器端完成语种切换
+
+        Args:
+            locale (str): 目标语种
+            output_dir (str): 文案包输出目录，如Dash应用的assets目录下的子目录
+            topics (Union[List[str], None], optional): 需要导出的主题，为None时导出全部主题 Defaults to None
+            source_locale (Union[str, None], optional): 源语种 Defaults to None
+            bundle_format (Literal['json', 'js'], optional): 文案包格式，'json'供浏览器端按需请求，
+                'js'则以脚本形式直接加载，加载后注册至window.dashI18nBundles Defaults to 'json'
+
+        Returns:
+            str: 文案包文件路径，文件名形如'i18n.en-us.3f2a9c1b7d4e.json'
+        """
+
+        source_locale = source_locale or self.root_locale
+        assert locale in self.available_locales, (
+            '检测到的目标语种不在配置信息中 %s' % locale
+        )
+        assert bundle_format in ('json', 'js'), (
+            '无效的文案包格式 %s' % bundle_format
+        )
+
+        bundle = {}
+        for topic in self.available_topics if topics is None else topics:
+            assert topic in self.available_topics, (
+                '检测到的目标语种主题不在配置信息中 %s' % topic
+            )
+            self.__load_topic(topic)
+            compiled_table = self.compiled_translations.get(
+                (topic, source_locale, locale)
+            )
+            # 源语种与目标语种相同时无需翻译
+            bundle[topic] = (
+                dict(compiled_table.items()) if compiled_table else {}
             )
 
-            # 根据当前配置文件的topic主题，构建或增长对应的原始文案映射字典
-            if raw_translation.get('topic'):
-                # 初始化或覆盖当前topic
-                raw_translations[raw_translation['topic']] = raw_translation
-            else:
-                # 初始化或覆盖默认topic
-                raw_translations['_default'] = raw_translation
+        content = json.dumps(
+            bundle, ensure_ascii=False, separators=(',', ':'), sort_keys=True
+        )
+        if bundle_format == 'js':
+            content = (
+                '(window.dashI18nBundles=window.dashI18nBundles||{})[%s]=%s;'
+                % (json.dumps(locale), content)
+            )
+        content = content.encode('utf-8')
+
+        path = os.path.join(
+            output_dir,
+            'i18n.%s.%s.%s'
+            % (locale, hashlib.sha256(content).hexdigest()[:12], bundle_format),
+        )
+        os.makedirs(output_dir, exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(content)
+
+        return path
+
+    def clientside_translate_function(
+        self,
+        contents: Union[str, List[str]],
+        topic: str = '_default',
+        bundle_urls: Union[Dict[str, str], None] = None,
+    ) -> str:
+        """
+        生成在浏览器端基于文案包转换文案的回调函数，用于app.clientside_callback()，
+        回调函数接收当前语种（为空时从cookie中读取），按顺序返回各文案的转换结果，
+        目标语种的文案包尚未加载且bundle_urls中存在其地址时，将先请求文案包
 
-        # 针对不同主题，构建内部独立的的文案映射字典
-        self.translations = {}
+        Args:
+            contents (Union[str, List[str]]): 转换前文案内容，为单个文案时回调函数返回单个转换结果
+            topic (str, optional): 目标语种主题 Defaults to '_default'
+            bundle_urls (Union[Dict[str, str], None], optional): 语种 -> export_bundle()导出的json文案包地址 Defaults to None
+
+        Returns:
+            str: 回调函数JavaScript源码
+        """
+
+        return _CLIENTSIDE_TRANSLATE_FUNCTION % {
+            'contents': json.dumps(
+                [contents] if isinstance(contents, str) else list(contents),
+                ensure_ascii=False,
+            ),
+            'topic': json.dumps(topic, ensure_ascii=False),
+            'bundle_urls': json.dumps(bundle_urls, ensure_ascii=False),
+            'cookie_pattern': '/(?:^|;\\s*)%s=([^;]*)/'
+            % re.escape(self.cookie_name).replace('/', '\\/'),
+            'root_locale': json.dumps(self.root_locale, ensure_ascii=False),
+            'single': 'true' if isinstance(contents, str) else 'false',
+        }
+
+    def get_usage_stats(self) -> Dict[str, Dict[str, dict]]:
+        """
+        汇总t()、t_many()的文案使用情况，计数为按采样比例换算后的估计值
+
+        Returns:
+            Dict[str, Dict[str, dict]]: 主题 -> 文案 -> {'hits': 命中次数, 'misses': 未命中次数, 'locales': {当前语种: 次数}}
+        """
+
+        assert self._usage is not None, (
+            '未开启文案使用情况统计，请设置usage_sample_rate'
+        )
+
+        usage_stats = {}
         for (
             topic,
-            topic_translations,
-        ) in raw_translations.items():
-            # 初始化当前主题对应的文案映射字典
-            self.translations[topic] = {
-                topic_translations['root_locale']: topic_translations[
-                    'contents'
+            content,
+            locale,
+            hit,
+        ), count in self._usage.snapshot().items():
+            content_stats = usage_stats.setdefault(topic, {}).setdefault(
+                content, {'hits': 0, 'misses': 0, 'locales': {}}
+            )
+            content_stats['hits' if hit else 'misses'] += count
+            content_stats['locales'][locale] = (
+                content_stats['locales'].get(locale, 0) + count
+            )
+        return usage_stats
+
+    def export_usage_metrics(
+        self, metric_name: str = 'dash_i18n_translations_total'
+    ) -> str:
+        """
+        以Prometheus文本格式导出文案使用情况，可直接作为/metrics等接口的响应内容
+
+        Args:
+            metric_name (str, optional): 指标名称 Defaults to 'dash_i18n_translations_total'
+
+        Returns:
+            str: Prometheus文本格式的指标内容
+        """
+
+        assert self._usage is not None, (
+            '未开启文案使用情况统计，请设置usage_sample_rate'
+        )
+
+        def escape(value: Any) -> str:
+            return (
+                str(value)
+                .replace('\\', '\\\\')
+                .replace('"', '\\"')
+                .replace('\n', '\\n')
+            )
+
+        lines = [
+            '# HELP %s Sampled content translations of dash i18n Translator.'
+            % metric_name,
+            '# TYPE %s counter' % metric_name,
+        ]
+        for (topic, content, locale, hit), count in sorted(
+            self._usage.snapshot().items(), key=lambda item: str(item[0])
+        ):
+            lines.append(
+                '%s{topic="%s",content="%s",locale="%s",result="%s"} %d'
+                % (
+                    metric_name,
+                    escape(topic),
+                    escape(content),
+                    escape(locale),
+                    'hit' if hit else 'miss',
+                    count,
+                )
+            )
+        return '\n'.join(lines) + '\n'
+
+    def get_unused_contents(self) -> Dict[str, List[str]]:
+        """
+        获取各主题中尚未被t()、t_many()以根语种文案使用过的文案，可用于清理配置文件中的废弃文案，
+        采样比例小于1时低频文案可能未被记录，需结合足够长的统计时间判断
+
+        Returns:
+            Dict[str, List[str]]: 主题 -> 未使用的根语种文案列表
+        """
+
+        assert self._usage is not None, (
+            '未开启文案使用情况统计，请设置usage_sample_rate'
+        )
+
+        used_contents = set()
+        for topic, content, _, _ in self._usage.snapshot():
+            used_contents.add((topic, content))
+
+        unused_contents = {}
+        for topic in list(self.available_topics):
+            self.__load_topic(topic)
+            root_contents = self.translations.get(topic, {}).get(
+                self.root_locale, ()
+            )
+            unused_contents[topic] = [
+                content
+                for content in root_contents
+                if (topic, content) not in used_contents
+            ]
+        return unused_contents
+
+    def get_usage_stats_overflow(self) -> int:
+        """
+        获取因超出max_usage_keys而未计入文案使用情况统计的估计调用次数
+
+        Returns:
+            int: 估计调用次数
+        """
+
+        assert self._usage is not None, (
+            '未开启文案使用情况统计，请设置usage_sample_rate'
+        )
+
+        return self._usage.overflow
+
+    def reset_usage_stats(self) -> None:
+        """
+        清空文案使用情况统计
+        """
+
+        assert self._usage is not None, (
+            '未开启文案使用情况统计，请设置usage_sample_rate'
+        )
+
+        self._usage.reset()
+
+    def export_catalog(self, path: str) -> None:
+        """
+        将当前加载的全部主题编译为二进制文案目录，目录文件可直接作为translations参数传入，
+        各进程以mmap只读方式打开，经由页缓存共享同一份数据，且无需解析JSON及重建文案映射字典
+
+        Args:
+            path (str): 目录文件路径
+        """
+
+        assert not self.lazy_load_topics and self._catalog_file is None, (
+            '仅支持基于一次性加载的本地化配置文件导出文案目录'
+        )
+
+        with self._reload_lock:
+            write_catalog(
+                path,
+                root_locale=self.__check_root_locales(self._translation_files),
+                available_locales=self.available_locales,
+                translations=self.translations,
+                compiled_translations=self.compiled_translations,
+            )
+
+    def __apply_catalog(
+        self, path: str, mtime: int, catalog: TranslationCatalog
+    ) -> None:
+        """
+        使用二进制文案目录中的文案集合及查找表整体替换当前国际化配置参数
+
+        Args:
+            path (str): 目录文件路径
+            mtime (int): 打开前的目录文件修改时间
+            catalog (TranslationCatalog): 已打开的二进制文案目录
+        """
+
+        translations = catalog.get_translations()
+        compiled_translations = catalog.get_compiled_translations()
+
+        self._catalog_file = (path, mtime, catalog)
+        self._translation_files = {}
+        self._topic_files = {}
+        self._topic_usage = None
+        self.translations = translations
+        self.available_topics = list(translations.keys())
+        self.available_locales = list(catalog.available_locales)
+        self.compiled_translations = compiled_translations
+
+    def __reload_catalog(self) -> List[str]:
+        """
+        二进制文案目录发生变化时重新打开并整体替换
+
+        Returns:
+            List[str]: 重建的主题列表，目录未发生变化时为空列表
+        """
+
+        path, mtime, old_catalog = self._catalog_file
+        try:
+            current_mtime = os.stat(path).st_mtime_ns
+        except OSError:
+            logger.warning(
+                '配置文件： %s 无法访问，将继续使用已加载的文案内容' % path
+            )
+            return []
+
+        if current_mtime == mtime:
+            return []
+
+        catalog = TranslationCatalog(path)
+        assert catalog.root_locale == old_catalog.root_locale, (
+            '重新加载的配置文件中根语种发生变化'
+        )
+        self.__apply_catalog(path, current_mtime, catalog)
+        return sorted(self.available_topics)
+
+    def __check_reload(self) -> None:
+        """
+        距上次检查超过auto_reload_interval时检查配置文件更新，同一时刻仅有一个线程执行检查，
+        重建失败时保留原有查找表
+        """
+
+        now = time.monotonic()
+        if now < self._next_reload_check:
+            return
+        if not self._reload_lock.acquire(blocking=False):
+            return
+        try:
+            self._next_reload_check = now + self.auto_reload_interval
+            self.reload_translations()
+        except Exception:
+            logger.exception(
+                '重新加载本地化配置文件失败，将继续使用已加载的文案内容'
+            )
+        finally:
+            self._reload_lock.release()
+
+    def __load_translation_file(self, translation: str) -> tuple:
+        """
+        读取单个本地化配置文件，并提取主题、根语种及所涉及的语种信息
+
+        Args:
+            translation (str): 本地化配置文件路径
+
+        Returns:
+            tuple: (读取前的文件修改时间, 配置信息摘要, 解析结果)，按需加载模式下不保留解析结果
+        """
+
+        # 先记录修改时间，读取期间文件再次变化时下次检查仍可发现
+        mtime = os.stat(translation).st_mtime_ns
+        # 读取当前对应的目标本地国际化配置文件
+        with open(
+            translation,
+            'r',
+            encoding=self._translations_encoding,
+        ) as f:
+            raw_translation = json.load(f)
+
+        assert raw_translation.get('root_locale'), (
+            '配置文件： %s root_locale 无效' % translation
+        )
+
+        topic = raw_translation.get('topic') or '_default'
+        root_locale = raw_translation['root_locale']
+        # 根语种下的复数文案，需为对应组合编译查找表
+        root_plurals = False
+        for root_content, root_content_translations in raw_translation[
+            'contents'
+        ].items():
+            for locale, content in root_content_translations.items():
+                if isinstance(content, str):
+                    continue
+                assert isinstance(content, dict) and isinstance(
+                    content.get('other'), str
+                ), (
+                    '配置文件： %s 主题 %s 中文案 %s 的%s复数文案缺少other类别'
+                    % (
+                        translation,
+                        topic,
+                        root_content,
+                        locale,
+                    )
+                )
+                if locale == root_locale:
+                    root_plurals = True
+
+        metadata = {
+            'topic': topic,
+            'root_locale': root_locale,
+            'root_plurals': root_plurals,
+            'locales': frozenset(
+                [
+                    raw_translation['root_locale'],
+                    *(
+                        locale
+                        for root_content_translations in raw_translation[
+                            'contents'
+                        ].values()
+                        for locale in root_content_translations
+                    ),
                 ]
+            ),
+        }
+
+        return (
+            mtime,
+            metadata,
+            None if self.lazy_load_topics else raw_translation,
+        )
+
+    @staticmethod
+    def __check_root_locales(translation_files: dict) -> str:
+        """
+        检查各本地化配置文件的根语种是否一致
+
+        Args:
+            translation_files (dict): 配置文件路径 -> (修改时间, 配置信息摘要, 解析结果)
+
+        Returns:
+            str: 根语种
+        """
+
+        raw_root_locales = []
+        for translation, (_, metadata, _) in translation_files.items():
+            raw_root_locales.append(metadata['root_locale'])
+
+            assert len(set(raw_root_locales)) == 1, (
+                '构建到配置文件 %s 时检测到多个根语种' % translation
+            )
+
+        return raw_root_locales[0]
+
+    def __apply_translation_files(
+        self,
+        translation_files: dict,
+        changed_topics: Union[set, None] = None,
+    ) -> None:
+        """
+        基于各本地化配置文件的解析结果构建文案映射字典及预编译查找表，构建完成后整体替换，
+        按需加载模式下仅保留未发生变化的已加载主题
+
+        Args:
+            translation_files (dict): 配置文件路径 -> (修改时间, 配置信息摘要, 解析结果)
+            changed_topics (Union[set, None], optional): 需要重建的主题，为None时重建全部主题 Defaults to None
+        """
+
+        # 根据各配置文件的topic主题确定其对应的配置文件，靠后的配置文件覆盖靠前的同主题配置文件
+        topic_files = {}
+        for translation, (_, metadata, _) in translation_files.items():
+            topic_files[metadata['topic']] = translation
+
+        # 可用语种为各主题所涉及语种的并集（含根语种），以及配置了后备语种的目标语种
+        available_locales = list(
+            {
+                locale
+                for translation in topic_files.values()
+                for locale in translation_files[translation][1]['locales']
             }
+            | set(self.fallback_locales)
+        )
 
-            # 补充生成其他语种文案映射字典
-            self.available_locales = []
-            for (
-                root_content,
-                root_content_translations,
-            ) in topic_translations['contents'].items():
-                for (
-                    locale,
-                    content,
-                ) in root_content_translations.items():
-                    if locale not in self.translations[topic]:
-                        self.translations[topic][locale] = {}
-                    if content not in self.translations[topic][locale]:
-                        self.translations[topic][locale][content] = {}
-                    self.translations[topic][locale][content].update(
-                        {
-                            raw_translations[topic][
-                                'root_locale'
-                            ]: root_content,
-                            **{
-                                key: value
-                                for key, value in root_content_translations.items()
-                                if key != locale
-                            },
-                        }
-                    )
-                    self.available_locales.append(locale)
+        # 针对不同主题，构建内部独立的的文案映射字典，未变化的主题沿用已有结果
+        translations = {}
+        for topic, translation in topic_files.items():
+            if changed_topics is not None and topic not in changed_topics:
+                if topic in self.translations:
+                    translations[topic] = self.translations[topic]
+            elif not self.lazy_load_topics:
+                translations[topic] = self.__build_topic_translations(
+                    translation_files[translation][2]
+                )
 
+        # 预先编译(主题, 源语种, 目标语种) -> {源文案: 目标文案}的扁平查找表，
+        # 可用语种未变化时，未变化主题的查找表沿用已有结果
+        if changed_topics is None or set(available_locales) != set(
+            self.available_locales
+        ):
+            compile_topics = set(translations)
+            compiled_translations = {}
+        else:
+            compile_topics = changed_topics & set(translations)
+            compiled_translations = {
+                key: value
+                for key, value in self.compiled_translations.items()
+                if key[0] in translations and key[0] not in compile_topics
+            }
+        # 源语种与目标语种相同的组合对应None，无需加载主题，
+        # 根语种下含复数文案的主题，其根语种对应的查找表随主题编译或沿用已有结果
+        for topic, translation in topic_files.items():
+            metadata = translation_files[translation][1]
+            for locale in available_locales:
+                if (
+                    locale == metadata['root_locale']
+                    and metadata['root_plurals']
+                ):
+                    continue
+                compiled_translations[(topic, locale, locale)] = None
+        for topic in compile_topics:
+            compiled_translations.update(
+                self.__compile_topic_translations(
+                    topic,
+                    translations[topic],
+                    available_locales,
+                    self.fallback_locales,
+                )
+            )
+
+        # 查找表最后替换，文案转换要么使用旧查找表，要么使用完整构建的新查找表
+        self._catalog_file = None
+        self._translation_files = translation_files
+        self._topic_files = topic_files
+        if self.lazy_load_topics and self.max_loaded_topics is not None:
+            # 已加载主题的使用顺序，越靠后表示越近使用
+            self._topic_usage = OrderedDict(
+                (topic, None)
+                for topic in (
+                    self._topic_usage if changed_topics is not None else ()
+                )
+                if topic in translations
+            )
+        else:
+            self._topic_usage = None
+        self.translations = translations
         # 更新当前可用主题列表
-        self.available_topics = list(self.translations.keys())
-        # 补充根语种
-        self.available_locales.append(raw_root_locales[0])
+        self.available_topics = list(topic_files.keys())
         # 更新当前可用语种列表
-        self.available_locales = list(set(self.available_locales))
+        self.available_locales = available_locales
+        self.compiled_translations = compiled_translations
 
-        # 返回当前根语种
-        return raw_root_locales[0]
+    @staticmethod
+    def __build_topic_translations(raw_translation: dict) -> dict:
+        """
+        基于单个主题的原始配置构建各语种的文案映射字典
+
+        Args:
+            raw_translation (dict): 单个主题的原始配置
+
+        Returns:
+            dict: 语种 -> {文案: {其他语种: 对应文案}}
+        """
+
+        # 初始化当前主题对应的文案映射字典
+        topic_translations = {
+            raw_translation['root_locale']: raw_translation['contents']
+        }
+
+        # 补充生成其他语种文案映射字典
+        for (
+            root_content,
+            root_content_translations,
+        ) in raw_translation['contents'].items():
+            for (
+                locale,
+                content,
+            ) in root_content_translations.items():
+                # 复数文案仅可作为目标文案
+                if not isinstance(content, str):
+                    continue
+                if locale not in topic_translations:
+                    topic_translations[locale] = {}
+                if content not in topic_translations[locale]:
+                    topic_translations[locale][content] = {}
+                topic_translations[locale][content].update(
+                    {
+                        raw_translation['root_locale']: root_content,
+                        **{
+                            key: value
+                            for key, value in root_content_translations.items()
+                            if key != locale
+                        },
+                    }
+                )
+
+        return topic_translations
+
+    @staticmethod
+    def __compile_topic_translations(
+        topic: str,
+        topic_translations: dict,
+        available_locales: list,
+        fallback_locales: Dict[str, List[str]],
+    ) -> dict:
+        """
+        编译单个主题的(主题, 源语种, 目标语种) -> {源文案: 目标文案}查找表，
+        源语种与目标语种相同的组合对应None，表示无需翻译，配置了该语种自身复数文案时则对应仅含复数文案的查找表，
+        目标语种缺失翻译内容时按后备语种依次确定结果
+
+        Args:
+            topic (str): 主题
+            topic_translations (dict): 当前主题各语种的文案映射字典
+            available_locales (list): 可用语种列表
+            fallback_locales (Dict[str, List[str]]): 目标语种 -> 后备语种列表
+
+        Returns:
+            dict: 当前主题的查找表
+        """
+
+        compiled_translations = {}
+        for target_locale in available_locales:
+            compiled_translations[(topic, target_locale, target_locale)] = None
+            for (
+                source_locale,
+                source_translations,
+            ) in topic_translations.items():
+                if source_locale == target_locale:
+                    plural_table = {
+                        content: content_translations[target_locale]
+                        for content, content_translations in source_translations.items()
+                        if isinstance(
+                            content_translations.get(target_locale), dict
+                        )
+                    }
+                    if plural_table:
+                        compiled_translations[
+                            (topic, source_locale, target_locale)
+                        ] = plural_table
+                    continue
+                compiled_translations[(topic, source_locale, target_locale)] = {
+                    content: content_translations[target_locale]
+                    for content, content_translations in source_translations.items()
+                    if content_translations.get(target_locale) is not None
+                }
+
+                if target_locale not in fallback_locales:
+                    continue
+                # 依次尝试各后备语种，后备语种与源语种相同时即为源文案本身
+                compiled_table = compiled_translations[
+                    (topic, source_locale, target_locale)
+                ]
+                for fallback_locale in fallback_locales[target_locale]:
+                    for (
+                        content,
+                        content_translations,
+                    ) in source_translations.items():
+                        if content in compiled_table:
+                            continue
+                        if fallback_locale == source_locale:
+                            compiled_table[content] = content
+                        elif (
+                            content_translations.get(fallback_locale)
+                            is not None
+                        ):
+                            compiled_table[content] = content_translations[
+                                fallback_locale
+                            ]
+
+        return compiled_translations
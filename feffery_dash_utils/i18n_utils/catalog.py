@@ -0,0 +1,434 @@
+import json
+import mmap
+import os
+import struct
+import sys
+import tempfile
+import zlib
+from array import array
+from bisect import bisect_left
+from typing import Any, Dict, Iterable, Tuple, Union
+
+# 二进制文案目录文件头：魔数（含格式版本）、元数据偏移量、元数据长度
+_MAGIC_PREFIX = b'FDUI18N'
+_MAGIC = _MAGIC_PREFIX + b'\x02'
+_HEADER = struct.Struct('<8sQQ')
+
+# 标记未命中的文案
+_MISSING = object()
+
+# 目标文案编号的最高位标记复数文案，此时对应字符串为复数文案的JSON文本
+_PLURAL_FLAG = 0x80000000
+
+
+def _encode_value(value: Union[str, dict]) -> str:
+    if isinstance(value, str):
+        return value
+    return json.dumps(value, ensure_ascii=False, sort_keys=True)
+
+
+def is_catalog(path: str) -> bool:
+    """
+    判断文件是否为二进制文案目录
+
+    Args:
+        path (str): 文件路径
+
+    Returns:
+        bool: 是否为二进制文案目录
+    """
+
+    with open(path, 'rb') as f:
+        return f.read(len(_MAGIC_PREFIX)) == _MAGIC_PREFIX
+
+
+def write_catalog(
+    path: str,
+    root_locale: str,
+    available_locales: Iterable[str],
+    translations: Dict[str, Dict[str, dict]],
+    compiled_translations: Dict[Tuple[str, str, str], Union[dict, None]],
+) -> None:
+    """
+    将Translator构建的文案映射字典及预编译查找表写出为二进制文案目录，
+    目录由按字节序排列的字符串表、字符串哈希索引，以及各查找表对应的字符串编号数组构成，
+    先写入临时文件再整体替换，已打开旧目录的进程不受影响
+
+    Args:
+        path (str): 目录文件路径
+        root_locale (str): 根语种
+        available_locales (Iterable[str]): 可用语种
+        translations (Dict[str, Dict[str, dict]]): 主题 -> 语种 -> 文案映射字典
+        compiled_translations (Dict[Tuple[str, str, str], Union[dict, None]]): (主题, 源语种, 目标语种) -> 查找表
+    """
+
+    # 按UTF-8字节序排列的字符串表，字符串编号即其在表中的下标
+    strings = set()
+    for topic_translations in translations.values():
+        for contents in topic_translations.values():
+            strings.update(contents)
+    for compiled_table in compiled_translations.values():
+        if compiled_table:
+            strings.update(map(_encode_value, compiled_table.values()))
+    encoded_strings = sorted(string.encode('utf-8') for string in strings)
+    assert len(encoded_strings) < _PLURAL_FLAG, '文案数量超出文案目录容量'
+    string_ids = {
+        encoded_string.decode('utf-8'): string_id
+        for string_id, encoded_string in enumerate(encoded_strings)
+    }
+
+    sections = []
+    offset = _HEADER.size
+
+    def add_section(data: bytes) -> int:
+        """追加数据段并返回其偏移量，各数据段按4字节对齐"""
+
+        nonlocal offset
+        section_offset = offset
+        padding = -len(data) % 4
+        sections.append(data + b'\0' * padding)
+        offset += len(data) + padding
+        return section_offset
+
+    string_offsets = array('I', [0])
+    for encoded_string in encoded_strings:
+        string_offsets.append(string_offsets[-1] + len(encoded_string))
+
+    # 开放寻址哈希索引，槽位值为字符串编号加1，0表示空槽位
+    hash_size = 1
+    while hash_size < len(encoded_strings) * 2:
+        hash_size *= 2
+    hash_slots = array('I', bytes(4 * hash_size))
+    for string_id, encoded_string in enumerate(encoded_strings):
+        slot = zlib.crc32(encoded_string) & (hash_size - 1)
+        while hash_slots[slot]:
+            slot = (slot + 1) & (hash_size - 1)
+        hash_slots[slot] = string_id + 1
+
+    metadata = {
+        'byteorder': sys.byteorder,
+        'root_locale': root_locale,
+        'available_locales': list(available_locales),
+        'string_count': len(encoded_strings),
+        'string_offsets': add_section(string_offsets.tobytes()),
+        'string_data': add_section(b''.join(encoded_strings)),
+        'hash_size': hash_size,
+        'hash_slots': add_section(hash_slots.tobytes()),
+        # 主题 -> 语种 -> (文案编号数组偏移量, 数量)
+        'contents': {
+            topic: {
+                locale: [
+                    add_section(
+                        array(
+                            'I',
+                            sorted(string_ids[content] for content in contents),
+                        ).tobytes()
+                    ),
+                    len(contents),
+                ]
+                for locale, contents in topic_translations.items()
+            }
+            for topic, topic_translations in translations.items()
+        },
+        # [主题, 源语种, 目标语种, 编号数组偏移量, 数量]，源语种与目标语种相同时偏移量为None
+        'tables': [],
+    }
+    for (
+        topic,
+        source_locale,
+        target_locale,
+    ), compiled_table in compiled_translations.items():
+        if compiled_table is None:
+            metadata['tables'].append(
+                [topic, source_locale, target_locale, None, 0]
+            )
+            continue
+        pairs = sorted(
+            (
+                string_ids[content],
+                string_ids[_encode_value(text)]
+                | (0 if isinstance(text, str) else _PLURAL_FLAG),
+            )
+            for content, text in compiled_table.items()
+        )
+        # 源文案编号数组与目标文案编号数组依次存放，目标文案编号的最高位标记复数文案
+        metadata['tables'].append(
+            [
+                topic,
+                source_locale,
+                target_locale,
+                add_section(
+                    array('I', [pair[0] for pair in pairs]).tobytes()
+                    + array('I', [pair[1] for pair in pairs]).tobytes()
+                ),
+                len(pairs),
+            ]
+        )
+
+    metadata_bytes = json.dumps(metadata, ensure_ascii=False).encode('utf-8')
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(_HEADER.pack(_MAGIC, offset, len(metadata_bytes)))
+            f.writelines(sections)
+            f.write(metadata_bytes)
+        # 临时文件默认仅所有者可读，需允许其他用户的进程读取
+        os.chmod(temp_path, 0o644)
+        os.replace(temp_path, path)
+    except BaseException:
+        os.unlink(temp_path)
+        raise
+
+
+class TranslationCatalog:
+    """
+    以mmap只读映射打开的二进制文案目录，同一主机上的多个进程经由页缓存共享同一份数据，
+    打开时仅解析少量元数据，文案内容在查找时才按需解码
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+        打开二进制文案目录
+
+        Args:
+            path (str): 目录文件路径
+        """
+
+        with open(path, 'rb') as f:
+            self._mmap = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+
+        magic, metadata_offset, metadata_length = _HEADER.unpack_from(
+            self._mmap
+        )
+        assert magic[: len(_MAGIC_PREFIX)] == _MAGIC_PREFIX, (
+            '无效的文案目录文件 %s' % path
+        )
+        assert magic == _MAGIC, (
+            '文案目录文件 %s 的格式版本与当前版本不一致，请重新导出' % path
+        )
+        self.metadata = json.loads(
+            self._mmap[metadata_offset : metadata_offset + metadata_length]
+        )
+        assert self.metadata['byteorder'] == sys.byteorder, (
+            '文案目录文件 %s 的字节序与当前平台不一致' % path
+        )
+
+        self._buffer = memoryview(self._mmap)
+        self._string_offsets = self._uint32_array(
+            self.metadata['string_offsets'], self.metadata['string_count'] + 1
+        )
+        self._string_data = self.metadata['string_data']
+        self._hash_mask = self.metadata['hash_size'] - 1
+        self._hash_slots = self._uint32_array(
+            self.metadata['hash_slots'], self.metadata['hash_size']
+        )
+
+    @property
+    def root_locale(self) -> str:
+        return self.metadata['root_locale']
+
+    @property
+    def available_locales(self) -> list:
+        return self.metadata['available_locales']
+
+    def get_translations(self) -> Dict[str, Dict[str, 'CatalogContents']]:
+        """
+        获取各主题、语种的文案集合
+
+        Returns:
+            Dict[str, Dict[str, CatalogContents]]: 主题 -> 语种 -> 文案集合
+        """
+
+        return {
+            topic: {
+                locale: CatalogContents(
+                    self, self._uint32_array(contents_offset, count)
+                )
+                for locale, (contents_offset, count) in topic_contents.items()
+            }
+            for topic, topic_contents in self.metadata['contents'].items()
+        }
+
+    def get_compiled_translations(
+        self,
+    ) -> Dict[Tuple[str, str, str], Union['CatalogTable', None]]:
+        """
+        获取(主题, 源语种, 目标语种) -> 查找表，源语种与目标语种相同的组合对应None
+
+        Returns:
+            Dict[Tuple[str, str, str], Union[CatalogTable, None]]: 预编译查找表
+        """
+
+        compiled_translations = {}
+        for (
+            topic,
+            source_locale,
+            target_locale,
+            table_offset,
+            count,
+        ) in self.metadata['tables']:
+            compiled_translations[(topic, source_locale, target_locale)] = (
+                None
+                if table_offset is None
+                else CatalogTable(self, table_offset, count)
+            )
+        return compiled_translations
+
+    def find_string(self, string: str) -> Union[int, None]:
+        """
+        基于哈希索引查询字符串编号
+
+        Args:
+            string (str): 查询字符串
+
+        Returns:
+            Union[int, None]: 字符串编号，不存在时返回None
+        """
+
+        try:
+            encoded_string = string.encode('utf-8')
+        except (AttributeError, UnicodeEncodeError):
+            return None
+
+        string_offsets = self._string_offsets
+        slot = zlib.crc32(encoded_string) & self._hash_mask
+        while True:
+            string_id = self._hash_slots[slot] - 1
+            if string_id < 0:
+                return None
+            start = self._string_data + string_offsets[string_id]
+            end = self._string_data + string_offsets[string_id + 1]
+            if self._buffer[start:end] == encoded_string:
+                return string_id
+            slot = (slot + 1) & self._hash_mask
+
+    def get_string(self, string_id: int) -> str:
+        """
+        按编号解码字符串
+
+        Args:
+            string_id (int): 字符串编号
+
+        Returns:
+            str: 字符串
+        """
+
+        return str(
+            self._buffer[
+                self._string_data
+                + self._string_offsets[string_id] : self._string_data
+                + self._string_offsets[string_id + 1]
+            ],
+            'utf-8',
+        )
+
+    def _uint32_array(self, offset: int, count: int) -> memoryview:
+        """
+        以零拷贝方式将数据段视为uint32数组
+        """
+
+        return self._buffer[offset : offset + 4 * count].cast('I')
+
+
+class CatalogContents:
+    """
+    二进制文案目录中某一主题、语种的文案集合，get()用法与Translator.translations中的字典一致
+    """
+
+    __slots__ = ('_catalog', '_string_ids')
+
+    def __init__(self, catalog: TranslationCatalog, string_ids: memoryview):
+        self._catalog = catalog
+        self._string_ids = string_ids
+
+    def __contains__(self, content: Any) -> bool:
+        string_id = self._catalog.find_string(content)
+        if string_id is None:
+            return False
+        index = bisect_left(self._string_ids, string_id)
+        return (
+            index < len(self._string_ids)
+            and self._string_ids[index] == string_id
+        )
+
+    def __len__(self) -> int:
+        return len(self._string_ids)
+
+    def __iter__(self) -> Iterable[str]:
+        return map(self._catalog.get_string, self._string_ids)
+
+    def get(self, content: Any, default: Any = None) -> Any:
+        return True if content in self else default
+
+
+class CatalogTable:
+    """
+    二进制文案目录中的单个查找表，get()用法与Translator.compiled_translations中的字典一致，
+    编号数组在首次查找时才映射，命中的目标文案解码后缓存于进程内，后续查找无需再次解码
+    """
+
+    __slots__ = ('_catalog', '_offset', '_count', '_ids', '_cache')
+
+    def __init__(self, catalog: TranslationCatalog, offset: int, count: int):
+        self._catalog = catalog
+        self._offset = offset
+        self._count = count
+        # (源文案编号数组, 目标文案编号数组)
+        self._ids = None
+        self._cache = {}
+
+    def __len__(self) -> int:
+        return self._count
+
+    def __get_ids(self) -> Tuple[memoryview, memoryview]:
+        if self._ids is None:
+            self._ids = (
+                self._catalog._uint32_array(self._offset, self._count),
+                self._catalog._uint32_array(
+                    self._offset + 4 * self._count, self._count
+                ),
+            )
+        return self._ids
+
+    def __contains__(self, content: Any) -> bool:
+        return self.get(content) is not None
+
+    def get(self, content: Any, default: Any = None) -> Any:
+        text = self._cache.get(content, _MISSING)
+        if text is not _MISSING:
+            return text
+
+        string_id = self._catalog.find_string(content)
+        if string_id is None:
+            return default
+        source_ids, target_ids = self.__get_ids()
+        index = bisect_left(source_ids, string_id)
+        if index == self._count or source_ids[index] != string_id:
+            return default
+
+        text = self._cache[content] = self.__decode_target(target_ids[index])
+        return text
+
+    def __decode_target(self, target_id: int) -> Union[str, dict]:
+        """
+        按目标文案编号解码目标文案，最高位标记的复数文案解析为字典
+        """
+
+        if target_id & _PLURAL_FLAG:
+            return json.loads(
+                self._catalog.get_string(target_id & ~_PLURAL_FLAG)
+            )
+        return self._catalog.get_string(target_id)
+
+    def items(self) -> Iterable[Tuple[str, str]]:
+        """
+        逐项解码全部(源文案, 目标文案)
+        """
+
+        for source_id, target_id in zip(*self.__get_ids()):
+            yield (
+                self._catalog.get_string(source_id),
+                self.__decode_target(target_id),
+            )
@@ -0,0 +1,190 @@
+from decimal import Decimal
+from string import Formatter
+from typing import Any, Callable, Dict, Union
+
+_FORMATTER = Formatter()
+
+
+class MessageFormatter:
+    """
+    预先拆分的文案模板，如'共{count}个文件，当前为{name}'，渲染时仅需依次拼接各片段，
+    模板语法与str.format()一致，支持'{name:spec}'格式说明及'{{'、'}}'转义
+    """
+
+    __slots__ = ('segments', 'fields')
+
+    def __init__(self, template: str) -> None:
+        """
+        拆分文案模板
+
+        Args:
+            template (str): 文案模板
+        """
+
+        # 文本片段及占位符交替排列，占位符所在位置渲染时替换为参数值
+        self.segments = []
+        # (占位符在segments中的下标, 参数名, 转换标记, 格式说明)
+        self.fields = []
+        for literal, field_name, format_spec, conversion in _FORMATTER.parse(
+            template
+        ):
+            if literal:
+                self.segments.append(literal)
+            if field_name is not None:
+                assert field_name.isidentifier(), (
+                    '文案模板 %s 中的占位符 {%s} 无效' % (template, field_name)
+                )
+                self.fields.append(
+                    (len(self.segments), field_name, conversion, format_spec)
+                )
+                self.segments.append(None)
+
+    def render(self, params: Dict[str, Any]) -> str:
+        """
+        基于参数渲染文案
+
+        Args:
+            params (Dict[str, Any]): 占位符参数
+
+        Returns:
+            str: 渲染结果
+        """
+
+        segments = self.segments.copy()
+        for index, field_name, conversion, format_spec in self.fields:
+            value = params[field_name]
+            if conversion == 'r':
+                value = repr(value)
+            elif conversion == 'a':
+                value = ascii(value)
+            segments[index] = (
+                format(value, format_spec)
+                if format_spec or type(value) is not str
+                else value
+            )
+        return ''.join(segments)
+
+
+def _split_number(count: Union[int, float, str]) -> tuple:
+    """
+    拆分CLDR复数规则所需的数值要素
+
+    Returns:
+        tuple: (绝对值n, 整数部分i, 可见小数位数v, 可见小数部分f)
+    """
+
+    if type(count) is int:
+        return abs(count), abs(count), 0, 0
+
+    # 经Decimal转为定点表示，兼容1e+16、1e-05等指数形式，且保留'1.50'等字符串中可见的末尾0
+    decimal = Decimal(str(count))
+    n = abs(float(decimal))
+    if not decimal.is_finite():
+        return n, 0, 0, 0
+    integer, _, fraction = format(abs(decimal), 'f').partition('.')
+    return n, int(integer or 0), len(fraction), int(fraction or 0)
+
+
+def _plural_other(count: Any) -> str:
+    return 'other'
+
+
+def _plural_one(count: Any) -> str:
+    # en、de、nl、sv、it等：one -> i = 1 and v = 0
+    _, i, v, _ = _split_number(count)
+    return 'one' if i == 1 and v == 0 else 'other'
+
+
+def _plural_zero_one(count: Any) -> str:
+    # fr、pt：one -> i = 0,1
+    _, i, _, _ = _split_number(count)
+    return 'one' if i in (0, 1) else 'other'
+
+
+def _plural_n_one(count: Any) -> str:
+    # es等：one -> n = 1
+    n, _, _, _ = _split_number(count)
+    return 'one' if n == 1 else 'other'
+
+
+def _plural_east_slavic(count: Any) -> str:
+    # ru、uk、be
+    _, i, v, _ = _split_number(count)
+    if v != 0:
+        return 'other'
+    if i % 10 == 1 and i % 100 != 11:
+        return 'one'
+    if 2 <= i % 10 <= 4 and not 12 <= i % 100 <= 14:
+        return 'few'
+    return 'many'
+
+
+def _plural_polish(count: Any) -> str:
+    _, i, v, _ = _split_number(count)
+    if v != 0:
+        return 'other'
+    if i == 1:
+        return 'one'
+    if 2 <= i % 10 <= 4 and not 12 <= i % 100 <= 14:
+        return 'few'
+    return 'many'
+
+
+def _plural_czech(count: Any) -> str:
+    # cs、sk
+    _, i, v, _ = _split_number(count)
+    if v != 0:
+        return 'many'
+    if i == 1:
+        return 'one'
+    if 2 <= i <= 4:
+        return 'few'
+    return 'other'
+
+
+def _plural_arabic(count: Any) -> str:
+    n, _, _, _ = _split_number(count)
+    if n == 0:
+        return 'zero'
+    if n == 1:
+        return 'one'
+    if n == 2:
+        return 'two'
+    if n == int(n) and 3 <= n % 100 <= 10:
+        return 'few'
+    if n == int(n) and 11 <= n % 100 <= 99:
+        return 'many'
+    return 'other'
+
+
+# 语言 -> CLDR复数类别选择函数，未列出的语言按英语规则处理
+_PLURAL_RULES: Dict[str, Callable[[Any], str]] = {
+    **dict.fromkeys(
+        ['zh', 'ja', 'jp', 'ko', 'vi', 'th', 'id', 'ms', 'lo', 'my'],
+        _plural_other,
+    ),
+    **dict.fromkeys(
+        ['en', 'de', 'nl', 'sv', 'it', 'fi', 'et', 'ca', 'gl'], _plural_one
+    ),
+    **dict.fromkeys(['fr', 'pt'], _plural_zero_one),
+    **dict.fromkeys(['es', 'el', 'hu', 'tr', 'nb', 'da', 'bg'], _plural_n_one),
+    **dict.fromkeys(['ru', 'uk', 'be'], _plural_east_slavic),
+    'pl': _plural_polish,
+    **dict.fromkeys(['cs', 'sk'], _plural_czech),
+    'ar': _plural_arabic,
+}
+
+
+def get_plural_rule(locale: Union[str, None]) -> Callable[[Any], str]:
+    """
+    获取语种对应的CLDR复数类别选择函数
+
+    Args:
+        locale (Union[str, None]): 语种，如'en-us'、'zh_CN'
+
+    Returns:
+        Callable[[Any], str]: 接收数量并返回复数类别（zero、one、two、few、many、other）的函数
+    """
+
+    language = (locale or '').lower().replace('_', '-').split('-')[0]
+    return _PLURAL_RULES.get(language, _plural_one)
@@ -0,0 +1,174 @@
+import random
+import threading
+import weakref
+from typing import Dict, List, Tuple
+
+# (主题, 文案, 当前语种, 是否命中) -> 采样次数
+_UsageKey = Tuple[str, str, str, bool]
+
+
+class _ThreadState:
+    """
+    单个线程的计数状态
+    """
+
+    __slots__ = ('thread_ref', 'counters', 'overflow')
+
+    def __init__(self, thread: threading.Thread) -> None:
+        self.thread_ref = weakref.ref(thread)
+        self.counters: Dict[_UsageKey, int] = {}
+        # 因超出max_keys而未记录的采样次数
+        self.overflow = 0
+
+
+class UsageRecorder:
+    """
+    文案转换使用情况的采样计数器，各线程分别在线程本地的字典中累加计数，记录时无需加锁，
+    仅在导出时汇总各线程的计数，相邻两次采样的间隔随机选取，避免按固定顺序转换的文案始终只有同一条被采样，
+    已结束线程的计数会在新线程开始记录或导出时并入共享的汇总结果
+    """
+
+    def __init__(self, sample_rate: float = 1.0, max_keys: int = 10000) -> None:
+        """
+        初始化计数器
+
+        Args:
+            sample_rate (float, optional): 采样比例，如0.01表示每100次调用记录1次 Defaults to 1.0
+            max_keys (int, optional): 各存活线程、以及已结束线程的汇总结果分别最多记录的(主题, 文案, 当前语种, 是否命中)组合数量，
+                超出后新组合的采样计入overflow Defaults to 10000
+        """
+
+        assert 0 < sample_rate <= 1, '采样比例需位于(0, 1]区间内'
+
+        # 每个线程平均每隔sample_interval次调用记录一次
+        self.sample_interval = max(1, round(1 / sample_rate))
+        self.max_keys = max_keys
+        self._local = threading.local()
+        self._lock = threading.Lock()
+        # 各存活线程的计数状态
+        self._thread_states: List[_ThreadState] = []
+        # 已结束线程的汇总计数
+        self._retired_counters: Dict[_UsageKey, int] = {}
+        self._retired_overflow = 0
+
+    def record(self, topic: str, content: str, locale: str, hit: bool) -> None:
+        """
+        记录一次文案转换
+
+        Args:
+            topic (str): 目标语种主题
+            content (str): 转换前文案内容
+            locale (str): 当前语种
+            hit (bool): 是否命中翻译内容
+        """
+
+        local = self._local
+        countdown = getattr(local, 'countdown', None)
+        if countdown is None:
+            countdown = self.__init_thread()
+        if countdown > 1:
+            local.countdown = countdown - 1
+            return
+
+        local.countdown = self.__next_countdown()
+        key = (topic, content, locale, hit)
+        counters = local.counters
+        count = counters.get(key)
+        if count is None:
+            if len(counters) >= self.max_keys:
+                local.state.overflow += 1
+                return
+            count = 0
+        counters[key] = count + 1
+
+    def snapshot(self) -> Dict[_UsageKey, int]:
+        """
+        汇总各线程的计数，并按采样比例换算为估计的调用次数
+
+        Returns:
+            Dict[_UsageKey, int]: (主题, 文案, 当前语种, 是否命中) -> 估计调用次数
+        """
+
+        with self._lock:
+            self.__retire_dead_threads()
+            thread_counters = [self._retired_counters.copy()] + [
+                state.counters for state in self._thread_states
+            ]
+
+        totals = {}
+        for counters in thread_counters:
+            # dict.copy()在持有GIL期间完成，不受其他线程并发写入影响
+            for key, count in counters.copy().items():
+                totals[key] = totals.get(key, 0) + count * self.sample_interval
+        return totals
+
+    @property
+    def overflow(self) -> int:
+        """
+        因超出max_keys而未记录的估计调用次数
+        """
+
+        with self._lock:
+            self.__retire_dead_threads()
+            return (
+                self._retired_overflow
+                + sum(state.overflow for state in self._thread_states)
+            ) * self.sample_interval
+
+    def reset(self) -> None:
+        """
+        清空各线程的计数
+        """
+
+        with self._lock:
+            self._retired_counters = {}
+            self._retired_overflow = 0
+            for state in self._thread_states:
+                state.counters.clear()
+                state.overflow = 0
+
+    def __next_countdown(self) -> int:
+        """
+        随机选取距下次采样的调用次数，均值为sample_interval
+        """
+
+        if self.sample_interval == 1:
+            return 1
+        return random.randint(1, 2 * self.sample_interval - 1)
+
+    def __init_thread(self) -> int:
+        """
+        为当前线程初始化计数状态及首次采样位置
+        """
+
+        state = _ThreadState(threading.current_thread())
+        with self._lock:
+            self.__retire_dead_threads()
+            self._thread_states.append(state)
+        self._local.state = state
+        self._local.counters = state.counters
+        self._local.countdown = random.randint(1, self.sample_interval)
+        return self._local.countdown
+
+    def __retire_dead_threads(self) -> None:
+        """
+        将已结束线程的计数并入共享的汇总结果，需持有锁调用
+        """
+
+        alive_states = []
+        for state in self._thread_states:
+            thread = state.thread_ref()
+            if thread is not None and thread.is_alive():
+                alive_states.append(state)
+                continue
+
+            retired_counters = self._retired_counters
+            for key, count in state.counters.items():
+                if key in retired_counters:
+                    retired_counters[key] += count
+                elif len(retired_counters) < self.max_keys:
+                    retired_counters[key] = count
+                else:
+                    self._retired_overflow += count
+            self._retired_overflow += state.overflow
+        self._thread_states = alive_states
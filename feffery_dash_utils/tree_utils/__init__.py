@@ -1,3 +1,15 @@
 from .tree_manager import TreeManager
+from .indexed_tree import IndexedTree
+from .flat_tree import FlatTree
+from .lazy_tree_source import LazyTreeSource
+from .compact_tree import CompactTree
+from .aggregated_tree import AggregatedTree
 
-__all__ = ['TreeManager']
+__all__ = [
+    'TreeManager',
+    'IndexedTree',
+    'FlatTree',
+    'LazyTreeSource',
+    'CompactTree',
+    'AggregatedTree',
+]
@@ -0,0 +1,133 @@
+from typing import Any, Callable, Dict, List, Literal, Optional, Union
+
+from .indexed_tree import IndexedTree
+
+# 标记尚未计算统计值的节点
+_MISSING = object()
+
+
+class AggregatedTree(IndexedTree):
+    """
+    在索引树形数据的基础上，自底向上汇总各节点的统计值（如子树节点数量、数值求和），
+    节点变动后仅沿其祖先节点链增量更新统计值\n
+    Indexed tree data with bottom-up roll-up aggregates, updated incrementally
+    along the ancestor path after each change.
+    """
+
+    def __init__(
+        self,
+        input_object: Union[dict, list],
+        aggregate: Callable[[dict, List[Any]], Any],
+        data_type: Literal['tree', 'menu'] = 'tree',
+        target_field: Optional[str] = None,
+    ) -> None:
+        """
+        基于原始treeData构建索引，并在一次后序遍历中计算全部节点的统计值
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            aggregate (Callable[[dict, List[Any]], Any]): 统计函数，接收节点数据字典及其各子节点的统计值列表，返回该节点的统计值，
+                需仅依赖这两项输入，如统计子树节点数量：lambda node, child_values: 1 + sum(child_values)
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            target_field (Optional[str], default None): 若设置，则将各节点的统计值同步写入节点的该字段，随treeData一同导出
+        """
+
+        self._aggregate = aggregate
+        self._target_field = target_field
+        # id(节点字典) -> 节点统计值
+        self._aggregates: Dict[int, Any] = {}
+
+        super().__init__(input_object, data_type)
+
+    def get_aggregate(self, node_key: str) -> Any:
+        """
+        查询key值等于node_key的节点的统计值
+
+        Args:
+            node_key (str): 查询目标节点key值
+
+        Returns:
+            Any: 节点统计值，节点不存在时返回None
+        """
+
+        node = self._nodes.get(node_key)
+        if node is None:
+            return None
+        return self._aggregates[id(node)]
+
+    def get_aggregates(self) -> Dict[Any, Any]:
+        """
+        查询全部节点的统计值
+
+        Returns:
+            Dict[Any, Any]: 节点key值 -> 节点统计值
+        """
+
+        return {
+            node_key: self._aggregates[id(node)]
+            for node_key, node in self._nodes.items()
+        }
+
+    def _index_subtree(
+        self, node: dict, parent: Union[dict, None], position: int
+    ) -> None:
+        """
+        对以node为根的子树建立索引，并以显式栈后序计算子树中各节点的统计值
+        """
+
+        super()._index_subtree(node, parent, position)
+
+        stack = [(node, False)]
+        while stack:
+            current, children_ready = stack.pop()
+            if children_ready:
+                self._compute_aggregate(current)
+            else:
+                stack.append((current, True))
+                stack.extend(
+                    (child, False) for child in current.get('children') or []
+                )
+
+    def _unindex_subtree(self, node: dict) -> None:
+        """
+        移除以node为根的子树的索引及统计值
+        """
+
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            self._aggregates.pop(id(current), None)
+            stack.extend(current.get('children') or [])
+
+        super()._unindex_subtree(node)
+
+    def _mark_changed(self, node: Union[dict, None]) -> None:
+        """
+        沿节点的祖先节点链重新计算统计值，某一节点的统计值未发生变化时，其祖先节点无需再计算
+        """
+
+        super()._mark_changed(node)
+
+        while node is not None and self._compute_aggregate(node):
+            node = self._parents[id(node)]
+
+    def _compute_aggregate(self, node: dict) -> bool:
+        """
+        基于子节点的统计值计算节点的统计值
+
+        Returns:
+            bool: 统计值是否发生变化
+        """
+
+        old_value = self._aggregates.get(id(node), _MISSING)
+        value = self._aggregate(
+            node,
+            [
+                self._aggregates[id(child)]
+                for child in node.get('children') or []
+            ],
+        )
+        self._aggregates[id(node)] = value
+        if self._target_field is not None:
+            node[self._target_field] = value
+        return old_value is _MISSING or old_value != value
@@ -0,0 +1,56 @@
+from copy import deepcopy
+from typing import Any, Literal, Union
+
+
+def get_node_key(
+    node: dict, data_type: Literal['tree', 'menu'] = 'tree'
+) -> Any:
+    """
+    提取节点的key值，'menu'类型数据的key值位于props中
+
+    Args:
+        node (dict): 节点数据字典
+        data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+    Returns:
+        Any: 节点key值，不存在时返回None
+    """
+
+    if data_type == 'menu':
+        return node.get('props', {}).get('key')
+    return node.get('key')
+
+
+# 无需深拷贝的不可变基础类型
+_ATOMIC_TYPES = (str, int, float, bool, type(None))
+
+
+def copy_tree(input_object: Union[dict, list]) -> Union[dict, list]:
+    """
+    以显式栈逐层深拷贝treeData，避免copy.deepcopy在深层树上的递归开销及RecursionError
+
+    Args:
+        input_object (Union[dict, list]): 原始的treeData
+
+    Returns:
+        Union[dict, list]: 深拷贝结果
+    """
+
+    is_single_root = isinstance(input_object, dict)
+    new_roots = []
+    stack = [([input_object] if is_single_root else input_object, new_roots)]
+    while stack:
+        layer, new_layer = stack.pop()
+        for node in layer:
+            new_node = {}
+            for key, value in node.items():
+                if key == 'children' and isinstance(value, list):
+                    new_node[key] = []
+                    stack.append((value, new_node[key]))
+                elif isinstance(value, _ATOMIC_TYPES):
+                    new_node[key] = value
+                else:
+                    new_node[key] = deepcopy(value)
+            new_layer.append(new_node)
+
+    return new_roots[0] if is_single_root else new_roots
@@ -0,0 +1,286 @@
+import numpy as np
+from typing import Any, Callable, List, Literal, Union
+
+from .common import copy_tree, get_node_key
+
+
+class FlatTree:
+    """
+    将`AntdTree`等组件的树形数据按先序展开为扁平的列式结构，
+    节点的筛选、祖先节点保留、子树提取等操作均可基于numpy向量化完成\n
+    Flat columnar representation of tree data, filtering, ancestor retention
+    and subtree extraction are vectorized with numpy.
+    """
+
+    def __init__(
+        self,
+        input_object: Union[dict, list],
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> None:
+        """
+        基于原始treeData构建扁平列式结构
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+        """
+
+        # 检查input_object类型是否在list、dict中
+        assert isinstance(input_object, (list, dict)), (
+            'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
+        )
+
+        self.data_type = data_type
+        self._is_single_root = isinstance(input_object, dict)
+
+        keys = []
+        titles = []
+        parents = []
+        depths = []
+        orders = []
+        subtree_ends = []
+        # 各节点除children外的其余字段，及原节点是否存在children字段
+        self._fields: List[dict] = []
+        has_children_field = []
+
+        # 以迭代器栈按先序展开，(父节点下标, 深度, 平级节点迭代器)
+        stack = [
+            (
+                -1,
+                0,
+                enumerate(
+                    [input_object] if self._is_single_root else input_object
+                ),
+            )
+        ]
+        while stack:
+            parent_index, depth, layer = stack[-1]
+            for order, node in layer:
+                index = len(keys)
+                keys.append(get_node_key(node, data_type))
+                title = (
+                    node.get('props', {}).get('title')
+                    if data_type == 'menu'
+                    else node.get('title')
+                )
+                titles.append('' if title is None else str(title))
+                parents.append(parent_index)
+                depths.append(depth)
+                orders.append(order)
+                subtree_ends.append(index + 1)
+                self._fields.append(
+                    {
+                        field: value
+                        for field, value in node.items()
+                        if field != 'children'
+                    }
+                )
+                has_children_field.append('children' in node)
+                if node.get('children'):
+                    stack.append(
+                        (index, depth + 1, enumerate(node['children']))
+                    )
+                    break
+            else:
+                stack.pop()
+                if parent_index >= 0:
+                    subtree_ends[parent_index] = len(keys)
+
+        # 节点key值表
+        self.keys = np.array(keys, dtype=object)
+        # 节点标题字符串表
+        self.titles = np.array(titles, dtype=str)
+        # 父节点下标，根层级节点为-1
+        self.parents = np.array(parents, dtype=np.int64)
+        # 节点深度，根层级节点为0
+        self.depths = np.array(depths, dtype=np.int64)
+        # 节点在平级节点中的下标
+        self.orders = np.array(orders, dtype=np.int64)
+        # 以节点为根的子树在先序中对应的下标区间[index, subtree_end)的右边界
+        self.subtree_ends = np.array(subtree_ends, dtype=np.int64)
+        self._has_children_field = np.array(has_children_field, dtype=bool)
+        self._key_to_index = {
+            node_key: index
+            for index, node_key in enumerate(keys)
+            if node_key is not None
+        }
+        self._lower_titles = None
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def get_index(self, node_key: str) -> Union[int, None]:
+        """
+        查询key值等于node_key的节点在先序中的下标
+
+        Args:
+            node_key (str): 查询目标节点key值
+
+        Returns:
+            Union[int, None]: 节点下标，不存在时返回None
+        """
+
+        return self._key_to_index.get(node_key)
+
+    @property
+    def lower_titles(self) -> np.ndarray:
+        """
+        小写形式的节点标题字符串表，首次访问时生成并缓存
+        """
+
+        if self._lower_titles is None:
+            self._lower_titles = np.char.lower(self.titles)
+        return self._lower_titles
+
+    def match_titles(
+        self, text: str, case_sensitive: bool = False
+    ) -> np.ndarray:
+        """
+        查找标题中包含text的节点
+
+        Args:
+            text (str): 查找文本
+            case_sensitive (bool, default False): 是否区分大小写
+
+        Returns:
+            np.ndarray: 各节点是否命中的布尔数组
+        """
+
+        if case_sensitive:
+            return np.char.find(self.titles, text) >= 0
+        return np.char.find(self.lower_titles, text.lower()) >= 0
+
+    def match_nodes(self, predicate: Callable[[dict], bool]) -> np.ndarray:
+        """
+        逐个节点执行判断函数，适用于无法直接基于列式数据向量化表达的筛选条件
+
+        Args:
+            predicate (Callable[[dict], bool]): 接收节点（不含children字段）并返回是否命中的函数
+
+        Returns:
+            np.ndarray: 各节点是否命中的布尔数组
+        """
+
+        return np.fromiter(
+            (bool(predicate(fields)) for fields in self._fields),
+            dtype=bool,
+            count=len(self._fields),
+        )
+
+    def ancestors_of(self, mask: np.ndarray) -> np.ndarray:
+        """
+        查找命中节点的全部祖先节点（不含命中节点自身）
+
+        Args:
+            mask (np.ndarray): 各节点是否命中的布尔数组
+
+        Returns:
+            np.ndarray: 各节点是否为某一命中节点祖先的布尔数组
+        """
+
+        # 任一后代节点命中，等价于子树区间(index, subtree_end)内存在命中节点
+        cumulative = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+        return (cumulative[self.subtree_ends] - cumulative[1:]) > 0
+
+    def with_ancestors(self, mask: np.ndarray) -> np.ndarray:
+        """
+        在命中节点的基础上补充其全部祖先节点
+
+        Args:
+            mask (np.ndarray): 各节点是否命中的布尔数组
+
+        Returns:
+            np.ndarray: 补充祖先节点后的布尔数组
+        """
+
+        return np.asarray(mask, dtype=bool) | self.ancestors_of(mask)
+
+    def with_descendants(self, mask: np.ndarray) -> np.ndarray:
+        """
+        在命中节点的基础上补充其全部后代节点
+
+        Args:
+            mask (np.ndarray): 各节点是否命中的布尔数组
+
+        Returns:
+            np.ndarray: 补充后代节点后的布尔数组
+        """
+
+        # 以差分数组标记各命中节点的子树区间
+        indexes = np.flatnonzero(mask)
+        difference = np.zeros(len(self) + 1, dtype=np.int64)
+        np.add.at(difference, indexes, 1)
+        np.add.at(difference, self.subtree_ends[indexes], -1)
+        return np.cumsum(difference[:-1]) > 0
+
+    def subtree_mask(self, node_key: str) -> np.ndarray:
+        """
+        生成以key值等于node_key的节点为根的子树对应的布尔数组
+
+        Args:
+            node_key (str): 子树根节点key值
+
+        Returns:
+            np.ndarray: 各节点是否位于该子树中的布尔数组，节点不存在时全部为False
+        """
+
+        mask = np.zeros(len(self), dtype=bool)
+        index = self.get_index(node_key)
+        if index is not None:
+            mask[index : self.subtree_ends[index]] = True
+        return mask
+
+    def keys_of(self, mask: np.ndarray) -> List[Any]:
+        """
+        提取布尔数组中命中节点的key值
+
+        Args:
+            mask (np.ndarray): 各节点是否命中的布尔数组
+
+        Returns:
+            List[Any]: 按先序排列的命中节点key值列表
+        """
+
+        return self.keys[mask].tolist()
+
+    def to_tree_data(
+        self, mask: Union[np.ndarray, None] = None
+    ) -> Union[list, dict, None]:
+        """
+        还原为treeData，可传入布尔数组仅保留部分节点，
+        保留节点的父节点未被保留时，将挂载到最近的被保留祖先节点下
+
+        Args:
+            mask (Union[np.ndarray, None], default None): 各节点是否保留的布尔数组，缺省时保留全部节点
+
+        Returns:
+            Union[list, dict, None]: 还原得到的treeData，原始treeData为单个根节点字典且结果仅有一个根节点时保持字典形式
+        """
+
+        indexes = range(len(self)) if mask is None else np.flatnonzero(mask)
+
+        roots = []
+        # 当前所在的被保留祖先节点链，(子树右边界, 节点字典)
+        ancestors = []
+        for index in indexes:
+            index = int(index)
+            while ancestors and ancestors[-1][0] <= index:
+                ancestors.pop()
+            node = copy_tree(self._fields[index])
+            if self._has_children_field[index]:
+                node['children'] = []
+            if ancestors:
+                parent = ancestors[-1][1]
+                if 'children' not in parent:
+                    parent['children'] = []
+                parent['children'].append(node)
+            else:
+                roots.append(node)
+            ancestors.append((int(self.subtree_ends[index]), node))
+
+        if self._is_single_root:
+            if len(roots) == 1:
+                return roots[0]
+            if not roots:
+                return None
+        return roots
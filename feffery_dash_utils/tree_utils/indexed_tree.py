@@ -0,0 +1,563 @@
+import json
+from typing import Any, Dict, List, Literal, Optional, Union
+
+from .common import copy_tree, get_node_key
+
+
+def _dumps_json(obj: Any) -> str:
+    """
+    序列化为紧凑的JSON字符串，Dash组件等对象按其前端序列化形式处理
+    """
+
+    return json.dumps(
+        obj,
+        ensure_ascii=False,
+        separators=(',', ':'),
+        default=lambda value: value.to_plotly_json(),
+    )
+
+
+class IndexedTree:
+    """
+    一次构建key值索引后，对`AntdTree`等组件的树形数据进行单节点增删改查，
+    无需每次操作都进行深拷贝及全量遍历\n
+    Indexed tree data of `AntdTree` etc., single node operations no longer
+    need a full deepcopy and a full traversal.
+    """
+
+    # apply()支持的操作类型
+    _apply_op_types = (
+        'update_tree_node',
+        'add_node_before',
+        'add_node_after',
+        'add_node_inside',
+        'delete_node',
+        'move_node',
+    )
+
+    def __init__(
+        self,
+        input_object: Union[dict, list],
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> None:
+        """
+        基于原始treeData构建索引，构建过程中会对原始treeData进行一次深拷贝
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+        """
+
+        # 检查input_object类型是否在list、dict中
+        assert isinstance(input_object, (list, dict)), (
+            'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
+        )
+
+        self.data_type = data_type
+        # 记录原始treeData是否为单个根节点字典，导出时还原
+        self._is_single_root = isinstance(input_object, dict)
+        self._roots: List[dict] = copy_tree(
+            [input_object] if self._is_single_root else input_object
+        )
+        # key值 -> 节点字典
+        self._nodes: Dict[Any, dict] = {}
+        # id(节点字典) -> 父节点字典，根层级节点对应None
+        self._parents: Dict[int, Union[dict, None]] = {}
+        # id(节点字典) -> 节点在所属兄弟节点列表中的位置
+        self._positions: Dict[int, int] = {}
+        # id(节点字典) -> 以该节点为根的子树的JSON序列化结果缓存，
+        # 节点缓存失效时其全部祖先节点的缓存同步失效
+        self._json_cache: Dict[int, str] = {}
+
+        for position, node in enumerate(self._roots):
+            self._index_subtree(node, None, position)
+
+    def __len__(self) -> int:
+        return len(self._nodes)
+
+    def __contains__(self, node_key: Any) -> bool:
+        return node_key in self._nodes
+
+    def get_node(self, node_key: str, copy: bool = True) -> Union[dict, None]:
+        """
+        查询key值等于node_key的节点
+
+        Args:
+            node_key (str): 查询目标节点key值
+            copy (bool, default True): 是否返回以目标节点为根的子树的深拷贝，为False时直接返回内部数据，
+                返回结果只读，需通过update_tree_node()、apply()等方法修改节点，以免索引及to_json()的缓存失效不及时
+
+        Returns:
+            Union[dict, None]: 目标节点数据字典，不存在时返回None
+        """
+
+        node = self._nodes.get(node_key)
+        if node is None or not copy:
+            return node
+        return copy_tree(node)
+
+    def get_node_path(
+        self, node_key: str, copy: bool = True
+    ) -> Union[List[dict], None]:
+        """
+        查询自根节点至key值等于node_key的节点的祖先节点链
+
+        Args:
+            node_key (str): 查询目标节点key值
+            copy (bool, default True): 是否返回深拷贝，为True时仅拷贝一次根节点所在子树，
+                各祖先节点取自同一份拷贝；为False时直接返回内部数据，返回结果只读，约束同get_node()
+
+        Returns:
+            Union[List[dict], None]: 由根节点至目标节点（含）依次排列的节点列表，未找到时返回None
+        """
+
+        node = self._nodes.get(node_key)
+        if node is None:
+            return None
+
+        node_path = []
+        while node is not None:
+            node_path.append(node)
+            node = self._parents[id(node)]
+        node_path.reverse()
+        if not copy:
+            return node_path
+
+        # 沿拷贝后的根节点按各节点位置逐层向下定位
+        copied_path = [copy_tree(node_path[0])]
+        for node in node_path[1:]:
+            copied_path.append(
+                copied_path[-1]['children'][self._positions[id(node)]]
+            )
+        return copied_path
+
+    def update_tree_node(
+        self,
+        node_key: str,
+        new_node: dict,
+        mode: Literal['replace', 'overlay'] = 'replace',
+        remove_fields: Optional[List[str]] = None,
+    ) -> None:
+        """
+        对key值等于node_key的节点进行整体替换或增量更新
+
+        Args:
+            node_key (str): 更新目标节点key值
+            new_node (dict): 更新目标节点新数据字典
+            mode (Literal['replace', 'overlay'], default 'replace'): 更新模式，'replace'表示整体替换，'overlay'表示增量更新
+            remove_fields (Optional[List[str]], default None): 增量更新时需要从节点中移除的字段
+        """
+
+        node = self._nodes.get(node_key)
+        if node is None:
+            return
+
+        new_node = copy_tree(new_node)
+
+        if mode == 'replace':
+            # 先完成新子树的key值校验，校验失败时树形数据及索引保持不变
+            self._check_new_keys(
+                self._collect_keys([new_node]),
+                set(self._collect_keys([node])),
+            )
+            parent = self._parents[id(node)]
+            position = self._positions[id(node)]
+            self._unindex_subtree(node)
+            self._get_siblings(parent)[position] = new_node
+            self._index_subtree(new_node, parent, position)
+            self._mark_changed(parent)
+        else:
+            remove_fields = remove_fields or []
+            # 增量更新直接作用于原节点字典，子节点的父节点引用保持有效
+            children_changed = (
+                'children' in new_node or 'children' in remove_fields
+            )
+            merged_node = {**node, **new_node}
+            for field in remove_fields:
+                merged_node.pop(field, None)
+            new_keys = [get_node_key(merged_node, self.data_type)]
+            replaced_keys = {node_key}
+            if children_changed:
+                new_keys.extend(
+                    self._collect_keys(merged_node.get('children') or [])
+                )
+                replaced_keys.update(
+                    self._collect_keys(node.get('children') or [])
+                )
+            self._check_new_keys(new_keys, replaced_keys)
+
+            if children_changed:
+                for child in node.get('children') or []:
+                    self._unindex_subtree(child)
+            node.update(new_node)
+            for field in remove_fields:
+                node.pop(field, None)
+            new_key = get_node_key(node, self.data_type)
+            if new_key != node_key:
+                del self._nodes[node_key]
+                self._register_key(node)
+            if children_changed:
+                for position, child in enumerate(node.get('children') or []):
+                    self._index_subtree(child, node, position)
+            self._mark_changed(node)
+
+    def add_node_before(self, node_key: str, new_node: dict) -> None:
+        """
+        在key值等于node_key的节点之前插入平级新节点
+
+        Args:
+            node_key (str): 插入目标节点key值
+            new_node (dict): 要插入的新节点数据字典
+        """
+
+        node = self._nodes.get(node_key)
+        if node is None:
+            return
+
+        self._insert_node(
+            self._parents[id(node)], self._positions[id(node)], new_node
+        )
+
+    def add_node_after(self, node_key: str, new_node: dict) -> None:
+        """
+        在key值等于node_key的节点之后插入平级新节点
+
+        Args:
+            node_key (str): 插入目标节点key值
+            new_node (dict): 要插入的新节点数据字典
+        """
+
+        node = self._nodes.get(node_key)
+        if node is None:
+            return
+
+        self._insert_node(
+            self._parents[id(node)], self._positions[id(node)] + 1, new_node
+        )
+
+    def add_node_inside(
+        self, node_key: Union[str, None], new_node: dict
+    ) -> None:
+        """
+        在key值等于node_key的节点的子节点末尾插入新节点
+
+        Args:
+            node_key (Union[str, None]): 插入目标节点key值，为None时表示插入到根层级末尾
+            new_node (dict): 要插入的新节点数据字典
+        """
+
+        parent = None
+        if node_key is not None:
+            parent = self._nodes.get(node_key)
+            if parent is None:
+                return
+            if not parent.get('children'):
+                parent['children'] = []
+
+        self._insert_node(parent, len(self._get_siblings(parent)), new_node)
+
+    def delete_node(
+        self, node_key: str, keep_empty_children_node: bool = True
+    ) -> None:
+        """
+        删除key值等于node_key的节点
+
+        Args:
+            node_key (str): 删除目标节点key值
+            keep_empty_children_node (bool, default True): 是否保留children字段为空列表的节点
+        """
+
+        node = self._nodes.get(node_key)
+        if node is None:
+            return
+
+        while True:
+            parent = self._parents[id(node)]
+            position = self._positions[id(node)]
+            siblings = self._get_siblings(parent)
+            del siblings[position]
+            self._unindex_subtree(node)
+            self._shift_positions(siblings, position)
+
+            # 父节点的children变为空列表且无需保留时，继续向上删除父节点
+            if keep_empty_children_node or parent is None or siblings:
+                break
+            node = parent
+
+        self._mark_changed(parent)
+
+    def move_node(
+        self,
+        node_key: str,
+        target_key: Union[str, None],
+        position: Literal['before', 'after', 'inside'] = 'after',
+    ) -> None:
+        """
+        将key值等于node_key的节点连同其子树移动到key值等于target_key的节点处
+
+        Args:
+            node_key (str): 待移动节点key值
+            target_key (Union[str, None]): 移动目标节点key值，position为'inside'时可传入None表示移动到根层级末尾
+            position (Literal['before', 'after', 'inside'], default 'after'): 移动方式，'before'、'after'表示移动为目标节点之前、之后的平级节点，'inside'表示移动为目标节点的最后一个子节点
+        """
+
+        node = self._nodes.get(node_key)
+        target = self._nodes.get(target_key)
+        if node is None or node is target:
+            return
+        if target is None and not (target_key is None and position == 'inside'):
+            return
+
+        # 检查目标节点是否位于待移动节点的子树中
+        ancestor = target
+        while ancestor is not None:
+            assert ancestor is not node, (
+                '无法将节点移动到其自身的子树中 %s\ncan not move node %s into its own subtree'
+                % (node_key, node_key)
+            )
+            ancestor = self._parents[id(ancestor)]
+
+        # 从原位置取出待移动节点
+        parent = self._parents[id(node)]
+        siblings = self._get_siblings(parent)
+        del siblings[self._positions[id(node)]]
+        self._shift_positions(siblings, self._positions[id(node)])
+        self._mark_changed(parent)
+
+        # 放置到新位置
+        if position == 'inside':
+            new_parent = target
+            if target is not None and not target.get('children'):
+                target['children'] = []
+            new_position = len(self._get_siblings(target))
+        else:
+            new_parent = self._parents[id(target)]
+            new_position = self._positions[id(target)] + (
+                1 if position == 'after' else 0
+            )
+        siblings = self._get_siblings(new_parent)
+        siblings.insert(new_position, node)
+        self._shift_positions(siblings, new_position)
+        self._parents[id(node)] = new_parent
+        self._mark_changed(new_parent)
+
+    def apply(self, ops: List[dict]) -> None:
+        """
+        按顺序执行多个节点操作
+
+        Args:
+            ops (List[dict]): 操作列表，每个操作字典通过type字段指定操作类型，
+                可选的有'update_tree_node'、'add_node_before'、'add_node_after'、'add_node_inside'、'delete_node'、'move_node'，
+                其余字段对应同名方法的参数，如：
+                {'type': 'update_tree_node', 'node_key': '节点1', 'new_node': {'title': '新标题'}, 'mode': 'overlay'}
+                {'type': 'move_node', 'node_key': '节点1', 'target_key': '节点2', 'position': 'inside'}
+        """
+
+        for op in ops:
+            op_type = op.get('type')
+            assert op_type in self._apply_op_types, (
+                '不支持的操作类型 %s\nunsupported op type %s'
+                % (op_type, op_type)
+            )
+            getattr(self, op_type)(
+                **{key: value for key, value in op.items() if key != 'type'}
+            )
+
+    def to_tree_data(self, copy: bool = True) -> Union[list, dict, None]:
+        """
+        导出当前的treeData
+
+        Args:
+            copy (bool, default True): 是否导出内部数据的深拷贝，为False时直接导出内部数据，
+                此后对当前实例的操作将同步影响导出结果，且不应再直接修改导出结果，以免to_json()的缓存失效不及时
+
+        Returns:
+            Union[list, dict, None]: 当前的treeData，原始treeData为单个根节点字典时保持字典形式
+        """
+
+        tree_data = self._roots
+        if self._is_single_root:
+            if len(self._roots) == 1:
+                tree_data = self._roots[0]
+            elif not self._roots:
+                return None
+        return copy_tree(tree_data) if copy else tree_data
+
+    def to_json(self) -> str:
+        """
+        导出当前treeData的JSON字符串，各子树的序列化结果会被缓存，
+        节点变动后仅需重新序列化其祖先节点链，未变动的子树直接复用缓存
+
+        Returns:
+            str: 当前treeData的JSON字符串，原始treeData为单个根节点字典时保持字典形式
+        """
+
+        fragments = [self._get_subtree_json(node) for node in self._roots]
+        if self._is_single_root:
+            if len(fragments) == 1:
+                return fragments[0]
+            elif not fragments:
+                return 'null'
+        return '[' + ','.join(fragments) + ']'
+
+    def _get_siblings(self, parent: Union[dict, None]) -> List[dict]:
+        """
+        获取父节点对应的子节点列表，父节点为None时对应根层级节点列表
+        """
+
+        if parent is None:
+            return self._roots
+        return parent['children']
+
+    def _insert_node(
+        self, parent: Union[dict, None], position: int, new_node: dict
+    ) -> None:
+        """
+        在父节点子节点列表的指定位置插入新节点并建立索引
+        """
+
+        new_node = copy_tree(new_node)
+        self._check_new_keys(self._collect_keys([new_node]))
+        siblings = self._get_siblings(parent)
+        siblings.insert(position, new_node)
+        self._shift_positions(siblings, position + 1)
+        self._index_subtree(new_node, parent, position)
+        self._mark_changed(parent)
+
+    def _get_subtree_json(self, node: dict) -> str:
+        """
+        以显式栈后序序列化以node为根的子树，已缓存的子树直接复用，
+        叶节点及子节点均为叶节点的节点整体序列化一次，不再单独缓存其子节点
+        """
+
+        json_cache = self._json_cache
+        stack = [(node, False)]
+        while stack:
+            current, children_ready = stack.pop()
+            if id(current) in json_cache:
+                continue
+            children = current.get('children')
+            if not isinstance(children, list) or not any(
+                isinstance(child.get('children'), list) for child in children
+            ):
+                json_cache[id(current)] = _dumps_json(current)
+                continue
+            if not children_ready:
+                stack.append((current, True))
+                stack.extend((child, False) for child in children)
+                continue
+
+            fields_json = _dumps_json(
+                {
+                    field: value
+                    for field, value in current.items()
+                    if field != 'children'
+                }
+            )
+            # 在对象末尾的右花括号前接续拼接children字段
+            json_cache[id(current)] = '%s%s"children":[%s]}' % (
+                fields_json[:-1],
+                ',' if len(fields_json) > 2 else '',
+                ','.join(json_cache[id(child)] for child in children),
+            )
+
+        return json_cache[id(node)]
+
+    def _mark_changed(self, node: Union[dict, None]) -> None:
+        """
+        节点自身字段或子节点列表发生变动后调用，使节点及其全部祖先节点的JSON缓存失效
+        """
+
+        while node is not None:
+            self._json_cache.pop(id(node), None)
+            node = self._parents[id(node)]
+
+    def _shift_positions(self, siblings: List[dict], start: int) -> None:
+        """
+        刷新兄弟节点列表中自start起各节点的位置索引
+        """
+
+        for position in range(start, len(siblings)):
+            self._positions[id(siblings[position])] = position
+
+    def _register_key(self, node: dict) -> None:
+        """
+        登记节点的key值索引
+        """
+
+        node_key = get_node_key(node, self.data_type)
+        if node_key is not None:
+            assert node_key not in self._nodes, (
+                '检测到重复的节点key值 %s\nduplicate node key %s'
+                % (node_key, node_key)
+            )
+            self._nodes[node_key] = node
+
+    def _collect_keys(self, nodes: List[dict]) -> List[Any]:
+        """
+        收集若干棵子树中全部节点的key值
+        """
+
+        node_keys = []
+        stack = list(nodes)
+        while stack:
+            current = stack.pop()
+            node_key = get_node_key(current, self.data_type)
+            if node_key is not None:
+                node_keys.append(node_key)
+            stack.extend(current.get('children') or [])
+        return node_keys
+
+    def _check_new_keys(
+        self, new_keys: List[Any], replaced_keys: Union[set, tuple] = ()
+    ) -> None:
+        """
+        在修改树形数据前校验新节点的key值，新节点之间不可重复，且不可与现有节点重复，
+        即将被替换的节点的key值（replaced_keys）除外
+        """
+
+        seen_keys = set()
+        for node_key in new_keys:
+            if node_key is None:
+                continue
+            assert node_key not in seen_keys and (
+                node_key in replaced_keys or node_key not in self._nodes
+            ), '检测到重复的节点key值 %s\nduplicate node key %s' % (
+                node_key,
+                node_key,
+            )
+            seen_keys.add(node_key)
+
+    def _index_subtree(
+        self, node: dict, parent: Union[dict, None], position: int
+    ) -> None:
+        """
+        对以node为根的子树建立索引
+        """
+
+        stack = [(node, parent, position)]
+        while stack:
+            current, current_parent, current_position = stack.pop()
+            self._parents[id(current)] = current_parent
+            self._positions[id(current)] = current_position
+            self._register_key(current)
+            for child_position, child in enumerate(
+                current.get('children') or []
+            ):
+                stack.append((child, current, child_position))
+
+    def _unindex_subtree(self, node: dict) -> None:
+        """
+        移除以node为根的子树的索引
+        """
+
+        stack = [node]
+        while stack:
+            current = stack.pop()
+            self._parents.pop(id(current), None)
+            self._positions.pop(id(current), None)
+            self._json_cache.pop(id(current), None)
+            node_key = get_node_key(current, self.data_type)
+            if self._nodes.get(node_key) is current:
+                del self._nodes[node_key]
+            stack.extend(current.get('children') or [])
@@ -0,0 +1,730 @@
+import json
+import sqlite3
+import threading
+from contextlib import nullcontext
+from copy import deepcopy
+from typing import Any, Dict, List, Literal, Optional, Tuple, Union
+
+from .common import _ATOMIC_TYPES, copy_tree, get_node_key
+
+
+def _dumps_fields(fields: dict) -> str:
+    """
+    将节点字段序列化为JSON字符串，Dash组件等对象按其前端序列化形式处理
+    """
+
+    return json.dumps(
+        fields,
+        ensure_ascii=False,
+        default=lambda obj: obj.to_plotly_json(),
+    )
+
+
+class _MemoryStore:
+    """
+    基于内存字典索引的节点存储
+    """
+
+    def __init__(self) -> None:
+        # key值 -> 节点除children外的字段
+        self._fields: Dict[Any, dict] = {}
+        # key值 -> 原节点是否存在children字段
+        self._has_children_field: Dict[Any, bool] = {}
+        # key值 -> 父节点key值，根层级节点对应None
+        self._parents: Dict[Any, Any] = {}
+        # 父节点key值 -> 有序的子节点key值列表，None对应根层级
+        self._children: Dict[Any, List[Any]] = {None: []}
+
+    def transaction(self):
+        return nullcontext()
+
+    def clear(self) -> None:
+        self.__init__()
+
+    def count(self) -> int:
+        return len(self._fields)
+
+    def contains(self, node_key: Any) -> bool:
+        return node_key in self._fields
+
+    def get(self, node_key: Any) -> Union[Tuple[dict, bool], None]:
+        if node_key not in self._fields:
+            return None
+        return (
+            copy_tree(self._fields[node_key]),
+            self._has_children_field[node_key],
+        )
+
+    def get_parent(self, node_key: Any) -> Any:
+        return self._parents[node_key]
+
+    def get_position(self, node_key: Any) -> int:
+        return self._children[self._parents[node_key]].index(node_key)
+
+    def count_children(self, parent_key: Any) -> int:
+        return len(self._children.get(parent_key, ()))
+
+    def get_child_keys(
+        self, parent_key: Any, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Any]:
+        child_keys = self._children.get(parent_key, [])
+        return child_keys[offset : None if limit is None else offset + limit]
+
+    def get_child_nodes(
+        self, parent_key: Any, offset: int, limit: int
+    ) -> List[Tuple[dict, bool]]:
+        """
+        查询子节点字段及各子节点是否存在后代节点
+        """
+
+        return [
+            (
+                copy_tree(self._fields[child_key]),
+                bool(self._children.get(child_key)),
+            )
+            for child_key in self.get_child_keys(parent_key, offset, limit)
+        ]
+
+    def insert(
+        self,
+        node_key: Any,
+        parent_key: Any,
+        position: int,
+        fields: dict,
+        has_children_field: bool,
+    ) -> None:
+        self._fields[node_key] = fields
+        self._has_children_field[node_key] = has_children_field
+        self._parents[node_key] = parent_key
+        self._children.setdefault(parent_key, []).insert(position, node_key)
+
+    def insert_many(self, rows: List[tuple]) -> None:
+        """
+        批量追加节点，rows中各行的位置需已按最终结果编号
+        """
+
+        for node_key, parent_key, _, fields, has_children_field in rows:
+            self._fields[node_key] = fields
+            self._has_children_field[node_key] = has_children_field
+            self._parents[node_key] = parent_key
+            self._children.setdefault(parent_key, []).append(node_key)
+
+    def set_fields(
+        self, node_key: Any, fields: dict, has_children_field: bool
+    ) -> None:
+        self._fields[node_key] = copy_tree(fields)
+        self._has_children_field[node_key] = has_children_field
+
+    def remove(self, node_key: Any) -> None:
+        """
+        移除单个节点并维护平级节点位置，其后代节点需事先移除
+        """
+
+        self._children[self._parents[node_key]].remove(node_key)
+        self._children.pop(node_key, None)
+        del self._fields[node_key]
+        del self._has_children_field[node_key]
+        del self._parents[node_key]
+
+    def remove_descendants(self, node_keys: List[Any]) -> None:
+        """
+        批量移除某一子树中除根节点外的全部节点，无需维护平级节点位置
+        """
+
+        for node_key in node_keys:
+            self._children.pop(node_key, None)
+            del self._fields[node_key]
+            del self._has_children_field[node_key]
+            del self._parents[node_key]
+
+
+class _SqliteStore:
+    """
+    基于SQLite数据库文件的节点存储，同一父节点下的子节点位置保持从0开始连续编号
+    """
+
+    def __init__(self, database: str) -> None:
+        self._connection = sqlite3.connect(database, check_same_thread=False)
+        self._connection.executescript(
+            """
+            CREATE TABLE IF NOT EXISTS tree_nodes (
+                node_key PRIMARY KEY,
+                parent_key,
+                position INTEGER NOT NULL,
+                fields TEXT NOT NULL,
+                has_children_field INTEGER NOT NULL
+            );
+            CREATE INDEX IF NOT EXISTS tree_nodes_children
+                ON tree_nodes (parent_key, position);
+            """
+        )
+
+    def transaction(self):
+        return self._connection
+
+    def clear(self) -> None:
+        self._connection.execute('DELETE FROM tree_nodes')
+
+    def count(self) -> int:
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM tree_nodes'
+        ).fetchone()[0]
+
+    def contains(self, node_key: Any) -> bool:
+        return (
+            self._connection.execute(
+                'SELECT 1 FROM tree_nodes WHERE node_key = ?', (node_key,)
+            ).fetchone()
+            is not None
+        )
+
+    def get(self, node_key: Any) -> Union[Tuple[dict, bool], None]:
+        row = self._connection.execute(
+            'SELECT fields, has_children_field FROM tree_nodes WHERE node_key = ?',
+            (node_key,),
+        ).fetchone()
+        if row is None:
+            return None
+        return json.loads(row[0]), bool(row[1])
+
+    def get_parent(self, node_key: Any) -> Any:
+        return self._connection.execute(
+            'SELECT parent_key FROM tree_nodes WHERE node_key = ?', (node_key,)
+        ).fetchone()[0]
+
+    def get_position(self, node_key: Any) -> int:
+        return self._connection.execute(
+            'SELECT position FROM tree_nodes WHERE node_key = ?', (node_key,)
+        ).fetchone()[0]
+
+    def count_children(self, parent_key: Any) -> int:
+        return self._connection.execute(
+            'SELECT COUNT(*) FROM tree_nodes WHERE parent_key IS ?',
+            (parent_key,),
+        ).fetchone()[0]
+
+    def get_child_keys(
+        self, parent_key: Any, offset: int = 0, limit: Optional[int] = None
+    ) -> List[Any]:
+        # 子节点位置连续编号，按位置区间查询可直接命中索引，无需OFFSET扫描
+        rows = self._connection.execute(
+            'SELECT node_key FROM tree_nodes '
+            'WHERE parent_key IS ? AND position >= ? '
+            'ORDER BY position LIMIT ?',
+            (parent_key, offset, -1 if limit is None else limit),
+        )
+        return [row[0] for row in rows]
+
+    def get_child_nodes(
+        self, parent_key: Any, offset: int, limit: int
+    ) -> List[Tuple[dict, bool]]:
+        """
+        查询子节点字段及各子节点是否存在后代节点
+        """
+
+        rows = self._connection.execute(
+            'SELECT fields, EXISTS ('
+            'SELECT 1 FROM tree_nodes AS child '
+            'WHERE child.parent_key = node.node_key'
+            ') FROM tree_nodes AS node '
+            'WHERE parent_key IS ? AND position >= ? '
+            'ORDER BY position LIMIT ?',
+            (parent_key, offset, limit),
+        )
+        return [(json.loads(row[0]), bool(row[1])) for row in rows]
+
+    def insert(
+        self,
+        node_key: Any,
+        parent_key: Any,
+        position: int,
+        fields: dict,
+        has_children_field: bool,
+    ) -> None:
+        self._connection.execute(
+            'UPDATE tree_nodes SET position = position + 1 '
+            'WHERE parent_key IS ? AND position >= ?',
+            (parent_key, position),
+        )
+        self._connection.execute(
+            'INSERT INTO tree_nodes VALUES (?, ?, ?, ?, ?)',
+            (
+                node_key,
+                parent_key,
+                position,
+                _dumps_fields(fields),
+                has_children_field,
+            ),
+        )
+
+    def insert_many(self, rows: List[tuple]) -> None:
+        """
+        批量追加节点，rows中各行的位置需已按最终结果编号
+        """
+
+        self._connection.executemany(
+            'INSERT INTO tree_nodes VALUES (?, ?, ?, ?, ?)',
+            [
+                (
+                    node_key,
+                    parent_key,
+                    position,
+                    _dumps_fields(fields),
+                    has_children_field,
+                )
+                for node_key, parent_key, position, fields, has_children_field in rows
+            ],
+        )
+
+    def set_fields(
+        self, node_key: Any, fields: dict, has_children_field: bool
+    ) -> None:
+        self._connection.execute(
+            'UPDATE tree_nodes SET fields = ?, has_children_field = ? '
+            'WHERE node_key = ?',
+            (_dumps_fields(fields), has_children_field, node_key),
+        )
+
+    def remove(self, node_key: Any) -> None:
+        """
+        移除单个节点并维护平级节点位置，其后代节点需事先移除
+        """
+
+        parent_key, position = self._connection.execute(
+            'SELECT parent_key, position FROM tree_nodes WHERE node_key = ?',
+            (node_key,),
+        ).fetchone()
+        self._connection.execute(
+            'DELETE FROM tree_nodes WHERE node_key = ?', (node_key,)
+        )
+        self._connection.execute(
+            'UPDATE tree_nodes SET position = position - 1 '
+            'WHERE parent_key IS ? AND position > ?',
+            (parent_key, position),
+        )
+
+    def remove_descendants(self, node_keys: List[Any]) -> None:
+        """
+        批量移除某一子树中除根节点外的全部节点，无需维护平级节点位置
+        """
+
+        self._connection.executemany(
+            'DELETE FROM tree_nodes WHERE node_key = ?',
+            [(node_key,) for node_key in node_keys],
+        )
+
+
+class LazyTreeSource:
+    """
+    在服务端保存完整的树形数据，按需分页提供指定节点的子节点，
+    适用于`AntdTree`等组件节点数量巨大、需逐层异步加载的场景，
+    存储后端可选择内存索引或SQLite数据库文件\n
+    Server-side tree data source serving paginated children on demand for
+    huge `AntdTree` datasets, backed by an in-memory index or an SQLite file.
+    """
+
+    def __init__(
+        self,
+        input_object: Union[dict, list, None] = None,
+        data_type: Literal['tree', 'menu'] = 'tree',
+        database: Optional[str] = None,
+    ) -> None:
+        """
+        构建树形数据源
+
+        Args:
+            input_object (Union[dict, list, None], default None): 原始的treeData，传入时将覆盖存储中的已有数据
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            database (Optional[str], default None): SQLite数据库文件路径，缺省时使用内存索引作为存储后端
+        """
+
+        # 检查input_object类型是否在list、dict、None中
+        assert input_object is None or isinstance(input_object, (list, dict)), (
+            'input_object类型需为列表、字典或None\nthe type of input_object must be list, dict or None'
+        )
+
+        self.data_type = data_type
+        self._store = (
+            _MemoryStore() if database is None else _SqliteStore(database)
+        )
+        self._lock = threading.RLock()
+
+        if input_object is not None:
+            self.load(input_object)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return self._store.count()
+
+    def __contains__(self, node_key: Any) -> bool:
+        with self._lock:
+            return self._store.contains(node_key)
+
+    def load(self, input_object: Union[dict, list]) -> None:
+        """
+        以treeData覆盖存储中的全部数据
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+        """
+
+        with self._lock, self._store.transaction():
+            self._store.clear()
+            self.__insert_subtrees(
+                None,
+                0,
+                [input_object]
+                if isinstance(input_object, dict)
+                else input_object,
+            )
+
+    def get_node(self, node_key: str) -> Union[dict, None]:
+        """
+        查询key值等于node_key的节点，不包含其子节点
+
+        Args:
+            node_key (str): 查询目标节点key值
+
+        Returns:
+            Union[dict, None]: 目标节点数据字典，不存在时返回None
+        """
+
+        with self._lock:
+            return self.__to_lazy_node(node_key)
+
+    def get_children(
+        self,
+        node_key: Union[str, None] = None,
+        page_size: int = 100,
+        cursor: Optional[int] = None,
+    ) -> Dict[str, Any]:
+        """
+        分页查询key值等于node_key的节点的子节点，返回的节点不包含其子节点，
+        'tree'类型数据会根据是否存在子节点补充isLeaf字段，以配合`AntdTree`的异步加载
+
+        Args:
+            node_key (Union[str, None], default None): 查询目标节点key值，为None时表示查询根层级节点
+            page_size (int, default 100): 每页节点数量
+            cursor (Optional[int], default None): 上一页查询返回的next_cursor，缺省时查询第一页
+
+        Returns:
+            Dict[str, Any]: 包含'nodes'（当前页节点列表）及'next_cursor'（下一页游标，已无更多节点时为None）的字典
+        """
+
+        assert page_size > 0, 'page_size需为正整数\npage_size must be positive'
+
+        offset = cursor or 0
+        with self._lock:
+            child_nodes = self._store.get_child_nodes(
+                node_key, offset, page_size + 1
+            )
+        has_more = len(child_nodes) > page_size
+        nodes = []
+        for node, has_child_nodes in child_nodes[:page_size]:
+            if self.data_type == 'tree':
+                node['isLeaf'] = not has_child_nodes
+            nodes.append(node)
+        return {
+            'nodes': nodes,
+            'next_cursor': offset + page_size if has_more else None,
+        }
+
+    def update_tree_node(
+        self,
+        node_key: str,
+        new_node: dict,
+        mode: Literal['replace', 'overlay'] = 'replace',
+    ) -> None:
+        """
+        对key值等于node_key的节点进行整体替换或增量更新
+
+        Args:
+            node_key (str): 更新目标节点key值
+            new_node (dict): 更新目标节点新数据字典，包含children字段时将一并替换其子树
+            mode (Literal['replace', 'overlay'], default 'replace'): 更新模式，'replace'表示整体替换，'overlay'表示增量更新
+        """
+
+        with self._lock, self._store.transaction():
+            stored = self._store.get(node_key)
+            if stored is None:
+                return
+
+            if (
+                mode == 'overlay'
+                and 'children' not in new_node
+                and get_node_key({**stored[0], **new_node}, self.data_type)
+                == node_key
+            ):
+                # 仅更新节点自身字段，子树保持不变
+                self._store.set_fields(
+                    node_key, {**stored[0], **new_node}, stored[1]
+                )
+                return
+
+            if mode == 'overlay':
+                new_node = {**self.__export_subtree(node_key), **new_node}
+
+            parent_key = self._store.get_parent(node_key)
+            position = self._store.get_position(node_key)
+            # 先完成新子树的key值校验再移除原子树，原子树中的key值允许被新子树复用，
+            # 校验失败时存储保持不变
+            descendant_keys = self.__collect_descendant_keys(node_key)
+            root_rows, descendant_rows = self.__build_rows(
+                parent_key,
+                position,
+                [new_node],
+                replaced_keys={node_key, *descendant_keys},
+            )
+            self.__remove_subtree(node_key, descendant_keys)
+            self.__write_rows(root_rows, descendant_rows)
+
+    def add_node_before(self, node_key: str, new_node: dict) -> None:
+        """
+        在key值等于node_key的节点之前插入平级新节点
+
+        Args:
+            node_key (str): 插入目标节点key值
+            new_node (dict): 要插入的新节点数据字典
+        """
+
+        with self._lock, self._store.transaction():
+            if not self._store.contains(node_key):
+                return
+            self.__insert_subtrees(
+                self._store.get_parent(node_key),
+                self._store.get_position(node_key),
+                [new_node],
+            )
+
+    def add_node_after(self, node_key: str, new_node: dict) -> None:
+        """
+        在key值等于node_key的节点之后插入平级新节点
+
+        Args:
+            node_key (str): 插入目标节点key值
+            new_node (dict): 要插入的新节点数据字典
+        """
+
+        with self._lock, self._store.transaction():
+            if not self._store.contains(node_key):
+                return
+            self.__insert_subtrees(
+                self._store.get_parent(node_key),
+                self._store.get_position(node_key) + 1,
+                [new_node],
+            )
+
+    def add_node_inside(
+        self, node_key: Union[str, None], new_node: dict
+    ) -> None:
+        """
+        在key值等于node_key的节点的子节点末尾插入新节点
+
+        Args:
+            node_key (Union[str, None]): 插入目标节点key值，为None时表示插入到根层级末尾
+            new_node (dict): 要插入的新节点数据字典
+        """
+
+        with self._lock, self._store.transaction():
+            if node_key is not None:
+                stored = self._store.get(node_key)
+                if stored is None:
+                    return
+                if not stored[1]:
+                    self._store.set_fields(node_key, stored[0], True)
+            self.__insert_subtrees(
+                node_key, self._store.count_children(node_key), [new_node]
+            )
+
+    def delete_node(
+        self, node_key: str, keep_empty_children_node: bool = True
+    ) -> None:
+        """
+        删除key值等于node_key的节点及其子树
+
+        Args:
+            node_key (str): 删除目标节点key值
+            keep_empty_children_node (bool, default True): 是否保留子节点被删除完后的空父节点
+        """
+
+        with self._lock, self._store.transaction():
+            if not self._store.contains(node_key):
+                return
+
+            while True:
+                parent_key = self._store.get_parent(node_key)
+                self.__remove_subtree(node_key)
+
+                # 父节点的子节点被删除完且无需保留时，继续向上删除父节点
+                if (
+                    keep_empty_children_node
+                    or parent_key is None
+                    or self._store.count_children(parent_key)
+                ):
+                    break
+                node_key = parent_key
+
+    def to_tree_data(
+        self, node_key: Union[str, None] = None
+    ) -> Union[list, dict, None]:
+        """
+        导出完整的treeData或以指定节点为根的子树
+
+        Args:
+            node_key (Union[str, None], default None): 导出子树的根节点key值，缺省时导出全部节点
+
+        Returns:
+            Union[list, dict, None]: 缺省node_key时返回根层级节点列表，否则返回子树根节点字典，节点不存在时返回None
+        """
+
+        with self._lock:
+            if node_key is None:
+                return [
+                    self.__export_subtree(root_key)
+                    for root_key in self._store.get_child_keys(None)
+                ]
+            if not self._store.contains(node_key):
+                return None
+            return self.__export_subtree(node_key)
+
+    def __to_lazy_node(self, node_key: Any) -> Union[dict, None]:
+        """
+        生成不含子节点的节点数据字典
+        """
+
+        stored = self._store.get(node_key)
+        if stored is None:
+            return None
+        node = stored[0]
+        if self.data_type == 'tree':
+            node['isLeaf'] = not self._store.count_children(node_key)
+        return node
+
+    def __export_subtree(self, node_key: Any) -> dict:
+        """
+        以显式栈导出以node_key为根的完整子树
+        """
+
+        fields, has_children_field = self._store.get(node_key)
+        root = fields
+        stack = [(node_key, root, has_children_field)]
+        while stack:
+            current_key, node, has_children_field = stack.pop()
+            child_keys = self._store.get_child_keys(current_key)
+            if has_children_field or child_keys:
+                node['children'] = []
+            for child_key in child_keys:
+                child_fields, child_has_children_field = self._store.get(
+                    child_key
+                )
+                node['children'].append(child_fields)
+                stack.append(
+                    (child_key, child_fields, child_has_children_field)
+                )
+        return root
+
+    def __insert_subtrees(
+        self, parent_key: Any, position: int, nodes: List[dict]
+    ) -> None:
+        """
+        将若干棵子树依次插入到父节点子节点列表的指定位置
+        """
+
+        self.__write_rows(*self.__build_rows(parent_key, position, nodes))
+
+    def __build_rows(
+        self,
+        parent_key: Any,
+        position: int,
+        nodes: List[dict],
+        replaced_keys: Union[set, frozenset] = frozenset(),
+    ) -> Tuple[List[tuple], List[tuple]]:
+        """
+        一次遍历完成key值校验及待写入节点的收集，存储中已存在的key值仅允许出现在replaced_keys中
+
+        Returns:
+            Tuple[List[tuple], List[tuple]]: (各子树根节点对应行, 后代节点对应行)，后代节点按深度优先顺序排列
+        """
+
+        root_rows = []
+        descendant_rows = []
+        new_keys = set()
+        stack = [
+            (node, parent_key, position + offset, True)
+            for offset, node in enumerate(nodes)
+        ]
+        stack.reverse()
+        while stack:
+            node, current_parent_key, current_position, is_root = stack.pop()
+            node_key = get_node_key(node, self.data_type)
+            assert node_key is not None, '节点缺少key值\nnode key is missing'
+            assert node_key not in new_keys and (
+                node_key in replaced_keys or not self._store.contains(node_key)
+            ), '检测到重复的节点key值 %s\nduplicate node key %s' % (
+                node_key,
+                node_key,
+            )
+            new_keys.add(node_key)
+            (root_rows if is_root else descendant_rows).append(
+                (
+                    node_key,
+                    current_parent_key,
+                    current_position,
+                    {
+                        field: value
+                        if isinstance(value, _ATOMIC_TYPES)
+                        else deepcopy(value)
+                        for field, value in node.items()
+                        if field != 'children'
+                    },
+                    'children' in node,
+                )
+            )
+            children = node.get('children') or []
+            for child_position in range(len(children) - 1, -1, -1):
+                stack.append(
+                    (children[child_position], node_key, child_position, False)
+                )
+
+        return root_rows, descendant_rows
+
+    def __write_rows(
+        self, root_rows: List[tuple], descendant_rows: List[tuple]
+    ) -> None:
+        """
+        写入__build_rows()收集的节点
+        """
+
+        # 各子树根节点需逐个插入并移动后续平级节点，后代节点的位置已按顺序编号，可直接批量追加
+        for row in root_rows:
+            self._store.insert(*row)
+        self._store.insert_many(descendant_rows)
+
+    def __collect_descendant_keys(self, node_key: Any) -> List[Any]:
+        """
+        以显式栈收集node_key的全部后代节点key值
+        """
+
+        descendant_keys = []
+        stack = [node_key]
+        while stack:
+            child_keys = self._store.get_child_keys(stack.pop())
+            descendant_keys.extend(child_keys)
+            stack.extend(child_keys)
+        return descendant_keys
+
+    def __remove_subtree(
+        self, node_key: Any, descendant_keys: Optional[List[Any]] = None
+    ) -> None:
+        """
+        移除以node_key为根的子树
+
+        Args:
+            node_key (Any): 子树根节点key值
+            descendant_keys (Optional[List[Any]], default None): 事先收集的后代节点key值，缺省时重新收集
+        """
+
+        if descendant_keys is None:
+            descendant_keys = self.__collect_descendant_keys(node_key)
+        self._store.remove_descendants(descendant_keys)
+        self._store.remove(node_key)
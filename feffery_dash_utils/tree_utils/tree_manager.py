@@ -1,5 +1,24 @@
-from copy import deepcopy
-from typing import Union, Literal
+import numpy as np
+import threading
+from collections import OrderedDict
+from dash import Patch
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Iterable,
+    Iterator,
+    List,
+    Literal,
+    Optional,
+    Set,
+    Tuple,
+    Union,
+)
+
+from .common import copy_tree, get_node_key
+from .flat_tree import FlatTree
+from .indexed_tree import IndexedTree
 
 
 class TreeManager:
@@ -16,6 +35,7 @@ class TreeManager:
         new_node: dict,
         mode: Literal['replace', 'overlay'] = 'replace',
         data_type: Literal['tree', 'menu'] = 'tree',
+        copy_strategy: Literal['deepcopy', 'path'] = 'deepcopy',
     ) -> Union[list, dict]:
         """
         对key值等于node_key的节点进行整体替换或增量更新
@@ -26,178 +46,236 @@ class TreeManager:
             new_node (dict): 更新目标节点新数据字典
             mode (Literal['replace', 'overlay'], default 'replace'): 更新模式，'replace'表示整体替换，'overlay'表示增量更新
             data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            copy_strategy (Literal['deepcopy', 'path'], default 'deepcopy'): 拷贝策略，'deepcopy'表示先对原始treeData整体深拷贝，'path'表示仅拷贝根节点至变更节点路径上的字典及列表，其余未变更的子树与原始treeData共享
 
         Returns:
             list: 完成更新后的treeData
         """
 
-        return cls.__update_tree_node(
-            deepcopy(input_object), node_key, new_node, mode, data_type
+        if copy_strategy == 'deepcopy':
+            input_object = copy_tree(input_object)
+
+        return cls.__rebuild_node_paths(
+            input_object,
+            cls.__find_node_paths(input_object, node_key, data_type),
+            lambda node, is_target, children_changed: [
+                (new_node if mode == 'replace' else {**node, **new_node})
+                if is_target
+                else node
+            ],
         )
 
     @classmethod
-    def __update_tree_node(
+    def add_node_before(
         cls,
         input_object: Union[dict, list],
         node_key: str,
         new_node: dict,
-        mode: Literal['replace', 'overlay'] = 'replace',
         data_type: Literal['tree', 'menu'] = 'tree',
+        copy_strategy: Literal['deepcopy', 'path'] = 'deepcopy',
     ) -> Union[list, dict]:
         """
-        对应update_tree_node()的私有方法
-        """
+        在key值等于node_key的节点之前插入平级新节点
 
-        # 检查input_object类型是否在list、dict中
-        assert isinstance(input_object, (list, dict)), (
-            'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
-        )
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_key (str): 插入目标节点key值
+            new_node (dict): 要插入的新节点数据字典
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            copy_strategy (Literal['deepcopy', 'path'], default 'deepcopy'): 拷贝策略，'deepcopy'表示先对原始treeData整体深拷贝，'path'表示仅拷贝根节点至变更节点路径上的字典及列表，其余未变更的子树与原始treeData共享
 
-        if isinstance(input_object, list):
-            return [
-                cls.__update_tree_node(
-                    node, node_key, new_node, mode, data_type
-                )
-                for node in input_object
-            ]
+        Returns:
+            dict: 完成插入后的treeData
+        """
 
-        elif isinstance(input_object, dict):
-            if data_type == 'menu':
-                if input_object.get('props', {}).get('key') == node_key:
-                    if mode == 'replace':
-                        return new_node
-                    else:
-                        return {**input_object, **new_node}
-                else:
-                    if input_object.get('children'):
-                        input_object['children'] = [
-                            cls.__update_tree_node(
-                                child, node_key, new_node, mode, data_type
-                            )
-                            for child in input_object['children']
-                        ]
-                    return input_object
+        if copy_strategy == 'deepcopy':
+            input_object = copy_tree(input_object)
 
-            else:
-                if input_object.get('key') == node_key:
-                    if mode == 'replace':
-                        return new_node
-                    else:
-                        return {**input_object, **new_node}
-                else:
-                    if input_object.get('children'):
-                        input_object['children'] = [
-                            cls.__update_tree_node(
-                                child, node_key, new_node, mode, data_type
-                            )
-                            for child in input_object['children']
-                        ]
-                    return input_object
+        return cls.__rebuild_node_paths(
+            input_object,
+            cls.__find_node_paths(
+                input_object, node_key, data_type, first_per_layer=True
+            ),
+            lambda node, is_target, children_changed: (
+                [new_node, node] if is_target else [node]
+            ),
+        )
 
     @classmethod
-    def add_node_before(
+    def add_node_after(
         cls,
         input_object: Union[dict, list],
         node_key: str,
         new_node: dict,
         data_type: Literal['tree', 'menu'] = 'tree',
+        copy_strategy: Literal['deepcopy', 'path'] = 'deepcopy',
     ) -> Union[list, dict]:
         """
-        在key值等于node_key的节点之前插入平级新节点
+        在key值等于node_key的节点之后插入平级新节点
 
         Args:
             input_object (Union[dict, list]): 原始的treeData
             node_key (str): 插入目标节点key值
             new_node (dict): 要插入的新节点数据字典
             data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            copy_strategy (Literal['deepcopy', 'path'], default 'deepcopy'): 拷贝策略，'deepcopy'表示先对原始treeData整体深拷贝，'path'表示仅拷贝根节点至变更节点路径上的字典及列表，其余未变更的子树与原始treeData共享
 
         Returns:
             dict: 完成插入后的treeData
         """
 
-        return cls.__add_node_before(
-            deepcopy(input_object), node_key, new_node, data_type
+        if copy_strategy == 'deepcopy':
+            input_object = copy_tree(input_object)
+
+        return cls.__rebuild_node_paths(
+            input_object,
+            cls.__find_node_paths(
+                input_object, node_key, data_type, first_per_layer=True
+            ),
+            lambda node, is_target, children_changed: (
+                [node, new_node] if is_target else [node]
+            ),
         )
 
     @classmethod
-    def __add_node_before(
+    def delete_node(
         cls,
         input_object: Union[dict, list],
         node_key: str,
-        new_node: dict,
         data_type: Literal['tree', 'menu'] = 'tree',
+        keep_empty_children_node: bool = True,
+        copy_strategy: Literal['deepcopy', 'path'] = 'deepcopy',
     ) -> Union[list, dict]:
         """
-        对应add_node_before()的私有方法
+        删除key值等于node_key的节点
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_key (str): 删除目标节点key值
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            keep_empty_children_node (bool, default True): 是否保留children字段为空列表的节点
+            copy_strategy (Literal['deepcopy', 'path'], default 'deepcopy'): 拷贝策略，'deepcopy'表示先对原始treeData整体深拷贝，'path'表示仅拷贝根节点至变更节点路径上的字典及列表，其余未变更的子树与原始treeData共享
+
+        Returns:
+            dict: 完成删除后的treeData
         """
 
-        # 检查input_object类型是否在list、dict中
-        assert isinstance(input_object, (list, dict)), (
-            'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
-        )
+        if copy_strategy == 'deepcopy':
+            input_object = copy_tree(input_object)
 
-        if isinstance(input_object, list):
-            if data_type == 'menu':
-                current_layer_keys = [
-                    node.get('props', {}).get('key') for node in input_object
-                ]
-            else:
-                current_layer_keys = [node.get('key') for node in input_object]
-            if node_key in current_layer_keys:
-                return [
-                    *input_object[: current_layer_keys.index(node_key)],
-                    new_node,
-                    *input_object[current_layer_keys.index(node_key) :],
-                ]
-            else:
-                return [
-                    cls.__add_node_before(node, node_key, new_node, data_type)
-                    for node in input_object
-                ]
+        # 单个根节点字典不做删除处理
+        if isinstance(input_object, dict):
+            return input_object
 
-        elif isinstance(input_object, dict):
-            if input_object.get('children'):
-                input_object['children'] = cls.__add_node_before(
-                    input_object['children'], node_key, new_node, data_type
+        return cls.__rebuild_node_paths(
+            input_object,
+            cls.__find_node_paths(input_object, node_key, data_type),
+            lambda node, is_target, children_changed: (
+                []
+                if is_target
+                or (
+                    children_changed
+                    and not keep_empty_children_node
+                    and not node['children']
                 )
-
-        return input_object
+                else [node]
+            ),
+        )
 
     @classmethod
-    def add_node_after(
+    def move_node(
         cls,
         input_object: Union[dict, list],
         node_key: str,
-        new_node: dict,
+        target_key: str,
+        position: Literal['before', 'after', 'inside'] = 'after',
         data_type: Literal['tree', 'menu'] = 'tree',
+        copy_strategy: Literal['deepcopy', 'path'] = 'deepcopy',
     ) -> Union[list, dict]:
         """
-        在key值等于node_key的节点之后插入平级新节点
+        将key值等于node_key的节点连同其子树移动到key值等于target_key的节点处，
+        待移动节点与目标节点在同一次遍历中完成定位
 
         Args:
             input_object (Union[dict, list]): 原始的treeData
-            node_key (str): 插入目标节点key值
-            new_node (dict): 要插入的新节点数据字典
+            node_key (str): 待移动节点key值
+            target_key (str): 移动目标节点key值
+            position (Literal['before', 'after', 'inside'], default 'after'): 移动方式，'before'、'after'表示移动为目标节点之前、之后的平级节点，'inside'表示移动为目标节点的最后一个子节点
             data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            copy_strategy (Literal['deepcopy', 'path'], default 'deepcopy'): 拷贝策略，'deepcopy'表示先对原始treeData整体深拷贝，'path'表示仅拷贝根节点至变更节点路径上的字典及列表，其余未变更的子树与原始treeData共享
 
         Returns:
-            dict: 完成插入后的treeData
+            Union[list, dict]: 完成移动后的treeData
         """
 
-        return cls.__add_node_after(
-            deepcopy(input_object), node_key, new_node, data_type
+        if copy_strategy == 'deepcopy':
+            input_object = copy_tree(input_object)
+
+        node_paths = cls.__find_first_node_paths(
+            input_object, [node_key, target_key], data_type
+        )
+        source_path = node_paths.get(node_key)
+        target_path = node_paths.get(target_key)
+        if source_path is None or target_path is None or node_key == target_key:
+            return input_object
+
+        assert target_path[: len(source_path)] != source_path, (
+            '无法将节点移动到其自身的子树中 %s\ncan not move node %s into its own subtree'
+            % (node_key, node_key)
+        )
+        assert not (
+            isinstance(input_object, dict)
+            and len(target_path) == 1
+            and position != 'inside'
+        ), (
+            '单个根节点字典不存在平级节点\nthe single root node can not have siblings'
+        )
+
+        # 待移动节点的子树不受本次移动影响，可直接复用
+        moved_node = input_object if isinstance(input_object, dict) else None
+        for depth, index in enumerate(source_path):
+            if moved_node is None:
+                moved_node = input_object[index]
+            elif depth > 0:
+                moved_node = moved_node['children'][index]
+
+        def emit(node: dict, is_target: bool, children_changed: bool):
+            if not is_target:
+                return [node]
+            if get_node_key(node, data_type) == node_key:
+                return []
+            if position == 'before':
+                return [moved_node, node]
+            if position == 'after':
+                return [node, moved_node]
+            return [
+                {
+                    **node,
+                    'children': [*(node.get('children') or []), moved_node],
+                }
+            ]
+
+        return cls.__rebuild_node_paths(
+            input_object, [source_path, target_path], emit
         )
 
     @classmethod
-    def __add_node_after(
+    def get_node(
         cls,
         input_object: Union[dict, list],
         node_key: str,
-        new_node: dict,
         data_type: Literal['tree', 'menu'] = 'tree',
-    ) -> Union[list, dict]:
+    ) -> Union[list, dict, None]:
         """
-        对应add_node_after()的私有方法
+        查询key值等于node_key的节点
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_key (str): 查询目标节点key值
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            dict: 目标节点数据字典
         """
 
         # 检查input_object类型是否在list、dict中
@@ -205,43 +283,272 @@ class TreeManager:
             'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
         )
 
-        if isinstance(input_object, list):
-            if data_type == 'menu':
-                current_layer_keys = [
-                    node.get('props', {}).get('key') for node in input_object
-                ]
+        # 以迭代器栈按先序遍历，依次检查各节点
+        is_menu = data_type == 'menu'
+        stack = [
+            iter(
+                input_object
+                if isinstance(input_object, list)
+                else [input_object]
+            )
+        ]
+        while stack:
+            for node in stack[-1]:
+                if node_key == (
+                    node.get('props', {}).get('key')
+                    if is_menu
+                    else node.get('key')
+                ):
+                    return node
+                # 存在子节点时优先深入检查
+                if node.get('children'):
+                    stack.append(iter(node['children']))
+                    break
             else:
-                current_layer_keys = [node.get('key') for node in input_object]
-            if node_key in current_layer_keys:
-                return [
-                    *input_object[: current_layer_keys.index(node_key) + 1],
-                    new_node,
-                    *input_object[current_layer_keys.index(node_key) + 1 :],
-                ]
+                stack.pop()
+
+        # 若未找到则返回None
+        return None
+
+    @classmethod
+    def get_nodes(
+        cls,
+        input_object: Union[dict, list],
+        node_keys: Iterable[str],
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Dict[Any, Union[dict, None]]:
+        """
+        在一次遍历中批量查询key值在node_keys中的节点，全部命中后立即结束遍历
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_keys (Iterable[str]): 查询目标节点key值
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            Dict[Any, Union[dict, None]]: 各目标节点key值对应的节点数据字典，未找到的节点对应None
+        """
+
+        node_keys = list(node_keys)
+        remaining_keys = set(node_keys)
+        found_nodes = {}
+
+        if remaining_keys:
+            for node, _ in cls.__walk_nodes(input_object):
+                node_key = get_node_key(node, data_type)
+                if node_key in remaining_keys:
+                    found_nodes[node_key] = node
+                    remaining_keys.remove(node_key)
+                    if not remaining_keys:
+                        break
+
+        return {node_key: found_nodes.get(node_key) for node_key in node_keys}
+
+    @classmethod
+    def get_node_path(
+        cls,
+        input_object: Union[dict, list],
+        node_key: str,
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Union[List[dict], None]:
+        """
+        查询自根节点至key值等于node_key的节点的祖先节点链
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_key (str): 查询目标节点key值
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            Union[List[dict], None]: 由根节点至目标节点（含）依次排列的节点列表，未找到时返回None
+        """
+
+        for node, ancestors in cls.__walk_nodes(input_object):
+            if get_node_key(node, data_type) == node_key:
+                return [*ancestors, node]
+
+        return None
+
+    # 最近参与筛选的treeData对应的扁平列式结构缓存，
+    # (id(treeData), data_type) -> (treeData, FlatTree)，多个线程并发筛选时需持有锁访问
+    __flat_tree_cache = OrderedDict()
+    __flat_tree_cache_size = 8
+    __flat_tree_cache_lock = threading.Lock()
+
+    @classmethod
+    def filter(
+        cls,
+        input_object: Union[dict, list],
+        condition: Union[str, Callable[[dict], bool]],
+        keep_ancestors: bool = True,
+        keep_descendants: bool = False,
+        case_sensitive: bool = False,
+        data_type: Literal['tree', 'menu'] = 'tree',
+        use_cache: bool = False,
+    ) -> Tuple[Union[list, dict, None], List[Any]]:
+        """
+        按标题文本或判断函数筛选节点，生成剪枝后的treeData及需要展开的节点key值，
+        适用于`AntdTree`搜索框等高频筛选场景
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            condition (Union[str, Callable[[dict], bool]]): 筛选条件，字符串表示查找标题中包含该文本的节点，
+                函数表示接收节点（不含children字段）并返回是否命中的判断函数
+            keep_ancestors (bool, default True): 是否保留命中节点的全部祖先节点
+            keep_descendants (bool, default False): 是否保留命中节点的全部后代节点
+            case_sensitive (bool, default False): 按标题文本筛选时是否区分大小写
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            use_cache (bool, default False): 是否复用同一treeData对象此前构建的扁平列式结构及小写标题索引，
+                缓存按对象身份匹配，仅适用于保存在服务端并被反复筛选的同一treeData对象，
+                回调中经State等传入的treeData每次均为新对象，无法命中缓存；
+                开启后对treeData进行原地修改时需临时传入False
+
+        Returns:
+            Tuple[Union[list, dict, None], List[Any]]: 剪枝后的treeData，以及命中节点的全部祖先节点key值（可用作expandedKeys）
+        """
+
+        flat_tree = cls.__get_flat_tree(input_object, data_type, use_cache)
+
+        if isinstance(condition, str):
+            mask = flat_tree.match_titles(condition, case_sensitive)
+        else:
+            mask = flat_tree.match_nodes(condition)
+
+        expanded_mask = flat_tree.ancestors_of(mask)
+        if keep_descendants:
+            mask = flat_tree.with_descendants(mask)
+        if keep_ancestors:
+            mask = mask | expanded_mask
+
+        expanded_keys = [
+            node_key
+            for node_key in flat_tree.keys_of(expanded_mask)
+            if node_key is not None
+        ]
+        return flat_tree.to_tree_data(mask), expanded_keys
+
+    @classmethod
+    def update_tree_node_patch(
+        cls,
+        input_object: Union[dict, list],
+        node_key: str,
+        new_node: dict,
+        mode: Literal['replace', 'overlay'] = 'replace',
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Patch:
+        """
+        对应update_tree_node()，返回仅作用于目标节点位置的`Patch`对象，用于回调函数中的局部更新
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_key (str): 更新目标节点key值
+            new_node (dict): 更新目标节点新数据字典
+            mode (Literal['replace', 'overlay'], default 'replace'): 更新模式，'replace'表示整体替换，'overlay'表示增量更新
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            Patch: 完成更新所需的Patch对象
+        """
+
+        patch = Patch()
+        is_single_root = isinstance(input_object, dict)
+
+        for node_path in cls.__find_node_paths(
+            input_object, node_key, data_type
+        ):
+            if mode == 'overlay':
+                cls.__get_patch_location(
+                    patch, node_path, is_single_root
+                ).update(new_node)
+            elif is_single_root and len(node_path) == 1:
+                # 单个根节点字典无法整体赋值，改为逐字段删除及合并
+                for key in input_object:
+                    if key not in new_node:
+                        del patch[key]
+                patch.update(new_node)
             else:
-                return [
-                    cls.__add_node_after(node, node_key, new_node, data_type)
-                    for node in input_object
-                ]
+                cls.__get_patch_layer(patch, node_path, is_single_root)[
+                    node_path[-1]
+                ] = new_node
 
-        elif isinstance(input_object, dict):
-            if input_object.get('children'):
-                input_object['children'] = cls.__add_node_after(
-                    input_object['children'], node_key, new_node, data_type
-                )
+        return patch
+
+    @classmethod
+    def add_node_before_patch(
+        cls,
+        input_object: Union[dict, list],
+        node_key: str,
+        new_node: dict,
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Patch:
+        """
+        对应add_node_before()，返回仅作用于目标节点所在层级的`Patch`对象，用于回调函数中的局部更新
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_key (str): 插入目标节点key值
+            new_node (dict): 要插入的新节点数据字典
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            Patch: 完成插入所需的Patch对象
+        """
+
+        patch = Patch()
+        is_single_root = isinstance(input_object, dict)
+
+        for node_path in cls.__find_node_paths(
+            input_object, node_key, data_type, first_per_layer=True
+        ):
+            cls.__get_patch_layer(patch, node_path, is_single_root).insert(
+                node_path[-1], new_node
+            )
 
-        return input_object
+        return patch
 
     @classmethod
-    def delete_node(
+    def add_node_after_patch(
+        cls,
+        input_object: Union[dict, list],
+        node_key: str,
+        new_node: dict,
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Patch:
+        """
+        对应add_node_after()，返回仅作用于目标节点所在层级的`Patch`对象，用于回调函数中的局部更新
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_key (str): 插入目标节点key值
+            new_node (dict): 要插入的新节点数据字典
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            Patch: 完成插入所需的Patch对象
+        """
+
+        patch = Patch()
+        is_single_root = isinstance(input_object, dict)
+
+        for node_path in cls.__find_node_paths(
+            input_object, node_key, data_type, first_per_layer=True
+        ):
+            cls.__get_patch_layer(patch, node_path, is_single_root).insert(
+                node_path[-1] + 1, new_node
+            )
+
+        return patch
+
+    @classmethod
+    def delete_node_patch(
         cls,
         input_object: Union[dict, list],
         node_key: str,
         data_type: Literal['tree', 'menu'] = 'tree',
         keep_empty_children_node: bool = True,
-    ) -> Union[list, dict]:
+    ) -> Patch:
         """
-        删除key值等于node_key的节点
+        对应delete_node()，返回仅作用于被删除节点位置的`Patch`对象，用于回调函数中的局部更新
 
         Args:
             input_object (Union[dict, list]): 原始的treeData
@@ -250,26 +557,496 @@ class TreeManager:
             keep_empty_children_node (bool, default True): 是否保留children字段为空列表的节点
 
         Returns:
-            dict: 完成删除后的treeData
+            Patch: 完成删除所需的Patch对象
+        """
+
+        patch = Patch()
+
+        # 与delete_node()保持一致，单个根节点字典不做删除处理
+        if isinstance(input_object, dict):
+            return patch
+
+        node_paths = cls.__find_node_paths(input_object, node_key, data_type)
+        removed_paths = set(node_paths)
+
+        if not keep_empty_children_node and node_paths:
+            # 自深向浅检查子节点被全部删除的节点，将其一并删除
+            layer_removed: Dict[Tuple[int, ...], Set[int]] = {}
+            for node_path in node_paths:
+                layer_removed.setdefault(node_path[:-1], set()).add(
+                    node_path[-1]
+                )
+            for depth in range(max(map(len, node_paths)) - 1, 0, -1):
+                for prefix in [
+                    prefix for prefix in layer_removed if len(prefix) == depth
+                ]:
+                    layer = input_object
+                    for index in prefix:
+                        layer = layer[index]['children']
+                    if len(layer_removed[prefix]) == len(layer):
+                        removed_paths.add(prefix)
+                        layer_removed.setdefault(prefix[:-1], set()).add(
+                            prefix[-1]
+                        )
+
+        # 仅删除最上层的被删除节点，先深后浅、同层级内由后向前删除，避免下标偏移
+        for node_path in sorted(
+            (
+                node_path
+                for node_path in removed_paths
+                if not any(
+                    node_path[:depth] in removed_paths
+                    for depth in range(1, len(node_path))
+                )
+            ),
+            key=lambda node_path: (len(node_path), node_path),
+            reverse=True,
+        ):
+            del cls.__get_patch_layer(patch, node_path, False)[node_path[-1]]
+
+        return patch
+
+    @classmethod
+    def apply(
+        cls,
+        input_object: Union[dict, list],
+        ops: List[dict],
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Union[list, dict, None]:
+        """
+        基于key值索引批量执行多个节点操作，整个过程仅进行一次深拷贝及一次遍历，要求各节点key值唯一
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            ops (List[dict]): 按顺序执行的操作列表，每个操作字典通过type字段指定操作类型，
+                可选的有'update_tree_node'、'add_node_before'、'add_node_after'、'add_node_inside'、'delete_node'、'move_node'，
+                其余字段对应IndexedTree同名方法的参数，如：
+                {'type': 'update_tree_node', 'node_key': '节点1', 'new_node': {'title': '新标题'}, 'mode': 'overlay'}
+                {'type': 'move_node', 'node_key': '节点1', 'target_key': '节点2', 'position': 'inside'}
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            Union[list, dict, None]: 完成全部操作后的treeData
+        """
+
+        indexed_tree = IndexedTree(input_object, data_type)
+        indexed_tree.apply(ops)
+
+        # 实例仅在本次调用内使用，直接导出内部数据无需再次拷贝
+        return indexed_tree.to_tree_data(copy=False)
+
+    @classmethod
+    def diff(
+        cls,
+        old_object: Union[dict, list],
+        new_object: Union[dict, list],
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> List[dict]:
+        """
+        基于节点key值匹配新旧两份treeData，计算由旧treeData变换为新treeData所需的最少节点操作，
+        要求两份treeData中各节点均具有唯一的key值
+
+        Args:
+            old_object (Union[dict, list]): 旧的treeData
+            new_object (Union[dict, list]): 新的treeData
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            List[dict]: 与apply()参数ops格式一致的操作列表，依次包含节点的新增、移动、删除及字段更新操作
+        """
+
+        old_index = cls.__index_node_keys(old_object, data_type)
+        new_index = cls.__index_node_keys(new_object, data_type)
+
+        # 自底向上标记新treeData中整棵子树均为新增节点的节点，此类子树可整体插入
+        fully_new: Dict[Any, bool] = {}
+        for node_key in reversed(list(new_index)):
+            node = new_index[node_key][0]
+            fully_new[node_key] = node_key not in old_index and all(
+                fully_new[get_node_key(child, data_type)]
+                for child in node.get('children') or []
+            )
+
+        ops = []
+
+        # 按新treeData的先序依次对齐各层级子节点，父节点均先于其子节点完成对齐
+        for parent_key in [None, *new_index]:
+            if parent_key is None:
+                children = (
+                    new_object if isinstance(new_object, list) else [new_object]
+                )
+            elif fully_new[parent_key]:
+                # 已随祖先节点整体插入
+                continue
+            else:
+                children = new_index[parent_key][0].get('children') or []
+
+            child_keys = [get_node_key(child, data_type) for child in children]
+
+            # 原本即位于当前父节点下且相对顺序构成最长递增子序列的节点保持不动
+            stable_keys = cls.__longest_increasing_keys(
+                [
+                    (child_key, old_index[child_key][2])
+                    for child_key in child_keys
+                    if child_key in old_index
+                    and old_index[child_key][1] == parent_key
+                ]
+            )
+            first_stable_key = next(
+                (
+                    child_key
+                    for child_key in child_keys
+                    if child_key in stable_keys
+                ),
+                None,
+            )
+
+            for index, (child_key, child) in enumerate(
+                zip(child_keys, children)
+            ):
+                if child_key in stable_keys:
+                    continue
+
+                # 以前一个平级节点、首个保持不动的平级节点或父节点作为放置锚点
+                if index > 0:
+                    target_key, position = child_keys[index - 1], 'after'
+                elif first_stable_key is not None:
+                    target_key, position = first_stable_key, 'before'
+                else:
+                    target_key, position = parent_key, 'inside'
+
+                if child_key in old_index:
+                    ops.append(
+                        {
+                            'type': 'move_node',
+                            'node_key': child_key,
+                            'target_key': target_key,
+                            'position': position,
+                        }
+                    )
+                else:
+                    if fully_new[child_key]:
+                        new_node = copy_tree(child)
+                    else:
+                        # 子树中存在已有节点时仅插入当前节点，子节点后续逐一对齐
+                        new_node = {
+                            field: value
+                            for field, value in child.items()
+                            if field != 'children'
+                        }
+                        new_node['children'] = []
+                    ops.append(
+                        {
+                            'type': 'add_node_%s' % position,
+                            'node_key': target_key,
+                            'new_node': new_node,
+                        }
+                    )
+
+        # 删除不再存在的节点，其父节点同样被删除时随父节点一并删除
+        for node_key, (_, parent_key, _) in old_index.items():
+            if node_key not in new_index and (
+                parent_key is None or parent_key in new_index
+            ):
+                ops.append({'type': 'delete_node', 'node_key': node_key})
+
+        # 更新保留节点中发生变化的字段
+        for node_key, (new_node, _, _) in new_index.items():
+            if node_key not in old_index:
+                continue
+            old_node = old_index[node_key][0]
+            changed_fields = {
+                field: value
+                for field, value in new_node.items()
+                if field != 'children'
+                and (field not in old_node or old_node[field] != value)
+            }
+            removed_fields = [
+                field
+                for field in old_node
+                if field != 'children' and field not in new_node
+            ]
+            # 子节点已完成对齐，仅需同步children字段本身的有无
+            if 'children' in new_node and 'children' not in old_node:
+                if not new_node['children']:
+                    changed_fields['children'] = []
+            elif 'children' in old_node and 'children' not in new_node:
+                removed_fields.append('children')
+
+            if changed_fields or removed_fields:
+                op = {
+                    'type': 'update_tree_node',
+                    'node_key': node_key,
+                    'new_node': changed_fields,
+                    'mode': 'overlay',
+                }
+                if removed_fields:
+                    op['remove_fields'] = removed_fields
+                ops.append(op)
+
+        return ops
+
+    @classmethod
+    def apply_diff(
+        cls,
+        input_object: Union[dict, list],
+        ops: List[dict],
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Union[list, dict, None]:
+        """
+        将diff()计算得到的操作列表应用到treeData上
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            ops (List[dict]): diff()计算得到的操作列表
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            Union[list, dict, None]: 应用操作后的treeData
+        """
+
+        return cls.apply(input_object, ops, data_type)
+
+    @classmethod
+    def from_flat(
+        cls,
+        rows: Union[Iterable[dict], np.ndarray],
+        key: str = 'id',
+        parent: str = 'parent_id',
+        title: str = 'title',
+        order: Union[str, Callable[[dict], Any], None] = None,
+        data_type: Literal['tree', 'menu'] = 'tree',
+        root_parent: Any = None,
+        orphans: Literal['raise', 'root', 'drop'] = 'raise',
+    ) -> list:
         """
+        基于扁平的(key值, 父节点key值, ...)行数据在线性时间内构建treeData
+
+        Args:
+            rows (Union[Iterable[dict], np.ndarray]): 行数据，可以是字典列表、字典迭代器或numpy结构化数组
+            key (str, default 'id'): 行数据中作为节点key值的字段
+            parent (str, default 'parent_id'): 行数据中作为父节点key值的字段
+            title (str, default 'title'): 行数据中作为节点标题的字段
+            order (Union[str, Callable[[dict], Any], None], default None): 平级节点的排序字段或排序函数，缺省时保持行数据中的先后顺序
+            data_type (Literal['tree', 'menu'], default 'tree'): 输出数据类型，'tree'表示树形数据，'menu'表示菜单数据，
+                'menu'类型数据优先使用行数据中的component字段，缺省时有子节点的为'SubMenu'，否则为'Item'
+            root_parent (Any, default None): 父节点key值为None或等于该值的行视作根层级节点
+            orphans (Literal['raise', 'root', 'drop'], default 'raise'): 父节点不存在的行的处理方式，
+                'raise'表示抛出异常，'root'表示视作根层级节点，'drop'表示连同其子树一并丢弃
+
+        Returns:
+            list: 构建得到的treeData，行数据中的其余字段会保留在节点中，
+                以字段名设置order时该字段仅用于排序，不保留在节点中；无子节点的节点不含children字段
+        """
+
+        if isinstance(rows, np.ndarray) and rows.dtype.names:
+            field_names = rows.dtype.names
+            # 整体转换为Python原生类型，避免逐个访问numpy标量
+            rows = (dict(zip(field_names, values)) for values in rows.tolist())
 
-        return cls.__delete_node(
-            deepcopy(input_object),
-            node_key,
-            data_type,
-            keep_empty_children_node,
+        # 行数据中不保留到节点中的结构字段
+        structural_fields = {parent, key, title}
+        if isinstance(order, str):
+            structural_fields.add(order)
+            order_field = order
+            order = lambda row: row[order_field]  # noqa: E731
+
+        # key值 -> 节点数据字典
+        nodes = {}
+        # 父节点key值 -> 子节点数据字典列表，设置了order时为(排序值, 节点数据字典)列表
+        children_of = {}
+        for row in rows:
+            node_key = row[key]
+            assert node_key not in nodes, (
+                '检测到重复的节点key值 %s\nduplicate node key %s'
+                % (node_key, node_key)
+            )
+            if data_type == 'menu':
+                props = {'key': node_key}
+                if title in row:
+                    props['title'] = row[title]
+                props.update(
+                    (field, value)
+                    for field, value in row.items()
+                    if field not in structural_fields
+                )
+                node = {
+                    'component': props.pop('component', None),
+                    'props': props,
+                }
+            else:
+                # 整体复制行数据后再处理结构字段，避免逐个字段的Python层面循环
+                node = dict(row)
+                for field in structural_fields:
+                    node.pop(field, None)
+                node['key'] = node_key
+                if title in row:
+                    node['title'] = row[title]
+            nodes[node_key] = node
+
+            parent_key = row.get(parent)
+            if parent_key is None or parent_key == root_parent:
+                parent_key = None
+            children = children_of.get(parent_key)
+            if children is None:
+                children = children_of[parent_key] = []
+            children.append(node if order is None else (order(row), node))
+
+        roots = []
+        dropped_nodes = []
+        for parent_key, children in children_of.items():
+            if order is not None:
+                children.sort(key=lambda item: item[0])
+                children = [node for _, node in children]
+            if parent_key is None:
+                roots[:0] = children
+            elif parent_key in nodes:
+                nodes[parent_key]['children'] = children
+            elif orphans == 'root':
+                roots.extend(children)
+            else:
+                assert orphans == 'drop', (
+                    '父节点 %s 不存在\nparent node %s does not exist'
+                    % (parent_key, parent_key)
+                )
+                dropped_nodes.extend(children)
+
+        # 自根层级节点及被丢弃节点出发均无法到达的节点必然处于循环引用中
+        reachable_count = 0
+        stack = list(roots)
+        while stack:
+            node = stack.pop()
+            reachable_count += 1
+            stack.extend(node.get('children') or [])
+            if data_type == 'menu' and node['component'] is None:
+                node['component'] = (
+                    'SubMenu' if node.get('children') else 'Item'
+                )
+        stack = dropped_nodes
+        while stack:
+            reachable_count += 1
+            stack.extend(stack.pop().get('children') or [])
+        assert reachable_count == len(nodes), (
+            '检测到节点间的循环引用\ncyclic parent references detected'
         )
 
+        return roots
+
     @classmethod
-    def __delete_node(
+    def to_flat(
         cls,
         input_object: Union[dict, list],
-        node_key: str,
+        key: str = 'id',
+        parent: str = 'parent_id',
+        title: str = 'title',
+        order: Optional[str] = None,
         data_type: Literal['tree', 'menu'] = 'tree',
-        keep_empty_children_node: bool = True,
-    ) -> Union[list, dict]:
+    ) -> List[dict]:
         """
-        对应delete_node()的私有方法
+        将treeData按先序展开为扁平的行数据，from_flat()的逆操作，
+        以相同参数调用from_flat()可还原treeData，唯一的例外是叶子节点显式的空children列表不会保留
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            key (str, default 'id'): 行数据中存放节点key值的字段
+            parent (str, default 'parent_id'): 行数据中存放父节点key值的字段，根层级节点对应None
+            title (str, default 'title'): 行数据中存放节点标题的字段
+            order (Optional[str], default None): 若设置，则将节点在平级节点中的下标写入行数据的该字段
+            data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+
+        Returns:
+            List[dict]: 行数据列表，节点的其余字段会保留在行数据中，
+                节点字段与key、parent、order等行数据结构字段同名时抛出异常，避免被静默覆盖
+        """
+
+        # 行数据中由结构信息占用的字段
+        structural_fields = {key, parent}
+        if order is not None:
+            structural_fields.add(order)
+        if title != 'title':
+            structural_fields.add(title)
+        if data_type == 'menu':
+            structural_fields.add('component')
+
+        rows = []
+        stack = [
+            (None, position, node)
+            for position, node in enumerate(
+                [input_object]
+                if isinstance(input_object, dict)
+                else input_object
+            )
+        ]
+        stack.reverse()
+        while stack:
+            parent_key, position, node = stack.pop()
+            node_key = get_node_key(node, data_type)
+            row = {key: node_key, parent: parent_key}
+            if order is not None:
+                row[order] = position
+            if data_type == 'menu':
+                row['component'] = node.get('component')
+                fields = node.get('props') or {}
+            else:
+                fields = node
+            for field, value in fields.items():
+                if field == 'title':
+                    row[title] = value
+                elif field not in ('key', 'children'):
+                    assert field not in structural_fields, (
+                        '节点 %s 的字段 %s 与行数据结构字段冲突\n'
+                        'field %s of node %s conflicts with a structural field'
+                        % (node_key, field, field, node_key)
+                    )
+                    row[field] = value
+            rows.append(row)
+
+            children = node.get('children') or []
+            for child_position in range(len(children) - 1, -1, -1):
+                stack.append(
+                    (node_key, child_position, children[child_position])
+                )
+
+        return rows
+
+    @classmethod
+    def __get_flat_tree(
+        cls,
+        input_object: Union[dict, list],
+        data_type: Literal['tree', 'menu'],
+        use_cache: bool,
+    ) -> FlatTree:
+        """
+        获取treeData对应的扁平列式结构，开启缓存时按对象身份缓存最近使用的若干个
+        """
+
+        if not use_cache:
+            return FlatTree(input_object, data_type)
+
+        cache_key = (id(input_object), data_type)
+        with cls.__flat_tree_cache_lock:
+            cached = cls.__flat_tree_cache.get(cache_key)
+            # 缓存中持有原treeData的引用，确保id不会被其他对象复用
+            if cached is not None and cached[0] is input_object:
+                cls.__flat_tree_cache.move_to_end(cache_key)
+                return cached[1]
+
+        # 构建过程无需持有锁，并发构建同一treeData时以后写入的结果为准
+        flat_tree = FlatTree(input_object, data_type)
+        with cls.__flat_tree_cache_lock:
+            cls.__flat_tree_cache[cache_key] = (input_object, flat_tree)
+            cls.__flat_tree_cache.move_to_end(cache_key)
+            while len(cls.__flat_tree_cache) > cls.__flat_tree_cache_size:
+                cls.__flat_tree_cache.popitem(last=False)
+        return flat_tree
+
+    @classmethod
+    def __walk_nodes(
+        cls, input_object: Union[dict, list]
+    ) -> Iterator[Tuple[dict, List[dict]]]:
+        """
+        以迭代器栈按先序遍历全部节点，依次产出（节点，由根节点起的祖先节点列表），
+        祖先节点列表会随遍历过程原地变化，需要保留时应自行拷贝
         """
 
         # 检查input_object类型是否在list、dict中
@@ -277,49 +1054,46 @@ class TreeManager:
             'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
         )
 
-        if isinstance(input_object, list):
-            delete_result = []
-            for node in input_object:
-                if (
-                    node.get('props', {}).get('key') != node_key
-                    if data_type == 'menu'
-                    else node.get('key') != node_key
-                ):
-                    if node.get('children'):
-                        # 节点有children时，判断删除后是否为空，为空则不添加进结果
-                        tmp_children = cls.__delete_node(
-                            node['children'],
-                            node_key,
-                            data_type,
-                            keep_empty_children_node,
-                        )
-                        # 选择性添加
-                        if keep_empty_children_node or tmp_children:
-                            delete_result.append(
-                                {**node, 'children': tmp_children}
-                            )
-                    else:
-                        delete_result.append(node)
-            return delete_result
-        return input_object
+        ancestors = []
+        stack = [
+            iter(
+                input_object
+                if isinstance(input_object, list)
+                else [input_object]
+            )
+        ]
+        while stack:
+            for node in stack[-1]:
+                yield node, ancestors
+                if node.get('children'):
+                    ancestors.append(node)
+                    stack.append(iter(node['children']))
+                    break
+            else:
+                stack.pop()
+                if ancestors:
+                    ancestors.pop()
 
     @classmethod
-    def get_node(
+    def __find_node_paths(
         cls,
         input_object: Union[dict, list],
         node_key: str,
         data_type: Literal['tree', 'menu'] = 'tree',
-    ) -> Union[list, dict, None]:
+        first_per_layer: bool = False,
+    ) -> List[Tuple[int, ...]]:
         """
-        查询key值等于node_key的节点
+        查找key值等于node_key的节点的位置路径，路径为各层级children列表中的下标元组，
+        单个根节点字典视作仅包含该节点的根层级列表，已命中节点的子树不再继续查找
 
         Args:
             input_object (Union[dict, list]): 原始的treeData
-            node_key (str): 查询目标节点key值
+            node_key (str): 查找目标节点key值
             data_type (Literal['tree', 'menu'], default 'tree'): 数据类型，'tree'表示树形数据，'menu'表示菜单数据
+            first_per_layer (bool, default False): 是否在每个层级内仅记录首个命中节点，命中后不再查找该层级各节点的子树
 
         Returns:
-            dict: 目标节点数据字典
+            List[Tuple[int, ...]]: 命中节点的位置路径列表
         """
 
         # 检查input_object类型是否在list、dict中
@@ -327,36 +1101,271 @@ class TreeManager:
             'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
         )
 
-        # 若当前节点为列表
+        # 各层级的位置前缀以(下标, 上级前缀)链式存储，仅在命中时展开为元组，
+        # 避免深层树中逐层复制前缀元组
         if isinstance(input_object, list):
-            # 依次检查子节点
-            for node in input_object:
+            layers = [(None, input_object)]
+        elif first_per_layer:
+            # 单个根节点不存在平级节点，直接从其children开始查找
+            layers = [((0, None), input_object.get('children') or [])]
+        else:
+            layers = [(None, [input_object])]
+
+        node_paths = []
+        while layers:
+            prefix, layer = layers.pop()
+            if first_per_layer:
+                layer_keys = [get_node_key(node, data_type) for node in layer]
+                if node_key in layer_keys:
+                    node_paths.append(
+                        cls.__to_node_path((layer_keys.index(node_key), prefix))
+                    )
+                    continue
+            for index, node in enumerate(layer):
                 if (
-                    node.get('props', {}).get('key') == node_key
-                    if data_type == 'menu'
-                    else node.get('key') == node_key
+                    not first_per_layer
+                    and get_node_key(node, data_type) == node_key
                 ):
-                    return node
-                # 否则递归检查子节点的children
-                if 'children' in node:
-                    found_node = cls.get_node(
-                        node['children'], node_key, data_type
-                    )
-                    if found_node:
-                        return found_node
-
-        # 若当前节点为字典
-        elif isinstance(input_object, dict):
-            if (
-                input_object.get('props', {}).get('key') == node_key
-                if data_type == 'menu'
-                else input_object.get('key') == node_key
-            ):
-                return input_object
-            # 否则递归检查子节点的children
-            if 'children' in input_object:
-                return cls.get_node(
-                    input_object['children'], node_key, data_type
+                    node_paths.append(cls.__to_node_path((index, prefix)))
+                elif node.get('children'):
+                    layers.append(((index, prefix), node['children']))
+
+        return node_paths
+
+    @classmethod
+    def __find_first_node_paths(
+        cls,
+        input_object: Union[dict, list],
+        node_keys: Iterable[str],
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Dict[Any, Tuple[int, ...]]:
+        """
+        在一次先序遍历中查找各目标key值首个命中节点的位置路径，全部命中后立即结束遍历
+        """
+
+        # 检查input_object类型是否在list、dict中
+        assert isinstance(input_object, (list, dict)), (
+            'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
+        )
+
+        remaining_keys = set(node_keys)
+        node_paths = {}
+        # 当前所在层级的祖先节点下标
+        indexes = []
+        stack = [
+            enumerate(
+                input_object
+                if isinstance(input_object, list)
+                else [input_object]
+            )
+        ]
+        while stack and remaining_keys:
+            for index, node in stack[-1]:
+                node_key = get_node_key(node, data_type)
+                if node_key in remaining_keys:
+                    node_paths[node_key] = (*indexes, index)
+                    remaining_keys.remove(node_key)
+                if node.get('children'):
+                    indexes.append(index)
+                    stack.append(enumerate(node['children']))
+                    break
+            else:
+                stack.pop()
+                if indexes:
+                    indexes.pop()
+
+        return node_paths
+
+    @classmethod
+    def __index_node_keys(
+        cls,
+        input_object: Union[dict, list],
+        data_type: Literal['tree', 'menu'] = 'tree',
+    ) -> Dict[Any, Tuple[dict, Any, int]]:
+        """
+        按先序构建 key值 -> (节点, 父节点key值, 在平级节点中的下标) 索引，要求各节点key值存在且唯一
+        """
+
+        # 检查input_object类型是否在list、dict中
+        assert isinstance(input_object, (list, dict)), (
+            'input_object类型需为列表或字典\nthe type of input_object must be list or dict'
+        )
+
+        node_index = {}
+        stack = [
+            (
+                None,
+                enumerate(
+                    input_object
+                    if isinstance(input_object, list)
+                    else [input_object]
+                ),
+            )
+        ]
+        while stack:
+            parent_key, layer = stack[-1]
+            for index, node in layer:
+                node_key = get_node_key(node, data_type)
+                assert node_key is not None, (
+                    '检测到缺少key值的节点\nnode without key detected'
                 )
-        # 若未找到则返回None
-        return None
+                assert node_key not in node_index, (
+                    '检测到重复的节点key值 %s\nduplicate node key %s'
+                    % (node_key, node_key)
+                )
+                node_index[node_key] = (node, parent_key, index)
+                if node.get('children'):
+                    stack.append((node_key, enumerate(node['children'])))
+                    break
+            else:
+                stack.pop()
+
+        return node_index
+
+    @classmethod
+    def __longest_increasing_keys(
+        cls, keyed_positions: List[Tuple[Any, int]]
+    ) -> Set[Any]:
+        """
+        求按原有下标严格递增的最长子序列，返回其中各元素的key值
+        """
+
+        # tails[i]为长度i+1的递增子序列的末尾元素在keyed_positions中的下标
+        tails: List[int] = []
+        previous: List[int] = [-1] * len(keyed_positions)
+        for index, (_, position) in enumerate(keyed_positions):
+            low, high = 0, len(tails)
+            while low < high:
+                middle = (low + high) // 2
+                if keyed_positions[tails[middle]][1] < position:
+                    low = middle + 1
+                else:
+                    high = middle
+            if low > 0:
+                previous[index] = tails[low - 1]
+            if low == len(tails):
+                tails.append(index)
+            else:
+                tails[low] = index
+
+        result = set()
+        index = tails[-1] if tails else -1
+        while index != -1:
+            result.add(keyed_positions[index][0])
+            index = previous[index]
+        return result
+
+    @classmethod
+    def __to_node_path(cls, linked_path: Union[tuple, None]) -> Tuple[int, ...]:
+        """
+        将(下标, 上级前缀)形式的链式位置前缀展开为位置路径元组
+        """
+
+        node_path = []
+        while linked_path is not None:
+            index, linked_path = linked_path
+            node_path.append(index)
+        return tuple(reversed(node_path))
+
+    @classmethod
+    def __rebuild_node_paths(
+        cls,
+        input_object: Union[dict, list],
+        node_paths: List[Tuple[int, ...]],
+        emit: Callable[[dict, bool, bool], List[dict]],
+    ) -> Union[list, dict]:
+        """
+        仅重建根节点至各目标节点路径上的列表及字典，未涉及的子树与原始treeData共享
+
+        Args:
+            input_object (Union[dict, list]): 原始的treeData
+            node_paths (List[Tuple[int, ...]]): 目标节点位置路径列表
+            emit (Callable[[dict, bool, bool], List[dict]]): 针对路径所经层级中的每个节点，
+                接收（节点，是否为目标节点，children是否已重建），返回该位置上输出的节点列表
+
+        Returns:
+            Union[list, dict]: 重建后的treeData
+        """
+
+        if not node_paths:
+            return input_object
+
+        is_single_root = isinstance(input_object, dict)
+
+        # 将全部位置路径合并为前缀树，每个树节点为[本层级目标下标集合, {下标: 下级树节点}]
+        path_trie = [set(), {}]
+        for node_path in node_paths:
+            trie_node = path_trie
+            for index in node_path[:-1]:
+                trie_node = trie_node[1].setdefault(index, [set(), {}])
+            trie_node[0].add(node_path[-1])
+
+        # 以显式栈后序遍历前缀树，自最深层级向上逐层重建
+        new_layers: Dict[int, List[dict]] = {}
+        stack = [
+            (
+                [input_object] if is_single_root else input_object,
+                path_trie,
+                False,
+            )
+        ]
+        while stack:
+            layer, trie_node, visited = stack.pop()
+            targets, sub_tries = trie_node
+            if not visited:
+                stack.append((layer, trie_node, True))
+                for index, sub_trie in sub_tries.items():
+                    stack.append((layer[index]['children'], sub_trie, False))
+                continue
+
+            new_layer = []
+            for index, node in enumerate(layer):
+                sub_trie = sub_tries.get(index)
+                if sub_trie is not None:
+                    node = {**node, 'children': new_layers.pop(id(sub_trie))}
+                new_layer.extend(
+                    emit(node, index in targets, sub_trie is not None)
+                )
+            new_layers[id(trie_node)] = new_layer
+
+        if is_single_root:
+            return new_layers[id(path_trie)][0]
+        return new_layers[id(path_trie)]
+
+    @classmethod
+    def __get_patch_location(
+        cls,
+        patch: Patch,
+        node_path: Tuple[int, ...],
+        is_single_root: bool,
+    ) -> Patch:
+        """
+        在Patch对象中定位节点位置路径对应的节点
+        """
+
+        location = patch
+        for depth, index in enumerate(node_path):
+            if depth == 0:
+                # 单个根节点字典即为Patch对象本身
+                if not is_single_root:
+                    location = location[index]
+            else:
+                location = location['children'][index]
+        return location
+
+    @classmethod
+    def __get_patch_layer(
+        cls,
+        patch: Patch,
+        node_path: Tuple[int, ...],
+        is_single_root: bool,
+    ) -> Patch:
+        """
+        在Patch对象中定位节点位置路径对应节点所在的层级列表
+        """
+
+        if len(node_path) == 1:
+            return patch
+        return cls.__get_patch_location(patch, node_path[:-1], is_single_root)[
+            'children'
+        ]
@@ -0,0 +1,78 @@
+"""
+python scripts/benchmark_compact_tree.py
+
+对比CompactTree与嵌套字典形式的treeData常驻内存占用
+"""
+
+import gc
+import json
+import sys
+import timeit
+import tracemalloc
+
+sys.path.insert(0, '.')
+
+from feffery_dash_utils.tree_utils import CompactTree  # noqa: E402
+
+
+def build_catalog_json(directories: int, files: int) -> str:
+    """构造目录型树形数据的JSON字符串，文件名在不同目录下重复出现"""
+
+    return json.dumps(
+        [
+            {
+                'title': f'目录{i}',
+                'key': f'dir-{i}',
+                'children': [
+                    {'title': f'file-{j}.csv', 'key': f'dir-{i}/file-{j}.csv'}
+                    for j in range(files)
+                ],
+            }
+            for i in range(directories)
+        ],
+        ensure_ascii=False,
+    )
+
+
+def measure_memory(factory) -> tuple:
+    """返回factory构建结果常驻占用的内存字节数"""
+
+    gc.collect()
+    tracemalloc.start()
+    result = factory()
+    gc.collect()
+    size, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return result, size
+
+
+if __name__ == '__main__':
+    for directories, files in [(100, 100), (1000, 1000)]:
+        raw_json = build_catalog_json(directories, files)
+        nodes = directories * (files + 1)
+
+        tree, dict_size = measure_memory(lambda: json.loads(raw_json))
+        compact_tree, compact_size = measure_memory(
+            lambda: CompactTree(json.loads(raw_json))
+        )
+        assert compact_tree.to_tree_data() == tree
+
+        print(f'nodes={nodes}')
+        print(
+            f'  {"dict treeData":<24}{dict_size / 1024 / 1024:>10.1f} MB'
+            f'{dict_size / nodes:>10.0f} B/node'
+        )
+        print(
+            f'  {"CompactTree":<24}{compact_size / 1024 / 1024:>10.1f} MB'
+            f'{compact_size / nodes:>10.0f} B/node'
+        )
+        lookup_key = f'dir-{directories // 2}/file-{files // 2}.csv'
+        print(
+            f'  {"get_child_keys":<24}'
+            f'{timeit.timeit(lambda: compact_tree.get_child_keys(f"dir-{directories // 2}"), number=100) * 10:>10.3f} ms'
+        )
+        print(
+            f'  {"get_node":<24}'
+            f'{timeit.timeit(lambda: compact_tree.get_node(lookup_key), number=1000):>10.3f} ms'
+        )
+        del tree, compact_tree
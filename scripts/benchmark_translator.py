@@ -0,0 +1,56 @@
+"""
+python scripts/benchmark_translator.py
+
+测试Translator.t()在请求上下文中的每秒调用次数
+"""
+
+import sys
+import timeit
+
+from flask import Flask
+
+sys.path.insert(0, '.')
+
+from feffery_dash_utils.i18n_utils import Translator  # noqa: E402
+
+
+def measure(func, number: int = 200000) -> str:
+    seconds = timeit.timeit(func, number=number)
+    return f'{number / seconds:>12,.0f} calls/s'
+
+
+if __name__ == '__main__':
+    translator = Translator(translations='./tests/i18n_utils/locales.json')
+    app = Flask(__name__)
+
+    with app.test_request_context(
+        headers={'Cookie': f'{translator.cookie_name}=en-us'}
+    ):
+        print(
+            f'  {"t(), cookie locale":<36}'
+            + measure(lambda: translator.t('示例警告消息'))
+        )
+
+    translator = Translator(
+        translations='./tests/i18n_utils/locales.json',
+        get_current_locale=lambda: 'en-us',
+    )
+    print(
+        f'  {"t(), fixed locale":<36}'
+        + measure(lambda: translator.t('示例警告消息'))
+    )
+    print(
+        f'  {"t(), source locale equals target":<36}'
+        + measure(lambda: translator.t('示例警告消息', source_locale='en-us'))
+    )
+
+    for usage_sample_rate in [1, 0.01]:
+        translator = Translator(
+            translations='./tests/i18n_utils/locales.json',
+            get_current_locale=lambda: 'en-us',
+            usage_sample_rate=usage_sample_rate,
+        )
+        print(
+            f'  {f"t(), usage sample rate {usage_sample_rate}":<36}'
+            + measure(lambda: translator.t('示例警告消息'))
+        )
@@ -0,0 +1,78 @@
+"""
+python scripts/benchmark_translator_startup.py
+
+测试多主题、多语种场景下Translator初始化耗时及内存占用，对比一次性加载、按需加载及二进制文案目录
+"""
+
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, '.')
+
+from feffery_dash_utils.i18n_utils import Translator  # noqa: E402
+
+N_TOPICS = 60
+N_LOCALES = 12
+N_CONTENTS = 500
+
+
+def generate_translations(directory: str) -> list:
+    locales = ['locale%d' % i for i in range(1, N_LOCALES)]
+    translations = []
+    for topic_index in range(N_TOPICS):
+        translation = os.path.join(directory, 'topic%d.json' % topic_index)
+        with open(translation, 'w', encoding='utf-8') as f:
+            json.dump(
+                {
+                    'root_locale': 'locale0',
+                    'topic': 'topic%d' % topic_index,
+                    'contents': {
+                        '文案%d-%d' % (topic_index, i): {
+                            locale: '%s text %d-%d' % (locale, topic_index, i)
+                            for locale in locales
+                        }
+                        for i in range(N_CONTENTS)
+                    },
+                },
+                f,
+                ensure_ascii=False,
+            )
+        translations.append(translation)
+    return translations
+
+
+def measure(translations: list, **kwargs) -> str:
+    tracemalloc.start()
+    start = time.perf_counter()
+    translator = Translator(
+        translations=translations,
+        get_current_locale=lambda: 'locale3',
+        **kwargs,
+    )
+    seconds = time.perf_counter() - start
+    translator.t('文案0-0', locale_topic='topic0')
+    memory = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    return f'{seconds:>8.2f} s {memory / 1024 / 1024:>10.1f} MB'
+
+
+if __name__ == '__main__':
+    with tempfile.TemporaryDirectory() as directory:
+        translations = generate_translations(directory)
+        print(f'  {"eager":<36}' + measure(translations))
+        print(
+            f'  {"lazy_load_topics":<36}'
+            + measure(translations, lazy_load_topics=True)
+        )
+        print(
+            f'  {"lazy_load_topics, max 8 topics":<36}'
+            + measure(translations, lazy_load_topics=True, max_loaded_topics=8)
+        )
+
+        catalog = os.path.join(directory, 'translations.catalog')
+        Translator(translations=translations).export_catalog(catalog)
+        print(f'  {"binary catalog":<36}' + measure(catalog))
@@ -0,0 +1,109 @@
+"""
+python scripts/benchmark_tree_manager.py
+
+对比TreeManager显式栈遍历实现与原有递归实现在不同树深度下的耗时
+"""
+
+import sys
+import timeit
+from copy import deepcopy
+
+sys.path.insert(0, '.')
+
+from feffery_dash_utils.tree_utils import TreeManager  # noqa: E402
+
+
+def build_deep_tree(depth: int, width: int = 5) -> list:
+    """构造指定深度的树，每层包含width个节点，其中首个节点继续向下延伸"""
+
+    root_layer = []
+    layer = root_layer
+    for level in range(depth):
+        nodes = [
+            {'title': f'{level}-{i}', 'key': f'{level}-{i}'}
+            for i in range(width)
+        ]
+        layer.extend(nodes)
+        if level < depth - 1:
+            nodes[0]['children'] = []
+            layer = nodes[0]['children']
+    return root_layer
+
+
+def recursive_get_node(input_object, node_key):
+    """原有递归实现的get_node()"""
+
+    for node in input_object:
+        if node.get('key') == node_key:
+            return node
+        if 'children' in node:
+            found_node = recursive_get_node(node['children'], node_key)
+            if found_node:
+                return found_node
+    return None
+
+
+def _recursive_update(input_object, node_key, new_node):
+    if isinstance(input_object, list):
+        return [
+            _recursive_update(node, node_key, new_node) for node in input_object
+        ]
+    if input_object.get('key') == node_key:
+        return new_node
+    if input_object.get('children'):
+        input_object['children'] = [
+            _recursive_update(child, node_key, new_node)
+            for child in input_object['children']
+        ]
+    return input_object
+
+
+def recursive_update_tree_node(input_object, node_key, new_node):
+    """原有递归实现的update_tree_node()"""
+
+    return _recursive_update(deepcopy(input_object), node_key, new_node)
+
+
+def measure(func, number: int) -> str:
+    try:
+        seconds = timeit.timeit(func, number=number) / number
+    except RecursionError:
+        return 'RecursionError'
+    return f'{seconds * 1000:.3f} ms'
+
+
+if __name__ == '__main__':
+    for depth in [10, 100, 5000]:
+        tree = build_deep_tree(depth)
+        target_key = f'{depth - 1}-0'
+        new_node = {'title': 'new', 'key': target_key}
+        number = 200 if depth < 5000 else 5
+
+        print(f'depth={depth}, nodes={depth * 5}')
+        cases = [
+            (
+                'get_node(missing key, full traversal)',
+                lambda: recursive_get_node(tree, 'missing'),
+                lambda: TreeManager.get_node(tree, 'missing'),
+            ),
+            (
+                'update_tree_node',
+                lambda: recursive_update_tree_node(tree, target_key, new_node),
+                lambda: TreeManager.update_tree_node(
+                    tree, target_key, new_node
+                ),
+            ),
+            (
+                "update_tree_node(copy_strategy='path')",
+                None,
+                lambda: TreeManager.update_tree_node(
+                    tree, target_key, new_node, copy_strategy='path'
+                ),
+            ),
+        ]
+        for name, recursive_func, iterative_func in cases:
+            print(
+                f'  {name:<40}'
+                f'recursive: {measure(recursive_func, number) if recursive_func else "-":<16}'
+                f'iterative: {measure(iterative_func, number)}'
+            )
@@ -0,0 +1,126 @@
+import json
+import os
+import pytest
+from feffery_dash_utils.i18n_utils import Translator
+from feffery_dash_utils.i18n_utils.catalog import TranslationCatalog, is_catalog
+
+
+class TestTranslationCatalog:
+    """二进制文案目录测试类"""
+
+    def setup_method(self):
+        """测试前准备语种切换函数"""
+        self.current_locale = 'zh-cn'
+        self.get_current_locale = lambda: self.current_locale
+        self.translations = [
+            './tests/i18n_utils/multi_locales/locales1.json',
+            './tests/i18n_utils/multi_locales/locales2.json',
+        ]
+
+    def test_export_catalog(self, tmp_path):
+        """测试文案目录导出及读取"""
+        catalog_path = str(tmp_path / 'translations.catalog')
+        translator = Translator(translations=self.translations)
+        translator.export_catalog(catalog_path)
+
+        assert is_catalog(catalog_path)
+        assert not is_catalog(self.translations[0])
+
+        catalog = TranslationCatalog(catalog_path)
+        assert catalog.root_locale == 'zh-cn'
+        assert set(catalog.available_locales) == {'zh-cn', 'en-us', 'jp'}
+
+        compiled_translations = catalog.get_compiled_translations()
+        assert compiled_translations.keys() == (
+            translator.compiled_translations.keys()
+        )
+        for key, compiled_table in translator.compiled_translations.items():
+            if compiled_table is None:
+                assert compiled_translations[key] is None
+            else:
+                assert dict(compiled_translations[key].items()) == (
+                    compiled_table
+                )
+
+        catalog_translations = catalog.get_translations()
+        assert '示例警告描述' in catalog_translations['topic2']['zh-cn']
+        assert '示例警告描述' not in catalog_translations['topic2']['jp']
+
+    def test_catalog_translator(self, tmp_path):
+        """测试基于文案目录的文案转换"""
+        catalog_path = str(tmp_path / 'translations.catalog')
+        Translator(translations=self.translations).export_catalog(catalog_path)
+
+        translator = Translator(
+            translations=catalog_path,
+            get_current_locale=self.get_current_locale,
+        )
+        assert translator.root_locale == 'zh-cn'
+        assert translator.t('示例警告消息') == '示例警告消息'
+
+        self.current_locale = 'jp'
+        assert translator.t('示例警告消息') == 'サンプルアラートメッセージ'
+        assert (
+            translator.t('Sample description of alert', 'en-us', 'topic2')
+            == 'サンプルアラート説明'
+        )
+        assert translator.t_many(['示例警告消息', '示例警告消息']) == [
+            'サンプルアラートメッセージ',
+            'サンプルアラートメッセージ',
+        ]
+        with pytest.raises(AssertionError):
+            translator.t('不存在的文案')
+        with pytest.raises(AssertionError):
+            translator.t('示例警告消息', locale_topic='topic3')
+
+        with pytest.raises(AssertionError):
+            translator.export_catalog(str(tmp_path / 'other.catalog'))
+
+        # 文案目录重新导出后可热更新
+        Translator(translations=self.translations[1:]).export_catalog(
+            catalog_path
+        )
+        os.utime(catalog_path, (1, 1))
+        assert translator.reload_translations() == ['topic2']
+        assert translator.available_topics == ['topic2']
+
+    def test_plural_flag(self, tmp_path):
+        """测试复数文案以编号标记位区分，而非依赖字符串内容"""
+        translation_file = tmp_path / 'locales.json'
+        plural_forms = {'one': '{count} file', 'other': '{count} files'}
+        translation_file.write_text(
+            json.dumps(
+                {
+                    'root_locale': 'zh-cn',
+                    'contents': {
+                        '共{count}个文件': {'en-us': plural_forms},
+                        '控制字符': {'en-us': '\0{"other": "text"}'},
+                        '复数文本': {
+                            'en-us': json.dumps(plural_forms, sort_keys=True)
+                        },
+                    },
+                },
+                ensure_ascii=False,
+            ),
+            encoding='utf-8',
+        )
+        catalog_path = str(tmp_path / 'translations.catalog')
+        Translator(translations=str(translation_file)).export_catalog(
+            catalog_path
+        )
+
+        compiled_table = TranslationCatalog(
+            catalog_path
+        ).get_compiled_translations()[('_default', 'zh-cn', 'en-us')]
+        assert compiled_table.get('共{count}个文件') == plural_forms
+        assert compiled_table.get('控制字符') == '\0{"other": "text"}'
+        assert compiled_table.get('复数文本') == json.dumps(
+            plural_forms, sort_keys=True
+        )
+
+        # 旧版本格式的文案目录需重新导出
+        with open(catalog_path, 'r+b') as f:
+            f.seek(7)
+            f.write(b'\x01')
+        with pytest.raises(AssertionError, match='格式版本'):
+            TranslationCatalog(catalog_path)
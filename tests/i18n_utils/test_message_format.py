@@ -0,0 +1,80 @@
+import pytest
+from feffery_dash_utils.i18n_utils.message_format import (
+    MessageFormatter,
+    get_plural_rule,
+)
+
+
+class TestMessageFormat:
+    """文案模板及复数规则测试类"""
+
+    def test_message_formatter(self):
+        """测试文案模板拆分及渲染"""
+        formatter = MessageFormatter('共{count}个文件，{{转义}}，用户{name!r}')
+        assert formatter.segments == [
+            '共',
+            None,
+            '个文件，{',
+            '转义}',
+            '，用户',
+            None,
+        ]
+        assert (
+            formatter.render({'count': 3, 'name': 'dash'})
+            == "共3个文件，{转义}，用户'dash'"
+        )
+
+        assert MessageFormatter('{ratio:.1%}').render({'ratio': 0.5}) == (
+            '50.0%'
+        )
+        assert MessageFormatter('无占位符').render({}) == '无占位符'
+
+        with pytest.raises(KeyError):
+            formatter.render({'count': 3})
+        with pytest.raises(AssertionError):
+            MessageFormatter('{0}')
+
+    def test_plural_rule(self):
+        """测试CLDR复数类别选择"""
+        assert [get_plural_rule('en-us')(n) for n in (0, 1, 2, 1.0)] == [
+            'other',
+            'one',
+            'other',
+            'other',
+        ]
+        assert get_plural_rule('zh-cn')(1) == 'other'
+        assert get_plural_rule('jp')(1) == 'other'
+        assert [get_plural_rule('fr')(n) for n in (0, 1, 2)] == [
+            'one',
+            'one',
+            'other',
+        ]
+        assert [
+            get_plural_rule('ru_RU')(n) for n in (1, 3, 5, 11, 21, 1.5)
+        ] == [
+            'one',
+            'few',
+            'many',
+            'many',
+            'one',
+            'other',
+        ]
+        assert [get_plural_rule('ar')(n) for n in (0, 1, 2, 5, 11, 100)] == [
+            'zero',
+            'one',
+            'two',
+            'few',
+            'many',
+            'other',
+        ]
+        # 未知语种按英语规则处理
+        assert get_plural_rule(None)(1) == 'one'
+
+        # 以指数形式表示的极大、极小浮点数
+        assert get_plural_rule('en-us')(1e16) == 'other'
+        assert get_plural_rule('en-us')(1e-5) == 'other'
+        assert get_plural_rule('ru')(1e16) == 'many'
+        assert get_plural_rule('ru')(2.1e-7) == 'other'
+        assert get_plural_rule('fr')(1e-5) == 'one'
+        assert get_plural_rule('en-us')('1.50') == 'other'
+        assert get_plural_rule('en-us')(float('inf')) == 'other'
@@ -0,0 +1,722 @@
+import contextvars
+import hashlib
+import json
+import os
+import pytest
+import threading
+import feffery_antd_components as fac
+from dash import html
+from dash._callback_context import context_value
+from dash._utils import AttributeDict
+from flask import Flask, request
+from feffery_dash_utils.i18n_utils import Translator
+
+
+class TestTranslator:
+    """国际化文案转换测试类"""
+
+    def setup_method(self):
+        """测试前准备语种切换函数"""
+        self.current_locale = 'zh-cn'
+        self.get_current_locale = lambda: self.current_locale
+
+    def test_t(self):
+        """测试文案转换功能"""
+        translator = Translator(
+            translations='./tests/i18n_utils/locales.json',
+            get_current_locale=self.get_current_locale,
+        )
+        assert translator.t('示例警告消息') == '示例警告消息'
+
+        self.current_locale = 'en-us'
+        assert translator.t('示例警告消息') == 'Sample message of alert'
+        assert (
+            translator.t('サンプルアラート説明', source_locale='jp')
+            == 'Sample description of alert'
+        )
+
+        with pytest.raises(AssertionError):
+            translator.t('不存在的文案')
+        with pytest.raises(AssertionError):
+            translator.t('示例警告消息', locale_topic='topic2')
+
+        self.current_locale = 'fr'
+        with pytest.raises(AssertionError):
+            translator.t('示例警告消息')
+
+    def test_compiled_translations(self):
+        """测试预编译查找表"""
+        translator = Translator(
+            translations=[
+                './tests/i18n_utils/multi_locales/locales1.json',
+                './tests/i18n_utils/multi_locales/locales2.json',
+            ],
+            get_current_locale=self.get_current_locale,
+            force_check_content_translator=False,
+        )
+        assert translator.compiled_translations[('topic2', 'zh-cn', 'jp')] == {
+            '示例警告描述': 'サンプルアラート説明'
+        }
+        assert translator.compiled_translations[('topic2', 'jp', 'jp')] is None
+
+        self.current_locale = 'jp'
+        assert (
+            translator.t('示例警告描述', locale_topic='topic2')
+            == 'サンプルアラート説明'
+        )
+        # 未强制检查时缺失的翻译内容返回原文案
+        assert translator.t('示例警告描述') == '示例警告描述'
+
+    def test_t_many(self):
+        """测试批量文案转换功能"""
+        translator = Translator(
+            translations='./tests/i18n_utils/locales.json',
+            get_current_locale=self.get_current_locale,
+        )
+        assert translator.t_many(['示例警告消息', '示例警告描述']) == [
+            '示例警告消息',
+            '示例警告描述',
+        ]
+
+        self.current_locale = 'jp'
+        assert translator.t_many(['示例警告消息', '示例警告描述']) == [
+            'サンプルアラートメッセージ',
+            'サンプルアラート説明',
+        ]
+        assert translator.t_many([]) == []
+        with pytest.raises(AssertionError):
+            translator.t_many(['示例警告消息', '不存在的文案'])
+
+    def test_translate_component(self):
+        """测试组件树文案转换功能"""
+        translator = Translator(
+            translations='./tests/i18n_utils/locales.json',
+            get_current_locale=self.get_current_locale,
+        )
+        self.current_locale = 'en-us'
+
+        layout = html.Div(
+            [
+                '示例警告消息',
+                fac.AntdAlert(
+                    message='示例警告消息', description='示例警告描述'
+                ),
+                fac.AntdInput(placeholder='示例警告描述'),
+                fac.AntdSelect(
+                    options=[
+                        {'label': '示例警告消息', 'value': 'a'},
+                        {'label': '其他文案', 'value': 'b'},
+                    ]
+                ),
+                fac.AntdTooltip(
+                    html.Span('示例警告描述'), title='示例警告消息'
+                ),
+            ]
+        )
+        result = translator.translate_component(
+            layout, props=['message', 'placeholder', 'options[].label', 'title']
+        )
+        assert result is layout
+        assert layout.children[0] == 'Sample message of alert'
+        assert layout.children[1].message == 'Sample message of alert'
+        # 未指定的属性保持不变
+        assert layout.children[1].description == '示例警告描述'
+        assert layout.children[2].placeholder == 'Sample description of alert'
+        assert layout.children[3].options == [
+            {'label': 'Sample message of alert', 'value': 'a'},
+            {'label': '其他文案', 'value': 'b'},
+        ]
+        assert layout.children[4].title == 'Sample message of alert'
+        assert layout.children[4].children.children == (
+            'Sample description of alert'
+        )
+
+        assert translator.translate_component('示例警告描述') == (
+            'Sample description of alert'
+        )
+
+    def test_current_locale_cache(self):
+        """测试单次请求内的当前语种缓存及手动指定语种"""
+        calls = []
+
+        def get_current_locale():
+            calls.append(request.cookies.get('dash-i18n'))
+            return calls[-1] or 'zh-cn'
+
+        translator = Translator(
+            translations='./tests/i18n_utils/locales.json',
+            get_current_locale=get_current_locale,
+        )
+        app = Flask(__name__)
+
+        for locale, expected in [
+            ('en-us', 'Sample message of alert'),
+            ('jp', 'サンプルアラートメッセージ'),
+        ]:
+            with app.test_request_context(
+                headers={'Cookie': 'dash-i18n=%s' % locale}
+            ):
+                for _ in range(3):
+                    assert translator.t('示例警告消息') == expected
+                assert translator.t_many(['示例警告消息']) == [expected]
+
+                with translator.use_locale('zh-cn'):
+                    assert translator.t('示例警告消息') == '示例警告消息'
+                    with translator.use_locale('jp'):
+                        assert translator.resolve_current_locale() == 'jp'
+                    assert translator.resolve_current_locale() == 'zh-cn'
+                assert translator.t('示例警告消息') == expected
+        # 每次请求仅确定一次当前语种
+        assert calls == ['en-us', 'jp']
+
+        translator.cache_current_locale = False
+        with app.test_request_context(headers={'Cookie': 'dash-i18n=jp'}):
+            translator.t('示例警告消息')
+            translator.t('示例警告消息')
+        assert calls == ['en-us', 'jp', 'jp', 'jp']
+
+        # 请求上下文及回调上下文之外默认使用根语种
+        translator = Translator(translations='./tests/i18n_utils/locales.json')
+        assert translator.t('示例警告消息') == '示例警告消息'
+
+        # 后台回调中不存在请求上下文，读取回调上下文中的cookies
+        def run_in_background_callback():
+            context_value.set(AttributeDict(cookies={'dash-i18n': 'jp'}))
+            return translator.t('示例警告消息')
+
+        assert (
+            contextvars.copy_context().run(run_in_background_callback)
+            == 'サンプルアラートメッセージ'
+        )
+        with translator.use_locale('en-us'):
+            assert translator.t('示例警告消息') == 'Sample message of alert'
+
+    def test_reload_translations(self, tmp_path):
+        """测试本地化配置文件热更新"""
+        translation_files = []
+        for name in ['locales1.json', 'locales2.json']:
+            with open(
+                './tests/i18n_utils/multi_locales/%s' % name, encoding='utf-8'
+            ) as f:
+                raw_translation = json.load(f)
+            translation_file = tmp_path / name
+            translation_file.write_text(
+                json.dumps(raw_translation, ensure_ascii=False),
+                encoding='utf-8',
+            )
+            translation_files.append(translation_file)
+
+        def update_file(translation_file, content, mtime):
+            translation_file.write_text(content, encoding='utf-8')
+            os.utime(translation_file, (mtime, mtime))
+
+        translator = Translator(
+            translations=[str(path) for path in translation_files],
+            get_current_locale=self.get_current_locale,
+        )
+        self.current_locale = 'en-us'
+        assert translator.reload_translations() == []
+
+        raw_translation = json.loads(translation_files[1].read_text('utf-8'))
+        raw_translation['contents']['示例警告描述']['en-us'] = 'Updated'
+        default_translations = translator.compiled_translations[
+            ('_default', 'zh-cn', 'en-us')
+        ]
+        update_file(
+            translation_files[1],
+            json.dumps(raw_translation, ensure_ascii=False),
+            1,
+        )
+        # 仅重建发生变化的主题
+        assert translator.reload_translations() == ['topic2']
+        assert (
+            translator.compiled_translations[('_default', 'zh-cn', 'en-us')]
+            is default_translations
+        )
+        assert translator.t('示例警告描述', locale_topic='topic2') == 'Updated'
+        assert translator.t('示例警告消息') == 'Sample message of alert'
+
+        # 自动检查更新
+        translator = Translator(
+            translations=[str(path) for path in translation_files],
+            get_current_locale=self.get_current_locale,
+            auto_reload_interval=0,
+        )
+        raw_translation['contents']['示例警告描述']['en-us'] = 'Updated again'
+        update_file(
+            translation_files[1],
+            json.dumps(raw_translation, ensure_ascii=False),
+            2,
+        )
+        assert (
+            translator.t('示例警告描述', locale_topic='topic2')
+            == 'Updated again'
+        )
+
+        # 配置文件无效时继续使用已加载的文案内容
+        update_file(translation_files[1], '{', 3)
+        assert (
+            translator.t('示例警告描述', locale_topic='topic2')
+            == 'Updated again'
+        )
+
+    def test_lazy_load_topics(self):
+        """测试按需加载主题"""
+        translator = Translator(
+            translations=[
+                './tests/i18n_utils/multi_locales/locales1.json',
+                './tests/i18n_utils/multi_locales/locales2.json',
+            ],
+            get_current_locale=self.get_current_locale,
+            lazy_load_topics=True,
+            max_loaded_topics=1,
+        )
+        assert translator.translations == {}
+        assert set(translator.available_topics) == {'_default', 'topic2'}
+        assert set(translator.available_locales) == {'zh-cn', 'en-us', 'jp'}
+
+        # 源语种与目标语种相同时无需加载主题
+        assert translator.t('示例警告消息') == '示例警告消息'
+        assert translator.translations == {}
+
+        self.current_locale = 'en-us'
+        assert translator.t('示例警告消息') == 'Sample message of alert'
+        assert list(translator.translations) == ['_default']
+
+        # 超出max_loaded_topics时淘汰最久未使用的主题
+        assert (
+            translator.t('示例警告描述', locale_topic='topic2')
+            == 'Sample description of alert'
+        )
+        assert list(translator.translations) == ['topic2']
+        assert ('_default', 'zh-cn', 'en-us') not in (
+            translator.compiled_translations
+        )
+        assert translator.t('示例警告消息') == 'Sample message of alert'
+        assert list(translator.translations) == ['_default']
+
+        with pytest.raises(AssertionError):
+            translator.t('示例警告消息', locale_topic='topic3')
+        with pytest.raises(AssertionError):
+            translator.t('不存在的文案')
+
+    def test_fallback_locales(self, tmp_path, caplog):
+        """测试后备语种及缺失翻译内容计数"""
+        translation_file = tmp_path / 'locales.json'
+        translation_file.write_text(
+            json.dumps(
+                {
+                    'root_locale': 'zh-cn',
+                    'contents': {
+                        '确定': {'en-us': 'OK', 'jp': '確認'},
+                        '取消': {'en-us': 'Cancel'},
+                    },
+                },
+                ensure_ascii=False,
+            ),
+            encoding='utf-8',
+        )
+        translator = Translator(
+            translations=str(translation_file),
+            get_current_locale=self.get_current_locale,
+            force_check_content_translator=False,
+            fallback_locales={'jp': ['en-us'], 'zh-tw': ['jp', 'zh-cn']},
+        )
+        assert 'zh-tw' in translator.available_locales
+        assert translator.compiled_translations[
+            ('_default', 'zh-cn', 'jp')
+        ] == {'确定': '確認', '取消': 'Cancel'}
+
+        self.current_locale = 'jp'
+        assert translator.t('取消') == 'Cancel'
+        self.current_locale = 'zh-tw'
+        assert translator.t('确定') == '確認'
+        assert translator.t('Cancel', source_locale='en-us') == '取消'
+
+        # 每种缺失情况仅记录一次日志
+        self.current_locale = 'en-us'
+        with caplog.at_level('WARNING', logger='i18n'):
+            for _ in range(3):
+                assert translator.t('不存在的文案') == '不存在的文案'
+        assert len(caplog.records) == 1
+        assert translator.missing_translations == {
+            ('_default', 'zh-cn', 'en-us', '不存在的文案'): 3
+        }
+
+        # 缺失情况数量超出上限时淘汰最久未出现的缺失情况
+        translator.max_missing_translations = 3
+        for i in range(5):
+            translator.t('动态文案%d' % i)
+            translator.t('不存在的文案')
+        assert translator.missing_translations == {
+            ('_default', 'zh-cn', 'en-us', '动态文案3'): 1,
+            ('_default', 'zh-cn', 'en-us', '动态文案4'): 1,
+            ('_default', 'zh-cn', 'en-us', '不存在的文案'): 8,
+        }
+        assert translator.missing_translations_overflow == 3
+
+    def test_render_message(self, tmp_path):
+        """测试占位符参数及复数文案"""
+        translation_file = tmp_path / 'locales.json'
+        translation_file.write_text(
+            json.dumps(
+                {
+                    'root_locale': 'zh-cn',
+                    'contents': {
+                        '共{count}个文件': {
+                            'en-us': {
+                                '=0': 'No files',
+                                'one': '{count} file',
+                                'other': '{count} files',
+                            },
+                            'jp': '{count}個のファイル',
+                        },
+                        '你好，{name}': {'en-us': 'Hello, {name}'},
+                    },
+                },
+                ensure_ascii=False,
+            ),
+            encoding='utf-8',
+        )
+        translator = Translator(
+            translations=str(translation_file),
+            get_current_locale=self.get_current_locale,
+        )
+        assert translator.t('共{count}个文件', count=2) == '共2个文件'
+        assert translator.t('你好，{name}', name='Dash') == '你好，Dash'
+
+        self.current_locale = 'en-us'
+        assert translator.t('共{count}个文件', count=0) == 'No files'
+        assert translator.t('共{count}个文件', count=1) == '1 file'
+        assert translator.t('共{count}个文件', count=5) == '5 files'
+        assert translator.t('共{count}个文件', count=1e16) == '1e+16 files'
+        assert translator.t('共{count}个文件', count=1e-5) == '1e-05 files'
+        assert translator.t('共{count}个文件') == '{count} files'
+        assert translator.t_many(['共{count}个文件']) == ['{count} files']
+        assert translator.t('你好，{name}', name='Dash') == 'Hello, Dash'
+        assert translator.t('你好，{name}') == 'Hello, {name}'
+
+        self.current_locale = 'jp'
+        assert translator.t('共{count}个文件', count=1) == '1個のファイル'
+
+        # 复数文案同样可导出至二进制文案目录
+        catalog_path = str(tmp_path / 'translations.catalog')
+        translator.export_catalog(catalog_path)
+        translator = Translator(
+            translations=catalog_path,
+            get_current_locale=self.get_current_locale,
+        )
+        self.current_locale = 'en-us'
+        assert translator.t('共{count}个文件', count=1) == '1 file'
+        assert translator.t('共{count}个文件', count=3) == '3 files'
+
+        # 布尔值不作为数量
+        with pytest.raises(AssertionError, match='count'):
+            translator.t('共{count}个文件', count=True)
+
+        # 复数文案缺少other类别时在加载时报错，并指明主题及文案
+        translation_file.write_text(
+            json.dumps(
+                {
+                    'root_locale': 'zh-cn',
+                    'topic': 'files',
+                    'contents': {
+                        '共{count}个文件': {'en-us': {'one': '{count} file'}},
+                    },
+                },
+                ensure_ascii=False,
+            ),
+            encoding='utf-8',
+        )
+        with pytest.raises(AssertionError, match='files.*共{count}个文件'):
+            Translator(translations=str(translation_file))
+
+    def test_root_locale_plural(self, tmp_path):
+        """测试根语种下的复数文案"""
+        translation_file = tmp_path / 'locales.json'
+        translation_file.write_text(
+            json.dumps(
+                {
+                    'root_locale': 'en-us',
+                    'contents': {
+                        '{count} files': {
+                            'en-us': {
+                                'one': '{count} file',
+                                'other': '{count} files',
+                            },
+                            'zh-cn': '共{count}个文件',
+                        },
+                        'Hello': {'zh-cn': '你好'},
+                    },
+                },
+                ensure_ascii=False,
+            ),
+            encoding='utf-8',
+        )
+        other_file = tmp_path / 'other.json'
+        other_file.write_text(
+            json.dumps(
+                {
+                    'root_locale': 'en-us',
+                    'topic': 'other',
+                    'contents': {'Bye': {'zh-cn': '再见'}},
+                },
+                ensure_ascii=False,
+            ),
+            encoding='utf-8',
+        )
+        self.current_locale = 'en-us'
+        for kwargs in (
+            {},
+            {'lazy_load_topics': True, 'max_loaded_topics': 1},
+        ):
+            translator = Translator(
+                translations=[str(translation_file), str(other_file)],
+                get_current_locale=self.get_current_locale,
+                **kwargs,
+            )
+            assert translator.t('{count} files', count=1) == '1 file'
+            assert translator.t('{count} files', count=3) == '3 files'
+            # 根语种下的其他文案无需翻译，未配置的文案也不视为缺失
+            assert translator.t('Hello') == 'Hello'
+            assert translator.t('Dynamic') == 'Dynamic'
+            assert translator.t_many(['{count} files', 'Hello']) == [
+                '{count} files',
+                'Hello',
+            ]
+            # 淘汰后再次使用时重新加载
+            assert translator.t('Bye', locale_topic='other') == 'Bye'
+            assert translator.t('{count} files', count=1) == '1 file'
+
+        # 由其他语种转换至根语种时同样选择复数文案
+        assert (
+            translator.t('共{count}个文件', source_locale='zh-cn', count=1)
+            == '1 file'
+        )
+
+        translator = Translator(
+            translations=[str(translation_file), str(other_file)],
+            get_current_locale=self.get_current_locale,
+        )
+        catalog_path = str(tmp_path / 'translations.catalog')
+        translator.export_catalog(catalog_path)
+        translator = Translator(
+            translations=catalog_path,
+            get_current_locale=self.get_current_locale,
+        )
+        assert translator.t('{count} files', count=1) == '1 file'
+        assert translator.t('Hello') == 'Hello'
+
+    def test_export_bundle(self, tmp_path):
+        """测试浏览器端文案包导出"""
+        translator = Translator(
+            translations=[
+                './tests/i18n_utils/multi_locales/locales1.json',
+                './tests/i18n_utils/multi_locales/locales2.json',
+            ],
+            lazy_load_topics=True,
+        )
+
+        path = translator.export_bundle('en-us', str(tmp_path))
+        with open(path, 'rb') as f:
+            content = f.read()
+        assert (
+            os.path.basename(path)
+            == 'i18n.en-us.%s.json' % (hashlib.sha256(content).hexdigest()[:12])
+        )
+        assert json.loads(content) == {
+            '_default': {'示例警告消息': 'Sample message of alert'},
+            'topic2': {'示例警告描述': 'Sample description of alert'},
+        }
+        # 内容不变时文件名不变
+        assert translator.export_bundle('en-us', str(tmp_path)) == path
+
+        path = translator.export_bundle(
+            'jp', str(tmp_path), topics=['topic2'], bundle_format='js'
+        )
+        assert path.endswith('.js')
+        with open(path, encoding='utf-8') as f:
+            assert f.read() == (
+                '(window.dashI18nBundles=window.dashI18nBundles||{})["jp"]='
+                '{"topic2":{"示例警告描述":"サンプルアラート説明"}};'
+            )
+
+        path = translator.export_bundle('zh-cn', str(tmp_path))
+        with open(path, encoding='utf-8') as f:
+            assert json.load(f) == {'_default': {}, 'topic2': {}}
+
+        with pytest.raises(AssertionError):
+            translator.export_bundle('fr', str(tmp_path))
+        with pytest.raises(AssertionError):
+            translator.export_bundle('jp', str(tmp_path), topics=['topic3'])
+
+        function = translator.clientside_translate_function(
+            ['示例警告消息', '示例警告描述'],
+            bundle_urls={'en-us': '/assets/i18n/i18n.en-us.json'},
+        )
+        assert function.startswith('function (locale) {')
+        assert 'var contents = ["示例警告消息", "示例警告描述"];' in function
+        assert '{"en-us": "/assets/i18n/i18n.en-us.json"}' in function
+        assert 'dash\\-i18n=' in function
+
+    def test_usage_stats(self, tmp_path):
+        """测试文案使用情况统计"""
+        translator = Translator(
+            translations=[
+                './tests/i18n_utils/multi_locales/locales1.json',
+                './tests/i18n_utils/multi_locales/locales2.json',
+            ],
+            get_current_locale=self.get_current_locale,
+            force_check_content_translator=False,
+            usage_sample_rate=1,
+        )
+        translator.t('示例警告消息')
+        self.current_locale = 'en-us'
+        translator.t('示例警告消息')
+        translator.t('不存在的文案')
+        translator.t_many(['示例警告消息', '示例警告描述'])
+
+        assert translator.get_usage_stats() == {
+            '_default': {
+                '示例警告消息': {
+                    'hits': 3,
+                    'misses': 0,
+                    'locales': {'zh-cn': 1, 'en-us': 2},
+                },
+                '不存在的文案': {
+                    'hits': 0,
+                    'misses': 1,
+                    'locales': {'en-us': 1},
+                },
+                '示例警告描述': {
+                    'hits': 0,
+                    'misses': 1,
+                    'locales': {'en-us': 1},
+                },
+            }
+        }
+        assert translator.get_unused_contents() == {
+            '_default': [],
+            'topic2': ['示例警告描述'],
+        }
+
+        metrics = translator.export_usage_metrics()
+        assert '# TYPE dash_i18n_translations_total counter' in metrics
+        assert (
+            'dash_i18n_translations_total{topic="_default",content="示例警告消息",'
+            'locale="en-us",result="hit"} 2'
+        ) in metrics
+
+        translator.t('引号"与\\换行\n')
+        assert 'content="引号\\"与\\\\换行\\n"' in (
+            translator.export_usage_metrics()
+        )
+
+        translator.reset_usage_stats()
+        assert translator.get_usage_stats() == {}
+
+        # 采样时按采样比例换算估计次数，按固定顺序转换的各文案均应被采样
+        translation_file = tmp_path / 'locales.json'
+        translation_file.write_text(
+            json.dumps(
+                {
+                    'root_locale': 'zh-cn',
+                    'contents': {
+                        '文案%d' % i: {'en-us': 'label%d' % i}
+                        for i in range(10)
+                    },
+                },
+                ensure_ascii=False,
+            ),
+            encoding='utf-8',
+        )
+        translator = Translator(
+            translations=str(translation_file),
+            get_current_locale=self.get_current_locale,
+            usage_sample_rate=0.1,
+        )
+        for _ in range(1000):
+            for i in range(10):
+                translator.t('文案%d' % i)
+        usage_stats = translator.get_usage_stats()['_default']
+        assert len(usage_stats) == 10
+        for content_stats in usage_stats.values():
+            assert 500 <= content_stats['hits'] <= 1500
+            assert content_stats['misses'] == 0
+        assert translator.get_unused_contents() == {'_default': []}
+
+        # 基于二进制文案目录按需加载时同样遍历各主题
+        translator = Translator(
+            translations=[
+                './tests/i18n_utils/multi_locales/locales1.json',
+                './tests/i18n_utils/multi_locales/locales2.json',
+            ]
+        )
+        translator.export_catalog(str(tmp_path / 'locales.bin'))
+        translator = Translator(
+            translations=str(tmp_path / 'locales.bin'),
+            get_current_locale=self.get_current_locale,
+            lazy_load_topics=True,
+            usage_sample_rate=1,
+        )
+        translator.t('示例警告消息')
+        assert translator.get_unused_contents() == {
+            '_default': [],
+            'topic2': ['示例警告描述'],
+        }
+
+        # 未开启统计
+        translator = Translator(
+            translations='./tests/i18n_utils/locales.json',
+            get_current_locale=self.get_current_locale,
+        )
+        with pytest.raises(AssertionError):
+            translator.get_usage_stats()
+
+    def test_usage_stats_threads(self):
+        """测试多线程下的文案使用情况统计"""
+        translator = Translator(
+            translations='./tests/i18n_utils/locales.json',
+            get_current_locale=self.get_current_locale,
+            force_check_content_translator=False,
+            usage_sample_rate=1,
+            max_usage_keys=3,
+        )
+
+        # 大量短生命周期线程结束后，其计数并入汇总结果，不再保留各自的计数状态
+        def worker():
+            translator.t('示例警告消息')
+
+        for _ in range(200):
+            thread = threading.Thread(target=worker)
+            thread.start()
+            thread.join()
+        assert len(translator._usage._thread_states) <= 1
+        assert (
+            translator.get_usage_stats()['_default']['示例警告消息']['hits']
+            == 200
+        )
+        assert translator._usage._thread_states == []
+
+        # 已结束线程的汇总结果超出max_usage_keys后，新组合的调用次数计入溢出数量
+        for i in range(5):
+            thread = threading.Thread(
+                target=translator.t, args=('线程文案%d' % i,)
+            )
+            thread.start()
+            thread.join()
+        usage_stats = translator.get_usage_stats()['_default']
+        assert list(usage_stats) == ['示例警告消息', '线程文案0', '线程文案1']
+        assert translator.get_usage_stats_overflow() == 3
+
+        # 存活线程的计数同样受max_usage_keys限制
+        for i in range(5):
+            translator.t('当前线程文案%d' % i)
+        usage_stats = translator.get_usage_stats()['_default']
+        assert len(usage_stats) == 6
+        assert '当前线程文案3' not in usage_stats
+        assert translator.get_usage_stats_overflow() == 5
+
+        translator.reset_usage_stats()
+        assert translator.get_usage_stats() == {}
+        assert translator.get_usage_stats_overflow() == 0
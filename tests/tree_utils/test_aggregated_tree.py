@@ -0,0 +1,101 @@
+from feffery_dash_utils.tree_utils import AggregatedTree, TreeManager
+
+
+def count_nodes(node, child_values):
+    """统计子树节点数量"""
+    return 1 + sum(child_values)
+
+
+class TestAggregatedTree:
+    """树形数据统计值汇总测试类"""
+
+    def setup_method(self):
+        """测试前准备示例树形数据"""
+        self.demo_tree = [
+            {
+                'title': '节点1',
+                'key': '节点1',
+                'children': [
+                    {
+                        'title': '节点1-1',
+                        'key': '节点1-1',
+                        'children': [
+                            {
+                                'title': '节点1-1-1',
+                                'key': '节点1-1-1',
+                                'amount': 3,
+                            },
+                            {
+                                'title': '节点1-1-2',
+                                'key': '节点1-1-2',
+                                'amount': 4,
+                            },
+                        ],
+                    }
+                ],
+            },
+            {
+                'title': '节点2',
+                'key': '节点2',
+                'children': [
+                    {'title': '节点2-1', 'key': '节点2-1', 'amount': 5}
+                ],
+            },
+        ]
+
+    def test_aggregate(self):
+        """测试统计值计算功能"""
+        tree = AggregatedTree(self.demo_tree, count_nodes)
+        assert tree.get_aggregates() == {
+            '节点1': 4,
+            '节点1-1': 3,
+            '节点1-1-1': 1,
+            '节点1-1-2': 1,
+            '节点2': 2,
+            '节点2-1': 1,
+        }
+        assert tree.get_aggregate('节点1-666') is None
+
+        tree = AggregatedTree(
+            self.demo_tree,
+            lambda node, child_values: (
+                node.get('amount', 0) + sum(child_values)
+            ),
+            target_field='total',
+        )
+        assert tree.get_node('节点1')['total'] == 7
+        assert tree.to_tree_data()[1]['total'] == 5
+
+    def test_incremental_update(self):
+        """测试节点变动后的增量更新功能"""
+        tree = AggregatedTree(self.demo_tree, count_nodes)
+
+        tree.add_node_inside('节点1-1-1', {'title': 'a', 'key': 'a'})
+        assert tree.get_aggregate('节点1') == 5
+        tree.move_node('节点1-1', '节点2', 'inside')
+        assert tree.get_aggregate('节点1') == 1
+        assert tree.get_aggregate('节点2') == 6
+        tree.delete_node('a')
+        tree.update_tree_node(
+            '节点2-1', {'children': [{'title': 'b', 'key': 'b'}]}, 'overlay'
+        )
+        assert tree.get_aggregate('节点2') == 6
+
+        # 与重新计算的结果保持一致
+        assert (
+            tree.get_aggregates()
+            == AggregatedTree(tree.to_tree_data(), count_nodes).get_aggregates()
+        )
+
+    def test_apply_diff(self):
+        """测试基于TreeManager.diff()结果的增量更新"""
+        tree = AggregatedTree(self.demo_tree, count_nodes)
+        new_tree = TreeManager.add_node_after(
+            self.demo_tree, '节点2-1', {'title': '节点2-2', 'key': '节点2-2'}
+        )
+        new_tree = TreeManager.delete_node(new_tree, '节点1-1-2')
+
+        tree.apply(TreeManager.diff(self.demo_tree, new_tree))
+        assert tree.to_tree_data() == new_tree
+        assert tree.get_aggregate('节点1') == 3
+        assert tree.get_aggregate('节点2') == 3
@@ -0,0 +1,107 @@
+import json
+from feffery_dash_utils.tree_utils import CompactTree
+
+
+class TestCompactTree:
+    """精简树形数据存储测试类"""
+
+    def setup_method(self):
+        """测试前准备示例树形数据"""
+        self.demo_tree = [
+            {
+                'title': '节点1',
+                'key': '节点1',
+                'children': [
+                    {
+                        'title': '节点1-1',
+                        'key': '节点1-1',
+                        'disabled': True,
+                        'children': [
+                            {
+                                'title': '节点1-1-1',
+                                'key': '节点1-1-1',
+                            },
+                            {
+                                'title': '节点1-1-2',
+                                'key': '节点1-1-2',
+                            },
+                        ],
+                    }
+                ],
+            },
+            {
+                'title': '节点2',
+                'key': '节点2',
+                'children': [],
+            },
+        ]
+
+    def test_export(self):
+        """测试导出功能"""
+        compact_tree = CompactTree(self.demo_tree)
+        assert len(compact_tree) == 5
+        assert compact_tree.to_tree_data() == self.demo_tree
+        assert json.loads(''.join(compact_tree.iter_json())) == self.demo_tree
+
+        compact_tree = CompactTree(self.demo_tree[0])
+        assert compact_tree.to_tree_data() == self.demo_tree[0]
+        assert (
+            json.loads(''.join(compact_tree.iter_json())) == self.demo_tree[0]
+        )
+
+    def test_get_node(self):
+        """测试节点查询功能"""
+        compact_tree = CompactTree(self.demo_tree)
+        assert (
+            compact_tree.get_node('节点1-1')
+            == (self.demo_tree[0]['children'][0])
+        )
+        assert compact_tree.get_node('节点1-666') is None
+        assert '节点2' in compact_tree
+        assert compact_tree.get_node_path('节点1-1-2') == [
+            '节点1',
+            '节点1-1',
+            '节点1-1-2',
+        ]
+        assert compact_tree.get_child_keys() == ['节点1', '节点2']
+        assert compact_tree.get_child_keys('节点1-1') == [
+            '节点1-1-1',
+            '节点1-1-2',
+        ]
+        assert compact_tree.get_child_keys('节点2') == []
+
+    def test_menu(self):
+        """测试菜单数据"""
+        menu_items = [
+            {
+                'component': 'SubMenu',
+                'props': {
+                    'key': '子菜单1',
+                    'title': '子菜单1',
+                    'icon': 'antd-app',
+                },
+                'children': [
+                    {
+                        'component': 'Item',
+                        'props': {'key': '子菜单1-1', 'title': '子菜单1-1'},
+                    }
+                ],
+            }
+        ]
+        compact_tree = CompactTree(menu_items, 'menu')
+        assert compact_tree.to_tree_data() == menu_items
+        assert json.loads(''.join(compact_tree.iter_json())) == menu_items
+        assert (
+            compact_tree.get_node('子菜单1-1') == menu_items[0]['children'][0]
+        )
+
+        # 含其他字段或缺少component、props字段的菜单节点
+        menu_items = [
+            {'component': 'Item', 'props': {'key': 'a'}, 'extra': 1},
+            {'props': {'key': 'b', 'title': 'B'}},
+            {'component': 'Divider'},
+        ]
+        compact_tree = CompactTree(menu_items, 'menu')
+        assert compact_tree.to_tree_data() == menu_items
+        assert json.loads(''.join(compact_tree.iter_json())) == menu_items
+        assert compact_tree.get_child_keys() == ['a', 'b']
@@ -0,0 +1,108 @@
+import numpy as np
+from feffery_dash_utils.tree_utils import FlatTree, TreeManager
+
+
+class TestFlatTree:
+    """扁平列式树形数据测试类"""
+
+    def setup_method(self):
+        """测试前准备示例树形数据"""
+        self.demo_tree = [
+            {
+                'title': '节点1',
+                'key': '节点1',
+                'children': [
+                    {
+                        'title': '节点1-1',
+                        'key': '节点1-1',
+                        'children': [
+                            {
+                                'title': '节点1-1-1',
+                                'key': '节点1-1-1',
+                            },
+                            {
+                                'title': 'Node1-1-2',
+                                'key': '节点1-1-2',
+                            },
+                        ],
+                    }
+                ],
+            },
+            {
+                'title': '节点2',
+                'key': '节点2',
+                'children': [{'title': '节点2-1', 'key': '节点2-1'}],
+            },
+        ]
+
+    def test_columns(self):
+        """测试列式数据构建"""
+        flat_tree = FlatTree(self.demo_tree)
+        assert len(flat_tree) == 6
+        assert flat_tree.keys.tolist() == [
+            '节点1',
+            '节点1-1',
+            '节点1-1-1',
+            '节点1-1-2',
+            '节点2',
+            '节点2-1',
+        ]
+        assert flat_tree.parents.tolist() == [-1, 0, 1, 1, -1, 4]
+        assert flat_tree.depths.tolist() == [0, 1, 2, 2, 0, 1]
+        assert flat_tree.orders.tolist() == [0, 0, 0, 1, 1, 0]
+        assert flat_tree.subtree_ends.tolist() == [4, 4, 3, 4, 6, 6]
+        assert flat_tree.to_tree_data() == self.demo_tree
+
+    def test_filter(self):
+        """测试向量化筛选"""
+        flat_tree = FlatTree(self.demo_tree)
+        mask = flat_tree.match_titles('node')
+        assert flat_tree.keys_of(mask) == ['节点1-1-2']
+        assert not flat_tree.match_titles('node', case_sensitive=True).any()
+
+        mask = flat_tree.with_ancestors(mask)
+        assert flat_tree.keys_of(mask) == ['节点1', '节点1-1', '节点1-1-2']
+        assert flat_tree.to_tree_data(mask) == [
+            {
+                'title': '节点1',
+                'key': '节点1',
+                'children': [
+                    {
+                        'title': '节点1-1',
+                        'key': '节点1-1',
+                        'children': [
+                            {'title': 'Node1-1-2', 'key': '节点1-1-2'}
+                        ],
+                    }
+                ],
+            }
+        ]
+
+        mask = flat_tree.with_descendants(flat_tree.depths == 0)
+        assert mask.all()
+        mask = flat_tree.match_nodes(lambda node: node['key'].endswith('-1'))
+        assert flat_tree.keys_of(flat_tree.with_descendants(mask)) == [
+            '节点1-1',
+            '节点1-1-1',
+            '节点1-1-2',
+            '节点2-1',
+        ]
+
+    def test_subtree(self):
+        """测试子树提取"""
+        flat_tree = FlatTree(self.demo_tree)
+        mask = flat_tree.subtree_mask('节点1-1')
+        assert flat_tree.to_tree_data(mask) == [
+            TreeManager.get_node(self.demo_tree, '节点1-1')
+        ]
+        assert not flat_tree.subtree_mask('节点1-666').any()
+
+        # 父节点未被保留时挂载到最近的被保留祖先节点下
+        mask = np.array([True, False, True, False, False, False])
+        assert flat_tree.to_tree_data(mask) == [
+            {
+                'title': '节点1',
+                'key': '节点1',
+                'children': [{'title': '节点1-1-1', 'key': '节点1-1-1'}],
+            }
+        ]
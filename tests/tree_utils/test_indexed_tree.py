@@ -0,0 +1,282 @@
+import json
+import pytest
+from feffery_dash_utils.tree_utils import IndexedTree, TreeManager
+
+
+class TestIndexedTree:
+    """索引树形数据测试类"""
+
+    def setup_method(self):
+        """测试前准备示例树形数据"""
+        self.demo_tree = [
+            {
+                'title': '节点1',
+                'key': '节点1',
+                'children': [
+                    {
+                        'title': '节点1-1',
+                        'key': '节点1-1',
+                        'children': [
+                            {
+                                'title': '节点1-1-1',
+                                'key': '节点1-1-1',
+                            },
+                            {
+                                'title': '节点1-1-2',
+                                'key': '节点1-1-2',
+                            },
+                        ],
+                    }
+                ],
+            },
+            {
+                'title': '节点2',
+                'key': '节点2',
+                'children': [{'title': '节点2-1', 'key': '节点2-1'}],
+            },
+        ]
+
+    def test_get_node(self):
+        """测试节点查询功能"""
+        tree = IndexedTree(self.demo_tree)
+        assert len(tree) == 6
+        assert '节点1-1-2' in tree
+        assert tree.get_node('节点1-1-2')['title'] == '节点1-1-2'
+        assert tree.get_node('节点1-666') is None
+        assert [node['key'] for node in tree.get_node_path('节点1-1-2')] == [
+            '节点1',
+            '节点1-1',
+            '节点1-1-2',
+        ]
+        assert tree.get_node_path('节点1-666') is None
+
+        # 默认返回拷贝，修改返回结果不影响内部数据、索引及缓存
+        tree.to_json()
+        node = tree.get_node('节点1-1')
+        node['title'] = 'new'
+        node['key'] = 'new'
+        node_path = tree.get_node_path('节点1-1-2')
+        node_path[0]['title'] = 'new'
+        assert node_path[1] is node_path[0]['children'][0]
+        assert node_path[2] is node_path[1]['children'][1]
+        assert '节点1-1' in tree and 'new' not in tree
+        assert tree.get_node('节点1-1')['title'] == '节点1-1'
+        assert tree.to_json() == json.dumps(
+            self.demo_tree, ensure_ascii=False, separators=(',', ':')
+        )
+        assert (
+            tree.get_node('节点1-1', copy=False)
+            is tree.get_node_path('节点1-1-2', copy=False)[1]
+        )
+
+    def test_update_tree_node(self):
+        """测试节点整体替换与增量更新功能"""
+        tree = IndexedTree(self.demo_tree)
+        tree.update_tree_node('节点1-1', {'title': '节点1-1', 'key': '节点1-1'})
+        assert tree.to_tree_data() == TreeManager.update_tree_node(
+            self.demo_tree, '节点1-1', {'title': '节点1-1', 'key': '节点1-1'}
+        )
+        assert '节点1-1-1' not in tree
+
+        tree.update_tree_node('节点2', {'title': '节点2new'}, 'overlay')
+        assert tree.get_node('节点2')['title'] == '节点2new'
+        assert tree.get_node('节点2-1') is not None
+
+        # key值变化后索引同步更新
+        tree.update_tree_node('节点2', {'key': '节点3'}, 'overlay')
+        assert '节点2' not in tree
+        assert tree.get_node('节点3')['title'] == '节点2new'
+
+    def test_add_node(self):
+        """测试节点前置、后置新增功能"""
+        tree = IndexedTree(self.demo_tree)
+        tree.add_node_before(
+            '节点1-1-2', {'title': '节点1-1-0', 'key': '节点1-1-0'}
+        )
+        tree.add_node_after(
+            '节点1-1-1', {'title': '节点1-1-9', 'key': '节点1-1-9'}
+        )
+        tree.add_node_after('节点2', {'title': '节点3', 'key': '节点3'})
+        tree.add_node_inside('节点3', {'title': '节点3-1', 'key': '节点3-1'})
+        tree.add_node_inside(None, {'title': '节点4', 'key': '节点4'})
+
+        expected = TreeManager.add_node_before(
+            self.demo_tree,
+            '节点1-1-2',
+            {'title': '节点1-1-0', 'key': '节点1-1-0'},
+        )
+        expected = TreeManager.add_node_after(
+            expected, '节点1-1-1', {'title': '节点1-1-9', 'key': '节点1-1-9'}
+        )
+        expected = TreeManager.add_node_after(
+            expected,
+            '节点2',
+            {
+                'title': '节点3',
+                'key': '节点3',
+                'children': [{'title': '节点3-1', 'key': '节点3-1'}],
+            },
+        )
+        expected.append({'title': '节点4', 'key': '节点4'})
+        assert tree.to_tree_data() == expected
+
+        # 插入后兄弟节点位置索引同步更新
+        tree.delete_node('节点1-1-2')
+        assert [
+            node['key'] for node in tree.get_node('节点1-1')['children']
+        ] == ['节点1-1-1', '节点1-1-9', '节点1-1-0']
+
+    def test_delete_node(self):
+        """测试节点删除功能"""
+        tree = IndexedTree(self.demo_tree)
+        tree.delete_node('节点2-1')
+        assert tree.to_tree_data() == TreeManager.delete_node(
+            self.demo_tree, '节点2-1'
+        )
+
+        tree = IndexedTree(self.demo_tree)
+        tree.delete_node('节点2-1', keep_empty_children_node=False)
+        assert tree.to_tree_data() == TreeManager.delete_node(
+            self.demo_tree, '节点2-1', keep_empty_children_node=False
+        )
+        assert '节点2' not in tree
+
+    def test_menu_data(self):
+        """测试菜单数据"""
+        menu_items = [
+            {
+                'component': 'SubMenu',
+                'props': {'key': '子菜单1', 'title': '子菜单1'},
+                'children': [
+                    {
+                        'component': 'Item',
+                        'props': {'key': '子菜单1-1', 'title': '子菜单1-1'},
+                    }
+                ],
+            },
+            {'component': 'Divider'},
+        ]
+        tree = IndexedTree(menu_items, data_type='menu')
+        assert len(tree) == 2
+        tree.delete_node('子菜单1-1')
+        assert tree.to_tree_data() == TreeManager.delete_node(
+            menu_items, '子菜单1-1', data_type='menu'
+        )
+
+    def test_input_not_mutated(self):
+        """测试原始数据不受影响"""
+        tree = IndexedTree(self.demo_tree[0])
+        tree.update_tree_node('节点1-1', {'title': 'new'}, 'overlay')
+        assert self.demo_tree[0]['children'][0]['title'] == '节点1-1'
+        assert isinstance(tree.to_tree_data(), dict)
+
+    def test_move_node(self):
+        """测试节点移动功能"""
+        tree = IndexedTree(self.demo_tree)
+        tree.move_node('节点1-1-2', '节点1-1', 'before')
+        tree.move_node('节点2-1', '节点1-1-1', 'inside')
+        assert [node['key'] for node in tree.get_node('节点1')['children']] == [
+            '节点1-1-2',
+            '节点1-1',
+        ]
+        assert tree.get_node('节点1-1-1')['children'] == [
+            {'title': '节点2-1', 'key': '节点2-1'}
+        ]
+        assert tree.get_node('节点2')['children'] == []
+
+        # 移动后的节点仍可继续被定位
+        tree.move_node('节点2-1', '节点2', 'after')
+        assert [node['key'] for node in tree.to_tree_data()] == [
+            '节点1',
+            '节点2',
+            '节点2-1',
+        ]
+
+        # 不允许移动到自身子树中
+        with pytest.raises(AssertionError):
+            tree.move_node('节点1', '节点1-1-1', 'inside')
+
+    def test_to_json(self):
+        """测试JSON导出及子树序列化缓存功能"""
+        tree = IndexedTree(self.demo_tree)
+        assert json.loads(tree.to_json()) == self.demo_tree
+
+        # 变动节点的祖先节点缓存失效，其余子树缓存保留
+        tree.update_tree_node('节点1-1-1', {'title': 'new'}, 'overlay')
+        assert id(tree.get_node('节点1', copy=False)) not in tree._json_cache
+        assert id(tree.get_node('节点1-1', copy=False)) not in tree._json_cache
+        assert id(tree.get_node('节点2', copy=False)) in tree._json_cache
+        assert json.loads(tree.to_json()) == tree.to_tree_data()
+
+        tree.move_node('节点2-1', '节点1-1-2', 'inside')
+        tree.add_node_before('节点1', {'title': '节点0', 'key': '节点0'})
+        tree.delete_node('节点1-1-1')
+        tree.update_tree_node('节点2', {'key': '节点2', 'children': []})
+        assert json.loads(tree.to_json()) == tree.to_tree_data()
+
+        tree = IndexedTree(self.demo_tree[0])
+        assert json.loads(tree.to_json()) == self.demo_tree[0]
+        tree.delete_node('节点1')
+        assert tree.to_json() == 'null'
+
+    def test_duplicate_key(self):
+        """测试新节点key值重复时树形数据及索引保持不变"""
+        tree = IndexedTree(self.demo_tree)
+        expected_json = tree.to_json()
+
+        for operation in [
+            lambda: tree.update_tree_node('节点1', {'key': '节点2'}),
+            lambda: tree.update_tree_node(
+                '节点1-1', {'key': '节点2-1'}, 'overlay'
+            ),
+            lambda: tree.update_tree_node(
+                '节点2',
+                {'children': [{'key': 'new'}, {'key': 'new'}]},
+                'overlay',
+            ),
+            lambda: tree.update_tree_node(
+                '节点1-1', {'key': 'new', 'children': [{'key': '节点1'}]}
+            ),
+            lambda: tree.add_node_before(
+                '节点1', {'key': 'new', 'children': [{'key': '节点1-1-2'}]}
+            ),
+            lambda: tree.add_node_after('节点2', {'key': '节点2-1'}),
+            lambda: tree.add_node_inside('节点2', {'key': '节点1'}),
+        ]:
+            with pytest.raises(AssertionError):
+                operation()
+            assert tree.to_json() == expected_json
+            assert tree.to_tree_data() == self.demo_tree
+            assert sorted(tree._nodes) == sorted(
+                [
+                    '节点1',
+                    '节点1-1',
+                    '节点1-1-1',
+                    '节点1-1-2',
+                    '节点2',
+                    '节点2-1',
+                ]
+            )
+            assert 'new' not in tree
+
+        # 被替换子树中的key值可被复用
+        tree.update_tree_node(
+            '节点1', {'key': '节点1', 'children': [{'key': '节点1-1-1'}]}
+        )
+        tree.update_tree_node(
+            '节点2',
+            {'key': '节点2-1', 'children': [{'key': '节点2'}]},
+            'overlay',
+        )
+        assert json.loads(tree.to_json()) == [
+            {'key': '节点1', 'children': [{'key': '节点1-1-1'}]},
+            {
+                'title': '节点2',
+                'key': '节点2-1',
+                'children': [{'key': '节点2'}],
+            },
+        ]
+        assert (
+            tree.get_node('节点2', copy=False)
+            is tree.to_tree_data(copy=False)[1]['children'][0]
+        )
@@ -0,0 +1,186 @@
+import pytest
+from feffery_dash_utils.tree_utils import LazyTreeSource, TreeManager
+
+
+@pytest.fixture(params=['memory', 'sqlite'])
+def database(request, tmp_path):
+    """分别以内存索引及SQLite数据库文件作为存储后端"""
+    if request.param == 'memory':
+        return None
+    return str(tmp_path / 'tree.db')
+
+
+class TestLazyTreeSource:
+    """树形数据源测试类"""
+
+    def setup_method(self):
+        """测试前准备示例树形数据"""
+        self.demo_tree = [
+            {
+                'title': '节点1',
+                'key': '节点1',
+                'children': [
+                    {
+                        'title': '节点1-1',
+                        'key': '节点1-1',
+                        'children': [
+                            {
+                                'title': '节点1-1-1',
+                                'key': '节点1-1-1',
+                            },
+                            {
+                                'title': '节点1-1-2',
+                                'key': '节点1-1-2',
+                            },
+                        ],
+                    }
+                ],
+            },
+            {
+                'title': '节点2',
+                'key': '节点2',
+                'children': [{'title': '节点2-1', 'key': '节点2-1'}],
+            },
+        ]
+
+    def test_get_children(self, database):
+        """测试分页查询子节点功能"""
+        source = LazyTreeSource(self.demo_tree, database=database)
+        assert len(source) == 6
+        assert source.to_tree_data() == self.demo_tree
+
+        page = source.get_children()
+        assert page == {
+            'nodes': [
+                {'title': '节点1', 'key': '节点1', 'isLeaf': False},
+                {'title': '节点2', 'key': '节点2', 'isLeaf': False},
+            ],
+            'next_cursor': None,
+        }
+
+        page = source.get_children('节点1-1', page_size=1)
+        assert [node['key'] for node in page['nodes']] == ['节点1-1-1']
+        assert page['nodes'][0]['isLeaf']
+        page = source.get_children(
+            '节点1-1', page_size=1, cursor=page['next_cursor']
+        )
+        assert [node['key'] for node in page['nodes']] == ['节点1-1-2']
+        assert page['next_cursor'] is None
+
+        assert source.get_node('节点2-1') == {
+            'title': '节点2-1',
+            'key': '节点2-1',
+            'isLeaf': True,
+        }
+        assert source.get_node('节点1-666') is None
+
+    def test_operations(self, database):
+        """测试节点增删改功能，结果与TreeManager保持一致"""
+        source = LazyTreeSource(self.demo_tree, database=database)
+        expected_tree = self.demo_tree
+
+        source.update_tree_node('节点1-1-1', {'title': 'new', 'key': 'new'})
+        expected_tree = TreeManager.update_tree_node(
+            expected_tree, '节点1-1-1', {'title': 'new', 'key': 'new'}
+        )
+        source.update_tree_node('节点2', {'title': '节点2new'}, 'overlay')
+        expected_tree = TreeManager.update_tree_node(
+            expected_tree, '节点2', {'title': '节点2new'}, 'overlay'
+        )
+        source.add_node_before('节点1-1-2', {'title': 'a', 'key': 'a'})
+        expected_tree = TreeManager.add_node_before(
+            expected_tree, '节点1-1-2', {'title': 'a', 'key': 'a'}
+        )
+        source.add_node_after(
+            '节点1',
+            {'title': 'b', 'key': 'b', 'children': [{'key': 'b-1'}]},
+        )
+        expected_tree = TreeManager.add_node_after(
+            expected_tree,
+            '节点1',
+            {'title': 'b', 'key': 'b', 'children': [{'key': 'b-1'}]},
+        )
+        assert source.to_tree_data() == expected_tree
+
+        source.delete_node('节点1-1')
+        expected_tree = TreeManager.delete_node(expected_tree, '节点1-1')
+        source.delete_node('b-1', keep_empty_children_node=False)
+        expected_tree = TreeManager.delete_node(
+            expected_tree, 'b-1', keep_empty_children_node=False
+        )
+        assert source.to_tree_data() == expected_tree
+        assert len(source) == 3
+
+        source.add_node_inside('节点2-1', {'title': 'c', 'key': 'c'})
+        source.add_node_inside(None, {'title': 'd', 'key': 'd'})
+        assert source.to_tree_data('节点2-1') == {
+            'title': '节点2-1',
+            'key': '节点2-1',
+            'children': [{'title': 'c', 'key': 'c'}],
+        }
+        assert source.get_children()['nodes'][-1]['key'] == 'd'
+
+        with pytest.raises(AssertionError):
+            source.add_node_inside('节点2', {'title': 'c', 'key': 'c'})
+
+    def test_update_tree_node_duplicate_key(self, database):
+        """测试整体替换节点时新子树key值重复的处理"""
+        source = LazyTreeSource(self.demo_tree, database=database)
+
+        # 新子树与其他节点key值重复时，原节点及其子树保持不变
+        with pytest.raises(AssertionError):
+            source.update_tree_node(
+                '节点1',
+                {
+                    'title': 'new',
+                    'key': 'new',
+                    'children': [{'title': '节点2-1', 'key': '节点2-1'}],
+                },
+            )
+        assert source.to_tree_data() == self.demo_tree
+        assert len(source) == 6
+
+        # 新子树可复用被替换子树中的key值
+        source.update_tree_node(
+            '节点1',
+            {
+                'title': '节点1new',
+                'key': '节点1',
+                'children': [{'title': '节点1-1-1', 'key': '节点1-1-1'}],
+            },
+        )
+        assert source.to_tree_data()[0] == {
+            'title': '节点1new',
+            'key': '节点1',
+            'children': [{'title': '节点1-1-1', 'key': '节点1-1-1'}],
+        }
+        assert '节点1-1' not in source
+        assert len(source) == 4
+
+    def test_reopen(self, tmp_path):
+        """测试重新打开已有的SQLite数据库文件"""
+        database = str(tmp_path / 'tree.db')
+        LazyTreeSource(self.demo_tree, database=database)
+        assert LazyTreeSource(database=database).to_tree_data() == (
+            self.demo_tree
+        )
+
+    def test_menu(self, database):
+        """测试菜单数据"""
+        menu_items = [
+            {
+                'component': 'SubMenu',
+                'props': {'key': '子菜单1', 'title': '子菜单1'},
+                'children': [
+                    {
+                        'component': 'Item',
+                        'props': {'key': '子菜单1-1', 'title': '子菜单1-1'},
+                    }
+                ],
+            }
+        ]
+        source = LazyTreeSource(menu_items, 'menu', database=database)
+        assert source.get_children('子菜单1')['nodes'] == [
+            menu_items[0]['children'][0]
+        ]
+        assert source.to_tree_data() == menu_items
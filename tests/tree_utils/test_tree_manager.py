@@ -1,6 +1,31 @@
+import pytest
+import numpy as np
+from copy import deepcopy
 from feffery_dash_utils.tree_utils import TreeManager
 
 
+def apply_patch(data, patch):
+    """在Python端模拟前端对Patch对象的应用过程，返回应用后的新数据"""
+    data = deepcopy(data)
+    for operation in patch.to_plotly_json()['operations']:
+        *parent_location, last = operation['location'] or [None]
+        target = data
+        for location in parent_location:
+            target = target[location]
+        params = operation['params']
+        if operation['operation'] == 'Assign':
+            target[last] = params['value']
+        elif operation['operation'] == 'Delete':
+            del target[last]
+        elif operation['operation'] == 'Insert':
+            target = target[last] if last is not None else target
+            target.insert(params['index'], params['value'])
+        elif operation['operation'] == 'Merge':
+            target = target[last] if last is not None else target
+            target.update(params['value'])
+    return data
+
+
 class TestTreeManager:
     """树形数据管理器测试类"""
 
@@ -154,3 +179,458 @@ class TestTreeManager:
         parent_node = TreeManager.get_node(result2, '节点2')
         # 在这种情况下，父节点应该被删除
         assert parent_node is None
+
+    def test_path_copy_strategy(self):
+        """测试路径拷贝策略"""
+        new_node = {'title': '节点1-1-1new', 'key': '节点1-1-1'}
+        for method, args in [
+            (TreeManager.update_tree_node, ('节点1-1-1', new_node)),
+            (TreeManager.add_node_before, ('节点1-1-2', new_node)),
+            (TreeManager.add_node_after, ('节点2-1', new_node)),
+            (TreeManager.delete_node, ('节点1-1-1',)),
+        ]:
+            # 与深拷贝策略的结果保持一致
+            result = method(self.demo_tree, *args, copy_strategy='path')
+            assert result == method(self.demo_tree, *args)
+
+        result = TreeManager.delete_node(
+            self.demo_tree,
+            '节点2-1',
+            keep_empty_children_node=False,
+            copy_strategy='path',
+        )
+        assert result == TreeManager.delete_node(
+            self.demo_tree, '节点2-1', keep_empty_children_node=False
+        )
+
+        result = TreeManager.update_tree_node(
+            self.demo_tree, '节点1-1-1', new_node, copy_strategy='path'
+        )
+        # 原始数据不受影响
+        assert self.demo_tree[0]['children'][0]['children'][0]['title'] == (
+            '节点1-1-1'
+        )
+        # 路径上的节点被拷贝，未变更的子树与原始数据共享
+        assert result[0] is not self.demo_tree[0]
+        assert (
+            result[0]['children'][0]['children'][1]
+            is (self.demo_tree[0]['children'][0]['children'][1])
+        )
+        assert result[1] is self.demo_tree[1]
+
+    def test_apply(self):
+        """测试批量操作功能"""
+        result = TreeManager.apply(
+            self.demo_tree,
+            [
+                {
+                    'type': 'update_tree_node',
+                    'node_key': '节点1-1',
+                    'new_node': {'title': '节点1-1new'},
+                    'mode': 'overlay',
+                },
+                {
+                    'type': 'add_node_before',
+                    'node_key': '节点1-1-1',
+                    'new_node': {'title': '节点1-1-0', 'key': '节点1-1-0'},
+                },
+                {
+                    'type': 'add_node_after',
+                    'node_key': '节点2',
+                    'new_node': {'title': '节点3', 'key': '节点3'},
+                },
+                {'type': 'delete_node', 'node_key': '节点1-1-2'},
+                {
+                    'type': 'move_node',
+                    'node_key': '节点2-1',
+                    'target_key': '节点3',
+                    'position': 'inside',
+                },
+            ],
+        )
+
+        expected = TreeManager.update_tree_node(
+            self.demo_tree, '节点1-1', {'title': '节点1-1new'}, 'overlay'
+        )
+        expected = TreeManager.add_node_before(
+            expected, '节点1-1-1', {'title': '节点1-1-0', 'key': '节点1-1-0'}
+        )
+        expected = TreeManager.add_node_after(
+            expected,
+            '节点2',
+            {
+                'title': '节点3',
+                'key': '节点3',
+                'children': [{'title': '节点2-1', 'key': '节点2-1'}],
+            },
+        )
+        expected = TreeManager.delete_node(expected, '节点1-1-2')
+        expected = TreeManager.update_tree_node(
+            expected, '节点2', {'children': []}, 'overlay'
+        )
+        assert result == expected
+        # 原始数据不受影响
+        assert TreeManager.get_node(self.demo_tree, '节点1-1-2') is not None
+
+    def test_patch(self):
+        """测试生成Patch对象功能"""
+        new_node = {'title': '节点1-1-1new', 'key': '节点1-1-1'}
+        for method, patch_method, args in [
+            (
+                TreeManager.update_tree_node,
+                TreeManager.update_tree_node_patch,
+                ('节点1-1-1', new_node),
+            ),
+            (
+                TreeManager.update_tree_node,
+                TreeManager.update_tree_node_patch,
+                ('节点1-1-1', {'title': '节点1-1-1new'}, 'overlay'),
+            ),
+            (
+                TreeManager.add_node_before,
+                TreeManager.add_node_before_patch,
+                ('节点1-1-2', new_node),
+            ),
+            (
+                TreeManager.add_node_after,
+                TreeManager.add_node_after_patch,
+                ('节点2', new_node),
+            ),
+            (
+                TreeManager.delete_node,
+                TreeManager.delete_node_patch,
+                ('节点1-1-1',),
+            ),
+        ]:
+            patch = patch_method(self.demo_tree, *args)
+            assert apply_patch(self.demo_tree, patch) == method(
+                self.demo_tree, *args
+            )
+
+        # 子节点被全部删除时连带删除父节点
+        patch = TreeManager.delete_node_patch(
+            self.demo_tree, '节点2-1', keep_empty_children_node=False
+        )
+        assert apply_patch(self.demo_tree, patch) == TreeManager.delete_node(
+            self.demo_tree, '节点2-1', keep_empty_children_node=False
+        )
+        assert len(patch.to_plotly_json()['operations']) == 1
+
+        # 单个根节点字典整体替换
+        patch = TreeManager.update_tree_node_patch(
+            self.demo_tree[1], '节点2', {'title': '节点3', 'key': '节点3'}
+        )
+        assert apply_patch(self.demo_tree[1], patch) == {
+            'title': '节点3',
+            'key': '节点3',
+        }
+
+    def test_deep_tree(self):
+        """测试超出默认递归深度限制的深层树形数据"""
+        depth = 5000
+        deep_tree = [{'title': '0', 'key': '0'}]
+        node = deep_tree[0]
+        for level in range(1, depth):
+            node['children'] = [{'title': str(level), 'key': str(level)}]
+            node = node['children'][0]
+        deepest_key = str(depth - 1)
+
+        assert TreeManager.get_node(deep_tree, deepest_key) is node
+        for copy_strategy in ['deepcopy', 'path']:
+            result = TreeManager.update_tree_node(
+                deep_tree,
+                deepest_key,
+                {'title': 'new'},
+                'overlay',
+                copy_strategy=copy_strategy,
+            )
+            assert TreeManager.get_node(result, deepest_key)['title'] == 'new'
+            result = TreeManager.delete_node(
+                deep_tree,
+                deepest_key,
+                keep_empty_children_node=False,
+                copy_strategy=copy_strategy,
+            )
+            assert result == []
+        assert node['title'] == deepest_key
+
+    def test_get_nodes(self):
+        """测试批量节点查询功能"""
+        nodes = TreeManager.get_nodes(
+            self.demo_tree, ['节点2-1', '节点1-1-2', '节点1-666']
+        )
+        assert list(nodes) == ['节点2-1', '节点1-1-2', '节点1-666']
+        assert nodes['节点2-1']['title'] == '节点2-1'
+        assert nodes['节点1-1-2']['title'] == '节点1-1-2'
+        assert nodes['节点1-666'] is None
+
+    def test_get_node_path(self):
+        """测试节点祖先链查询功能"""
+        node_path = TreeManager.get_node_path(self.demo_tree, '节点1-1-2')
+        assert [node['key'] for node in node_path] == [
+            '节点1',
+            '节点1-1',
+            '节点1-1-2',
+        ]
+        assert (
+            TreeManager.get_node_path(self.demo_tree, '节点2')[0]
+            is (self.demo_tree[1])
+        )
+        assert TreeManager.get_node_path(self.demo_tree, '节点1-666') is None
+
+        # 菜单数据
+        menu_items = [
+            {
+                'component': 'SubMenu',
+                'props': {'key': '子菜单1', 'title': '子菜单1'},
+                'children': [
+                    {
+                        'component': 'Item',
+                        'props': {'key': '子菜单1-1', 'title': '子菜单1-1'},
+                    }
+                ],
+            }
+        ]
+        node_path = TreeManager.get_node_path(
+            menu_items, '子菜单1-1', data_type='menu'
+        )
+        assert [node['props']['key'] for node in node_path] == [
+            '子菜单1',
+            '子菜单1-1',
+        ]
+        assert TreeManager.get_nodes(menu_items, ['子菜单1'], 'menu') == {
+            '子菜单1': menu_items[0]
+        }
+
+    def test_move_node(self):
+        """测试节点移动功能"""
+        result = TreeManager.move_node(
+            self.demo_tree, '节点1-1-2', '节点2-1', 'before'
+        )
+        assert [
+            node['key']
+            for node in TreeManager.get_node(result, '节点2')['children']
+        ] == ['节点1-1-2', '节点2-1']
+        assert len(TreeManager.get_node(result, '节点1-1')['children']) == 1
+
+        result = TreeManager.move_node(
+            self.demo_tree,
+            '节点2',
+            '节点1-1-1',
+            'inside',
+            copy_strategy='path',
+        )
+        assert [node['key'] for node in result] == ['节点1']
+        assert (
+            TreeManager.get_node(result, '节点1-1-1')['children'][0]
+            is (self.demo_tree[1])
+        )
+        # 原始数据不受影响
+        assert len(self.demo_tree) == 2
+
+        # 不允许移动到自身子树中
+        with pytest.raises(AssertionError):
+            TreeManager.move_node(self.demo_tree, '节点1', '节点1-1', 'after')
+
+    def test_diff(self):
+        """测试树形数据差异计算及应用功能"""
+        new_tree = TreeManager.move_node(
+            self.demo_tree, '节点1-1-2', '节点1-1-1', 'before'
+        )
+        new_tree = TreeManager.update_tree_node(
+            new_tree, '节点2-1', {'title': '节点2-1new'}, 'overlay'
+        )
+        new_tree = TreeManager.add_node_after(
+            new_tree,
+            '节点2',
+            {
+                'title': '节点3',
+                'key': '节点3',
+                'children': [{'title': '节点3-1', 'key': '节点3-1'}],
+            },
+        )
+        new_tree = TreeManager.delete_node(new_tree, '节点1-1-1')
+
+        ops = TreeManager.diff(self.demo_tree, new_tree)
+        assert sorted(op['type'] for op in ops) == [
+            'add_node_after',
+            'delete_node',
+            'update_tree_node',
+        ]
+        assert TreeManager.apply_diff(self.demo_tree, ops) == new_tree
+
+        # 平级节点交换顺序仅需一次移动
+        new_tree = TreeManager.move_node(
+            self.demo_tree, '节点2', '节点1', 'before'
+        )
+        ops = TreeManager.diff(self.demo_tree, new_tree)
+        assert len(ops) == 1 and ops[0]['type'] == 'move_node'
+        assert TreeManager.apply_diff(self.demo_tree, ops) == new_tree
+
+        # 节点在不同层级间移动
+        new_tree = TreeManager.move_node(
+            self.demo_tree, '节点1-1', '节点2-1', 'inside'
+        )
+        ops = TreeManager.diff(self.demo_tree, new_tree)
+        assert TreeManager.apply_diff(self.demo_tree, ops) == new_tree
+
+        assert TreeManager.diff(self.demo_tree, self.demo_tree) == []
+
+    def test_filter(self):
+        """测试节点筛选功能"""
+        filtered_tree, expanded_keys = TreeManager.filter(
+            self.demo_tree, '1-1-2'
+        )
+        assert filtered_tree == [
+            {
+                'title': '节点1',
+                'key': '节点1',
+                'children': [
+                    {
+                        'title': '节点1-1',
+                        'key': '节点1-1',
+                        'children': [
+                            {'title': '节点1-1-2', 'key': '节点1-1-2'}
+                        ],
+                    }
+                ],
+            }
+        ]
+        assert expanded_keys == ['节点1', '节点1-1']
+
+        # 保留命中节点的后代节点
+        filtered_tree, expanded_keys = TreeManager.filter(
+            self.demo_tree,
+            lambda node: node['key'] == '节点1-1',
+            keep_ancestors=False,
+            keep_descendants=True,
+        )
+        assert filtered_tree == [
+            TreeManager.get_node(self.demo_tree, '节点1-1')
+        ]
+        assert expanded_keys == ['节点1']
+
+        # 无命中节点
+        assert TreeManager.filter(self.demo_tree, '节点666') == ([], [])
+
+        # 开启缓存时复用同一treeData对象的扁平列式结构，原地修改后需临时关闭缓存
+        assert TreeManager.filter(self.demo_tree, '节点2', use_cache=True)[0]
+        self.demo_tree[1]['title'] = '节点666'
+        assert TreeManager.filter(
+            self.demo_tree, '节点666', use_cache=True
+        ) == (
+            [],
+            [],
+        )
+        filtered_tree, _ = TreeManager.filter(
+            self.demo_tree, '节点666', use_cache=False
+        )
+        assert [node['key'] for node in filtered_tree] == ['节点2']
+        # 默认不使用缓存
+        filtered_tree, _ = TreeManager.filter(self.demo_tree, '节点666')
+        assert [node['key'] for node in filtered_tree] == ['节点2']
+
+    def test_from_flat(self):
+        """测试扁平行数据与treeData互相转换功能"""
+        rows = TreeManager.to_flat(self.demo_tree)
+        assert rows[:2] == [
+            {'id': '节点1', 'parent_id': None, 'title': '节点1'},
+            {'id': '节点1-1', 'parent_id': '节点1', 'title': '节点1-1'},
+        ]
+        assert TreeManager.from_flat(rows) == self.demo_tree
+        assert TreeManager.from_flat(iter(rows[::-1])) != self.demo_tree
+
+        # 按排序字段还原平级节点顺序
+        rows = TreeManager.to_flat(self.demo_tree, order='sort')
+        assert TreeManager.from_flat(rows[::-1], order='sort') == self.demo_tree
+
+        # numpy结构化数组
+        rows = np.array(
+            [
+                (1, 0, '节点1', 2.0),
+                (2, 1, '节点1-1', 1.0),
+                (3, 1, '节点1-2', 0.0),
+            ],
+            dtype=[
+                ('id', 'i8'),
+                ('parent_id', 'i8'),
+                ('title', 'U8'),
+                ('sort', 'f8'),
+            ],
+        )
+        assert TreeManager.from_flat(rows, order='sort', root_parent=0) == [
+            {
+                'key': 1,
+                'title': '节点1',
+                'children': [
+                    {'key': 3, 'title': '节点1-2'},
+                    {'key': 2, 'title': '节点1-1'},
+                ],
+            }
+        ]
+
+        # 菜单数据
+        menu_items = TreeManager.from_flat(
+            [
+                {
+                    'id': 'a',
+                    'parent_id': None,
+                    'title': 'A',
+                    'icon': 'antd-app',
+                },
+                {'id': 'a-1', 'parent_id': 'a', 'title': 'A-1'},
+            ],
+            data_type='menu',
+        )
+        assert menu_items == [
+            {
+                'component': 'SubMenu',
+                'props': {'key': 'a', 'title': 'A', 'icon': 'antd-app'},
+                'children': [
+                    {
+                        'component': 'Item',
+                        'props': {'key': 'a-1', 'title': 'A-1'},
+                    }
+                ],
+            }
+        ]
+        assert (
+            TreeManager.from_flat(
+                TreeManager.to_flat(menu_items, data_type='menu'),
+                data_type='menu',
+            )
+            == menu_items
+        )
+
+        # 孤儿节点及循环引用
+        rows = [
+            {'id': 'a', 'parent_id': None},
+            {'id': 'b', 'parent_id': 'x'},
+            {'id': 'c', 'parent_id': 'b'},
+        ]
+        with pytest.raises(AssertionError):
+            TreeManager.from_flat(rows)
+        assert TreeManager.from_flat(rows, orphans='root') == [
+            {'key': 'a'},
+            {'key': 'b', 'children': [{'key': 'c'}]},
+        ]
+        assert TreeManager.from_flat(rows, orphans='drop') == [{'key': 'a'}]
+        with pytest.raises(AssertionError):
+            TreeManager.from_flat(
+                [
+                    {'id': 'a', 'parent_id': None},
+                    {'id': 'b', 'parent_id': 'c'},
+                    {'id': 'c', 'parent_id': 'b'},
+                ]
+            )
+
+        # 节点字段与结构字段同名时不静默覆盖
+        tree = [{'key': 'a', 'title': 'A', 'sort': 9, 'children': []}]
+        with pytest.raises(AssertionError):
+            TreeManager.to_flat(tree, order='sort')
+        with pytest.raises(AssertionError):
+            TreeManager.to_flat([{'key': 'a', 'parent_id': 'x'}])
+        # 未以字段名排序时同名字段保留在节点中，叶子节点显式的空children列表不保留
+        assert TreeManager.from_flat(TreeManager.to_flat(tree)) == [
+            {'key': 'a', 'title': 'A', 'sort': 9}
+        ]